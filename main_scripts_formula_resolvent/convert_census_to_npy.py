@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+"""
+Convert a text census directory (one "<label>.txt" file of polynomial
+strings per Galois group) into the binary census format: one int8/int16
+coefficient matrix "<label>.npy" per group plus census.json.
+
+    python3 convert_census_to_npy.py galois_deg4_range25
+    python3 convert_census_to_npy.py galois_deg4_range25 galois_deg4_range25_npy
+
+Linked base censuses are flattened into the output, and sidecar files
+(fields.tsv) are copied. Group files are named after the short PARI
+label of their transitive group id (functions_group_ids). Degree and
+range are taken from the directory name (galois_deg<d>_range<n>...) or,
+failing that, from the data.
+"""
+
+import os
+import re
+import sys
+import shutil
+import argparse
+
+from functions_census import (
+    census_group_names, census_chain, open_census_group, GroupFileWriter, SIDECAR_NAMES,
+    height, write_census_header,
+)
+from functions_group_ids import canonical_file_label
+
+ROWS_PER_WRITE = 1 << 16
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Convert a text census into .npy group files.")
+    parser.add_argument("folder", help="census directory with <label>.txt group files")
+    parser.add_argument("output", nargs="?", default=None,
+                        help="output directory (default: <folder>_npy)")
+    parser.add_argument("--deg", type=int, default=None, help="polynomial degree")
+    parser.add_argument("--n", type=int, default=None, help="coefficient range [-n..n]")
+    return parser.parse_args(sys.argv[1:])
+
+def census_dimensions(folder, names):
+    """(deg, n) from the directory name, else from a pass over the data."""
+    match = re.match(r"galois_deg(\d+)_range(\d+)", os.path.basename(os.path.normpath(folder)))
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    deg, n = None, 0
+    for name in names:
+        with open_census_group(folder, name) as reader:
+            for coeffs in reader.rows():
+                deg = len(coeffs)
+                n = max(n, height(coeffs))
+    return deg, n
+
+def files_size(directory, suffix):
+    """Total size of the files of a directory with the given suffix."""
+    return sum(os.path.getsize(os.path.join(directory, f))
+               for f in os.listdir(directory) if f.endswith(suffix))
+
+def main():
+    args = parse_arguments()
+    folder = args.folder
+    output_dir = args.output or os.path.normpath(folder) + "_npy"
+    names = [name for name in census_group_names(folder) if name.endswith(".txt")]
+    if not names:
+        sys.exit(f"No text group files in '{folder}'.")
+
+    deg, n = census_dimensions(folder, names)
+    deg, n = args.deg or deg, args.n if args.n is not None else n
+    os.makedirs(output_dir, exist_ok=True)
+    if any(f.endswith(".npy") for f in os.listdir(output_dir)):
+        sys.exit(f"'{output_dir}' already holds .npy group files.")
+
+    with GroupFileWriter(output_dir, format="npy", deg=deg, n=n) as writer:
+        for name in names:
+            # Full and short PARI labels of a group go to one canonical file
+            label = canonical_file_label(os.path.splitext(name)[0], deg)
+            rows = []
+            with open_census_group(folder, name) as reader:
+                for coeffs in reader.rows():
+                    rows.append(coeffs)
+                    if len(rows) >= ROWS_PER_WRITE:
+                        writer.write(label, rows)
+                        rows = []
+            writer.write(label, rows)
+            print(f"{name} -> {label}.npy")
+
+    # Sidecars, innermost base first like the group files
+    for sidecar in SIDECAR_NAMES:
+        for d in reversed(census_chain(folder)):
+            path = os.path.join(d, sidecar)
+            if os.path.exists(path):
+                with open(path, 'rb') as src, open(os.path.join(output_dir, sidecar), 'ab') as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+    write_census_header(output_dir, deg, n)
+
+    text_bytes = sum(files_size(d, ".txt") for d in census_chain(folder))
+    binary_bytes = files_size(output_dir, ".npy")
+    print(f"Wrote '{output_dir}': {text_bytes} bytes of text -> {binary_bytes} bytes of .npy.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+
+"""
+Live throughput metrics of a census run.
+
+Every worker owns a slot of a shared array of doubles (a
+multiprocessing.RawArray) and updates it in place: its pid, the range it
+is working on, when it started its current polynomial (the heartbeat) and
+which polynomial that is, plus cumulative tuple counts and the time spent
+decoding, checking reducibility and computing Galois groups. Nothing is
+sent between processes per polynomial.
+
+The main process reads the slots from a background thread and appends a
+JSON line to census_metrics.jsonl every interval: tuples per second, the
+split of the time between the stages, the polynomials per group so far
+(fed from the results it writes), the ETA of the shard and the workers
+that have been stuck on one polynomial for longer than stall_seconds.
+
+Nothing in here needs Sage.
+"""
+
+import os
+import json
+import time
+import threading
+import multiprocessing
+
+METRICS_NAME = "census_metrics.jsonl"
+METRICS_INTERVAL = 30.0    # Seconds between two metrics lines
+STALL_SECONDS = 600.0      # One polynomial taking longer than this is reported as stuck
+
+STAGES = ("decode", "reducibility", "galois")
+
+# Layout of a worker slot; the current coefficient tuple follows the fixed fields
+PID, TASK_START, TASK_STOP, ITEM_STARTED, TUPLES, TASKS = range(6)
+STAGE_FIELD = {stage: 6 + k for k, stage in enumerate(STAGES)}
+SLOT_HEADER = 6 + len(STAGES)
+
+
+def process_alive(pid):
+    """True if a process with this pid exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class WorkerSlot:
+    """
+    A worker's slot in the shared counter array. claim() takes the first
+    slot that is unused or whose process has died, so a replaced worker
+    carries on the counts of the one it replaces.
+    """
+
+    def __init__(self, counters, base, deg):
+        self.counters = counters
+        self.base = base
+        self.deg = deg
+
+    @classmethod
+    def claim(cls, counters, lock, deg):
+        slot_size = SLOT_HEADER + deg
+        with lock:
+            for base in range(0, len(counters), slot_size):
+                pid = int(counters[base + PID])
+                if pid == 0 or (pid != os.getpid() and not process_alive(pid)):
+                    counters[base + PID] = os.getpid()
+                    counters[base + ITEM_STARTED] = 0.0
+                    return cls(counters, base, deg)
+        raise RuntimeError("No free metrics slot for this worker")
+
+    def start_task(self, start, stop):
+        self.counters[self.base + TASK_START] = start
+        self.counters[self.base + TASK_STOP] = stop
+        self.counters[self.base + ITEM_STARTED] = time.time()
+
+    def heartbeat(self, coeffs):
+        """Record that the worker starts on the polynomial coeffs."""
+        base = self.base + SLOT_HEADER
+        for k, c in enumerate(coeffs):
+            self.counters[base + k] = c
+        self.counters[self.base + ITEM_STARTED] = time.time()
+
+    def add_time(self, stage, seconds):
+        self.counters[self.base + STAGE_FIELD[stage]] += seconds
+
+    def finish_task(self, tuples):
+        self.counters[self.base + TUPLES] += tuples
+        self.counters[self.base + TASKS] += 1
+        self.counters[self.base + ITEM_STARTED] = 0.0
+
+
+class CensusMetrics:
+    """
+    Shared counters of a pool of num_workers workers and the metrics file
+    of the run. pending is the number of tuples (or sample positions) left
+    in the shard when the run starts, or None if the run has no fixed end
+    (a stratified sample); it gives the ETA.
+
+    Pass worker_args() to the workers, which claim a WorkerSlot with them.
+    Used as a context manager, a background thread writes a metrics line
+    every interval (even while every worker is stuck) and a last one on
+    exit.
+    """
+
+    def __init__(self, path, num_workers, deg, pending=None, shard=(1, 1),
+                 interval=METRICS_INTERVAL, stall_seconds=STALL_SECONDS):
+        self.path = path
+        self.deg = deg
+        self.pending = pending
+        self.shard = list(shard)
+        self.interval = interval
+        self.stall_seconds = stall_seconds
+        self.slot_size = SLOT_HEADER + deg
+        self.counters = multiprocessing.RawArray('d', num_workers * self.slot_size)
+        self.lock = multiprocessing.Lock()
+        self.group_counts = {}     # Group label -> polynomials classified in this run
+        self.started = time.time()
+        self.last_line = (self.started, 0)
+        self.stuck = set()         # (pid, heartbeat) of the stuck polynomials reported
+        self.stopped = threading.Event()
+        self.thread = None
+        self.last = None           # Last metrics line written
+
+    def worker_args(self):
+        """(counters, lock, deg) for WorkerSlot.claim in a worker."""
+        return self.counters, self.lock, self.deg
+
+    def add_groups(self, results):
+        """Count the polynomials of a {group_label: members} result."""
+        for group_label, members in results.items():
+            self.add_group(group_label, len(members))
+
+    def add_group(self, group_label, count):
+        self.group_counts[group_label] = self.group_counts.get(group_label, 0) + count
+
+    def slots(self):
+        for base in range(0, len(self.counters), self.slot_size):
+            if self.counters[base + PID]:
+                yield self.counters[base:base + self.slot_size]
+
+    def stage_seconds(self):
+        """Worker time per stage, summed over the slots."""
+        slots = list(self.slots())
+        return {stage: sum(slot[STAGE_FIELD[stage]] for slot in slots) for stage in STAGES}
+
+    def stage_fractions(self, seconds=None):
+        """Share of each stage in the worker time."""
+        seconds = seconds or self.stage_seconds()
+        total = sum(seconds.values())
+        return {stage: s / total if total else 0.0 for stage, s in seconds.items()}
+
+    def workers(self, now):
+        """Pid, range and current polynomial of every busy worker."""
+        busy = []
+        for slot in self.slots():
+            if not slot[ITEM_STARTED]:
+                continue
+            seconds = now - slot[ITEM_STARTED]
+            busy.append({
+                "pid": int(slot[PID]),
+                "range": [int(slot[TASK_START]), int(slot[TASK_STOP])],
+                "coeffs": [int(c) for c in slot[SLOT_HEADER:]],
+                "item_seconds": round(seconds, 3),
+                "stuck": seconds >= self.stall_seconds,
+                "heartbeat": slot[ITEM_STARTED],
+            })
+        return busy
+
+    def snapshot(self, now, busy):
+        """One metrics line as a dict, given the busy workers at time now."""
+        slots = list(self.slots())
+        tuples = int(sum(slot[TUPLES] for slot in slots))
+        seconds = self.stage_seconds()
+        elapsed = now - self.started
+        rate = tuples / elapsed if elapsed > 0 else 0.0
+        last_time, last_tuples = self.last_line
+        recent = (tuples - last_tuples) / (now - last_time) if now > last_time else 0.0
+        self.last_line = (now, tuples)
+
+        remaining = eta = None
+        if self.pending is not None:
+            remaining = max(0, self.pending - tuples)
+            eta = round(remaining / rate, 1) if rate > 0 else None
+        return {
+            "time": round(now, 3),
+            "elapsed": round(elapsed, 3),
+            "shard": self.shard,
+            "tuples": tuples,
+            "tasks": int(sum(slot[TASKS] for slot in slots)),
+            "tuples_per_second": round(rate, 3),
+            "recent_tuples_per_second": round(recent, 3),
+            "seconds": {stage: round(s, 3) for stage, s in seconds.items()},
+            "fractions": {stage: round(f, 4) for stage, f in self.stage_fractions(seconds).items()},
+            "groups": dict(sorted(dict(self.group_counts).items())),
+            "remaining": remaining,
+            "eta_seconds": eta,
+            "workers": len(slots),
+            "busy": len(busy),
+            "stuck": [{k: v for k, v in w.items() if k not in ("stuck", "heartbeat")}
+                      for w in busy if w["stuck"]],
+        }
+
+    def write(self):
+        """Append a metrics line; report workers that got stuck since the last one."""
+        now = time.time()
+        busy = self.workers(now)
+        line = self.snapshot(now, busy)
+        for worker in busy:
+            key = (worker["pid"], worker["heartbeat"])
+            if worker["stuck"] and key not in self.stuck:
+                self.stuck.add(key)
+                print(f"Worker {worker['pid']} has spent {worker['item_seconds']:.0f}s on "
+                      f"the tuple {tuple(worker['coeffs'])} of range {worker['range']}.",
+                      flush=True)
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(line) + "\n")
+        self.last = line
+        return line
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.write()
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+        self.write()
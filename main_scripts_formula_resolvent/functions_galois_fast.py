@@ -0,0 +1,710 @@
+#!/usr/bin/env python3
+
+"""
+Vectorised integer arithmetic for the Galois census.
+
+Blocks of coefficient tuples are int64 NumPy matrices with one row per
+monic polynomial x^deg + a_{deg-1} x^{deg-1} + ... + a_0, stored in census
+order (a_{deg-1}, ..., a_0), i.e. column k - 1 holds the coefficient of
+x^(deg - k). Everything here is exact: a row is only marked when a
+certificate holds, undecided rows are left to Sage/PARI.
+"""
+
+from math import isqrt
+
+import numpy as np
+
+from functions_census import box_size, height_of_index, census_group_paths, CensusGroupReader
+from resolvent_data_quintic import QUINTIC_SEXTIC_RESOLVENT, QUINTIC_DISCRIMINANT
+
+# Largest magnitude we let int64 intermediate values reach
+INT64_SAFE = 2 ** 62
+
+
+# -----------------------------------------------------------
+# Coefficient blocks
+# -----------------------------------------------------------
+def coefficient_block(start, stop, n, deg):
+    """
+    Rows of product(range(-n, n+1), repeat=deg) with index in [start, stop),
+    decoded in base 2n+1 (most significant digit first).
+    """
+    return coefficient_rows(np.arange(start, stop, dtype=np.int64), n, deg)
+
+def coefficient_rows(index, n, deg):
+    """Rows of product(range(-n, n+1), repeat=deg) at an array of box indices."""
+    base = 2 * n + 1
+    columns = []
+    for _ in range(deg):
+        index, digit = np.divmod(index, base)
+        columns.append(digit - n)
+    return np.stack(columns[::-1], axis=1)
+
+def shell_block(start, stop, n_inner, n, deg):
+    """
+    Rows of the shell of [-n, n]^deg around [-n_inner, n_inner]^deg with
+    shell index in [start, stop) (functions_census.coeffs_from_shell_index).
+    """
+    index = np.arange(start, stop, dtype=np.int64)
+    block = np.empty((len(index), deg), dtype=np.int64)
+    outer = np.array([c for c in range(-n, n + 1) if abs(c) > n_inner], dtype=np.int64)
+    inner_base = max(2 * n_inner + 1, 0)
+    offset = 0
+    for j in range(deg):
+        size = inner_base ** j * len(outer) * (2 * n + 1) ** (deg - 1 - j)
+        rows = np.flatnonzero((index >= offset) & (index < offset + size))
+        local = index[rows] - offset
+        for k in range(deg - 1, j, -1):
+            local, digit = np.divmod(local, 2 * n + 1)
+            block[rows, k] = digit - n
+        local, digit = np.divmod(local, len(outer))
+        block[rows, j] = outer[digit]
+        for k in range(j - 1, -1, -1):
+            local, digit = np.divmod(local, inner_base)
+            block[rows, k] = digit - n_inner
+        offset += size
+    return block
+
+def height_block(start, stop, deg):
+    """
+    Rows with height-order index in [start, stop): shell after shell, see
+    functions_census.coeffs_from_height_index.
+    """
+    parts = []
+    index = start
+    while index < stop:
+        h = height_of_index(index, deg)
+        shell_start = box_size(h - 1, deg)
+        shell_stop = min(box_size(h, deg), stop)
+        parts.append(shell_block(index - shell_start, shell_stop - shell_start, h - 1, h, deg))
+        index = shell_stop
+    if not parts:
+        return np.empty((0, deg), dtype=np.int64)
+    return np.concatenate(parts)
+
+def constrained_block(start, stop, constraints):
+    """
+    Rows of the restricted product of a functions_census.CoefficientConstraints
+    with index in [start, stop), without the rows that fail its linear
+    equalities (so the block may have fewer than stop - start rows).
+    """
+    return constrained_rows(np.arange(start, stop, dtype=np.int64), constraints)
+
+def constrained_rows(index, constraints):
+    """constrained_block for an array of indices of the restricted product."""
+    block = np.empty((len(index), constraints.deg), dtype=np.int64)
+    for k in range(constraints.deg - 1, -1, -1):
+        values = np.array(constraints.values[k], dtype=np.int64)
+        index, digit = np.divmod(index, max(len(values), 1))
+        block[:, k] = values[digit] if len(values) else 0
+    if constraints.equalities:
+        keep = np.ones(len(block), dtype=bool)
+        for weights, rhs in constraints.equalities:
+            keep &= block @ np.array(weights, dtype=np.int64) == rhs
+        block = block[keep]
+    return block
+
+def load_census_group(output_dir, name, mmap=True):
+    """
+    Coefficient matrix of a census group (across its base censuses), one
+    census tuple per row. A single binary group file is memory-mapped
+    read-only (zero copy) and several are concatenated; text files are
+    parsed into int64 without a symbolic parse.
+    """
+    paths = census_group_paths(output_dir, name)
+    if paths and all(path.endswith(".npy") for path in paths):
+        blocks = [np.load(path, mmap_mode="r" if mmap else None) for path in paths]
+        return blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+    rows = list(CensusGroupReader(output_dir, name).rows())
+    if not rows:
+        return np.empty((0, 0), dtype=np.int64)
+    return np.array(rows, dtype=np.int64)
+
+def _mix64(z):
+    """functions_census.mix64 on a uint64 array (products wrap mod 2^64)."""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+def permuted_indices(permutation, start, stop):
+    """
+    Indices permutation(i) for the sample positions i in [start, stop) of a
+    functions_census.IndexPermutation, with the same Feistel rounds and
+    cycle walking.
+    """
+    half_bits = np.uint64(permutation.half_bits)
+    half_mask = np.uint64(permutation.half_mask)
+    keys = [np.uint64(key) for key in permutation.keys]
+    x = np.arange(start, stop, dtype=np.uint64)
+    walking = np.ones(len(x), dtype=bool)
+    while walking.any():
+        left, right = x[walking] >> half_bits, x[walking] & half_mask
+        for key in keys:
+            left, right = right, left ^ (_mix64(right ^ key) & half_mask)
+        x[walking] = (left << half_bits) | right
+        walking = x >= np.uint64(permutation.size)
+    return x.astype(np.int64)
+
+def horner(block, x):
+    """Values f(x) for every row of block at the integer x."""
+    values = np.ones(len(block), dtype=block.dtype)
+    for k in range(block.shape[1]):
+        values = values * x + block[:, k]
+    return values
+
+def _evaluation_dtype(block, x_max):
+    """int64 if |f(x)| <= (deg + 1) * h * x_max^deg cannot overflow, else object."""
+    deg = block.shape[1]
+    h = max(int(np.abs(block).max(initial=0)), 1)
+    if (deg + 1) * h * max(x_max, 1) ** deg < INT64_SAFE:
+        return np.int64
+    return object
+
+
+# -----------------------------------------------------------
+# Polynomials over F_p (lists of residues, lowest degree first)
+# -----------------------------------------------------------
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13)
+FROBENIUS_PRIMES = (
+    2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+    53, 59, 61, 67, 71, 73, 79, 83, 89, 97,
+)
+
+def _trim(a):
+    while a and a[-1] == 0:
+        a.pop()
+    return a
+
+def _poly_divmod(a, b, p):
+    """Quotient and remainder of a by b over F_p (b non-zero)."""
+    a = list(a)
+    inv = pow(b[-1], -1, p)
+    q = [0] * max(len(a) - len(b) + 1, 0)
+    while len(a) >= len(b):
+        c = a[-1] * inv % p
+        shift = len(a) - len(b)
+        q[shift] = c
+        for i, bc in enumerate(b):
+            a[shift + i] = (a[shift + i] - c * bc) % p
+        _trim(a)
+    return q, a
+
+def _poly_gcd(a, b, p):
+    """Monic gcd over F_p."""
+    while b:
+        a, b = b, _poly_divmod(a, b, p)[1]
+    inv = pow(a[-1], -1, p)
+    return [c * inv % p for c in a]
+
+def _poly_sub(a, b, p):
+    size = max(len(a), len(b))
+    a = a + [0] * (size - len(a))
+    b = b + [0] * (size - len(b))
+    return _trim([(ac - bc) % p for ac, bc in zip(a, b)])
+
+def _poly_mulmod(a, b, m, p):
+    product = [0] * (len(a) + len(b) - 1) if a and b else []
+    for i, ac in enumerate(a):
+        if ac:
+            for j, bc in enumerate(b):
+                product[i + j] = (product[i + j] + ac * bc) % p
+    return _poly_divmod(_trim(product), m, p)[1]
+
+def _poly_powmod(a, e, m, p):
+    result = [1]
+    while e:
+        if e & 1:
+            result = _poly_mulmod(result, a, m, p)
+        a = _poly_mulmod(a, a, m, p)
+        e >>= 1
+    return result
+
+def factor_degrees_mod_p(coeffs, p):
+    """
+    Degrees of the irreducible factors of the monic polynomial with census
+    coefficients coeffs modulo p (distinct-degree factorisation), sorted.
+    Returns None when f is not squarefree modulo p, i.e. p | disc(f).
+    """
+    f = _trim([c % p for c in reversed(coeffs)] + [1])
+    derivative = _trim([i * c % p for i, c in enumerate(f)][1:])
+    if not derivative or len(_poly_gcd(f, derivative, p)) > 1:
+        return None
+
+    degrees = []
+    x = [0, 1]
+    h = x
+    i = 0
+    while len(f) - 1 >= 2 * (i + 1):
+        i += 1
+        h = _poly_powmod(h, p, f, p)
+        g = _poly_gcd(f, _poly_sub(h, x, p), p)
+        if len(g) > 1:
+            degrees += [i] * ((len(g) - 1) // i)
+            f = _poly_divmod(f, g, p)[0]
+            h = _poly_divmod(h, f, p)[1]
+    if len(f) > 1:
+        degrees.append(len(f) - 1)
+    return tuple(sorted(degrees))
+
+_PATTERN_CACHE = {}
+_PATTERN_CACHE_LIMIT = 1_000_000   # Residue classes kept per process
+
+def factor_patterns(block, p):
+    """
+    factor_degrees_mod_p for every row of block. Rows are reduced modulo p
+    first, so each residue class is factored once (and cached per process).
+    Returns a list of patterns (None for rows with p | disc).
+    """
+    residues, inverse = np.unique(np.mod(block, p), axis=0, return_inverse=True)
+    patterns = []
+    for residue in map(tuple, residues.tolist()):
+        key = (p, residue)
+        if key not in _PATTERN_CACHE:
+            if len(_PATTERN_CACHE) >= _PATTERN_CACHE_LIMIT:
+                _PATTERN_CACHE.clear()
+            _PATTERN_CACHE[key] = factor_degrees_mod_p(residue, p)
+        patterns.append(_PATTERN_CACHE[key])
+    return [patterns[i] for i in inverse.ravel().tolist()]
+
+
+# -----------------------------------------------------------
+# Irreducibility certificates
+# -----------------------------------------------------------
+def _subset_sum_mask(degrees):
+    """Bit d is set when some sub-multiset of degrees sums to d."""
+    mask = 1
+    for d in degrees:
+        mask |= mask << d
+    return mask
+
+def eisenstein_mask(block):
+    """
+    True for rows that are Eisenstein at some prime p: p divides every
+    non-leading coefficient and p^2 does not divide a_0.
+    """
+    a0 = block[:, -1]
+    mask = np.zeros(len(block), dtype=bool)
+    for p in range(2, int(np.abs(a0).max(initial=0)) + 1):
+        if any(p % q == 0 for q in range(2, int(p ** 0.5) + 1)):
+            continue
+        mask |= np.all(block % p == 0, axis=1) & (a0 % (p * p) != 0)
+    return mask
+
+def factor_degree_certificate(block, has_root, primes=SMALL_PRIMES):
+    """
+    True for rows proved irreducible by factor degrees modulo small primes.
+
+    A factor of f over Z of degree d reduces to a product of irreducible
+    factors modulo p, so d must be a sub-sum of the degree pattern of f mod
+    p for every prime p with p not dividing disc(f). Rows without an integer root have no
+    factor of degree 1 or deg - 1 either. A row is irreducible when no
+    degree 1 <= d <= deg - 1 survives; being irreducible modulo a single p
+    is the special case of the pattern (deg,).
+    """
+    deg = block.shape[1]
+    interior = (1 << deg) - 2
+    possible = np.full(len(block), interior, dtype=np.int64)
+    possible[~has_root] &= ~((1 << 1) | (1 << (deg - 1)))
+    for p in primes:
+        # Only rows that are still undecided are factored modulo p
+        active = np.flatnonzero(possible)
+        if len(active) == 0:
+            break
+        masks = {}
+        possible[active] &= np.array([
+            masks.setdefault(pattern, interior if pattern is None else _subset_sum_mask(pattern))
+            for pattern in factor_patterns(block[active], p)
+        ], dtype=np.int64)
+    return possible == 0
+
+
+# -----------------------------------------------------------
+# Reducibility pre-filter
+# -----------------------------------------------------------
+def integer_root_mask(block):
+    """
+    True for rows with a rational root. The polynomials are monic, so a
+    rational root is an integer dividing a_0 (and a_0 = 0 means x | f).
+    Each candidate r is only evaluated on the rows where r | a_0.
+    """
+    a0 = block[:, -1]
+    has_root = a0 == 0
+    r_max = int(np.abs(a0).max(initial=0))
+    work = block.astype(_evaluation_dtype(block, r_max))
+    for r in range(1, r_max + 1):
+        rows = np.flatnonzero(~has_root & (a0 % r == 0))
+        if len(rows) == 0:
+            continue
+        for root in (r, -r):
+            hit = horner(work[rows], root) == 0
+            has_root[rows[hit]] = True
+            rows = rows[~hit]
+    return has_root
+
+def reducibility_prefilter(block):
+    """
+    Split a block into rows that are certainly reducible and rows that are
+    certainly irreducible, without leaving NumPy.
+
+    - reducible: the row has an integer root (rational root test).
+    - irreducible: no integer root and either degree <= 3 (a reducible
+      cubic or quadratic always has a linear factor), Eisenstein at some
+      prime, or ruled out by factor degrees modulo small primes.
+
+    Returns the boolean masks (reducible, irreducible); rows in neither
+    still need Sage's is_irreducible().
+    """
+    if block.shape[1] == 1:
+        return np.zeros(len(block), dtype=bool), np.ones(len(block), dtype=bool)
+    reducible = integer_root_mask(block)
+    if block.shape[1] <= 3:
+        return reducible, ~reducible
+
+    irreducible = ~reducible & eisenstein_mask(block)
+    undecided = np.flatnonzero(~reducible & ~irreducible)
+    if len(undecided):
+        irreducible[undecided] = factor_degree_certificate(block[undecided], reducible[undecided])
+    return reducible, irreducible
+
+
+# -----------------------------------------------------------
+# Exact integer helpers
+# -----------------------------------------------------------
+def _work_dtype(block, bound):
+    """int64 if bound(h) stays below INT64_SAFE for the block height h, else object."""
+    h = max(int(np.abs(block).max(initial=0)), 1)
+    return np.int64 if bound(h) < INT64_SAFE else object
+
+def is_square(values):
+    """Exact perfect-square test for an int64 or object array of integers."""
+    if values.dtype == object:
+        return np.array([v >= 0 and isqrt(v) ** 2 == v for v in values.tolist()], dtype=bool)
+    nonnegative = values >= 0
+    v = np.where(nonnegative, values, 0)
+    r = np.floor(np.sqrt(v.astype(np.float64))).astype(np.int64)
+    # Float rounding can put r off by one in either direction
+    r -= r * r > v
+    r += (r + 1) * (r + 1) <= v
+    return nonnegative & (r * r == v)
+
+
+# -----------------------------------------------------------
+# Degree 3: discriminant
+# -----------------------------------------------------------
+def cubic_discriminant(block):
+    """disc(x^3 + b x^2 + c x + d) = b^2c^2 - 4c^3 - 4b^3d - 27d^2 + 18bcd."""
+    work = block.astype(_work_dtype(block, lambda h: 54 * h ** 4))
+    b, c, d = work[:, 0], work[:, 1], work[:, 2]
+    return b * b * c * c - 4 * c ** 3 - 4 * b ** 3 * d - 27 * d * d + 18 * b * c * d
+
+def classify_cubics(block):
+    """
+    Galois group labels of a block of irreducible cubics: A3 when the
+    discriminant is a square, S3 otherwise.
+    """
+    return np.where(is_square(cubic_discriminant(block)), "A3", "S3").tolist()
+
+
+# -----------------------------------------------------------
+# Integer roots of monic polynomials
+# -----------------------------------------------------------
+def root_bound(block):
+    """
+    Fujiwara bound of every row: each complex root z of a monic polynomial
+    has |z| <= 2 max_k |a_{deg-k}|^(1/k). Rounded up, so every integer root
+    r has |r| <= bound.
+    """
+    bound = np.zeros(len(block), dtype=np.int64)
+    for k in range(1, block.shape[1] + 1):
+        a = np.abs(block[:, k - 1].astype(np.float64))
+        bound = np.maximum(bound, np.floor(a ** (1.0 / k)).astype(np.int64) + 1)
+    return 2 * bound
+
+def integer_roots(block):
+    """
+    All integer roots of every row of a block of monic integer polynomials
+    (object or int64, census order). A root r divides a_0 and lies within
+    root_bound, so only those divisors are evaluated, exactly, on the rows
+    where they qualify; nothing is left out.
+    Returns (roots, valid): an object matrix of roots and a boolean matrix
+    marking its filled entries (each distinct root once, first columns first).
+    """
+    count, deg = block.shape
+    roots = np.zeros((count, deg), dtype=object)
+    valid = np.zeros((count, deg), dtype=bool)
+    found = np.zeros(count, dtype=np.int64)
+
+    def record(rows, root):
+        roots[rows, found[rows]] = root
+        valid[rows, found[rows]] = True
+        found[rows] += 1
+
+    a0 = block[:, -1]
+    record(np.flatnonzero(a0 == 0), 0)
+    bound = root_bound(block)
+    r_max = int(bound.max(initial=0))
+    work = block.astype(_evaluation_dtype(block, r_max))
+    for r in range(1, r_max + 1):
+        rows = np.flatnonzero((bound >= r) & (found < deg) & (a0 % r == 0))
+        for root in (r, -r):
+            if len(rows):
+                record(rows[horner(work[rows], root) == 0], root)
+    return roots, valid
+
+def approximate_integer_roots(block):
+    """
+    Integer roots of every row found from floating point: candidates are the
+    rounded real parts of the complex roots of the batched companion
+    matrices, each checked exactly. A returned root is always a root, but
+    a root the eigenvalues miss is not recovered; use it only where a
+    missed root leaves the row undecided (for polynomials whose root_bound
+    makes integer_roots too slow). Returns (roots, valid) as integer_roots.
+    """
+    count, deg = block.shape
+    companion = np.zeros((count, deg, deg), dtype=np.float64)
+    companion[:, 0, :] = -block.astype(np.float64)
+    companion[:, np.arange(1, deg), np.arange(deg - 1)] = 1.0
+    eigenvalues = np.linalg.eigvals(companion)
+
+    real = np.abs(eigenvalues.imag) < 0.5
+    candidates = np.rint(eigenvalues.real).astype(np.int64).astype(object)
+    exact = block.astype(object)
+    values = np.ones((count, deg), dtype=object)
+    for k in range(deg):
+        values = values * candidates + exact[:, k:k + 1]
+    valid = real & (values == 0)
+
+    # Keep each integer root once per row
+    for j in range(1, deg):
+        for i in range(j):
+            valid[:, j] &= ~(valid[:, i] & (candidates[:, i] == candidates[:, j]))
+    return candidates, valid
+
+
+# -----------------------------------------------------------
+# Degree 4: resolvent cubic and discriminant
+# -----------------------------------------------------------
+QUARTIC_LABELS = {
+    "C4": "C(4) = 4",
+    "V4": "E(4) = 2[x]2",
+    "D4": "D(4)",
+    "A4": "A4",
+    "S4": "S4",
+}
+
+def quartic_resolvent_cubic(block):
+    """
+    Resolvent cubic of x^4 + b x^3 + c x^2 + d x + e, whose roots are
+    x1x2 + x3x4, x1x3 + x2x4, x1x4 + x2x3:
+        y^3 - c y^2 + (bd - 4e) y - (b^2 e - 4ce + d^2),
+    returned in census order. It has the same discriminant as the quartic.
+    """
+    work = block.astype(object)
+    b, c, d, e = work[:, 0], work[:, 1], work[:, 2], work[:, 3]
+    return np.stack([-c, b * d - 4 * e, -(b * b * e - 4 * c * e + d * d)], axis=1)
+
+def classify_quartics(block):
+    """
+    Galois group labels (PARI's names) of a block of irreducible quartics.
+
+    With Delta = disc(f) and g the resolvent cubic:
+      - g irreducible: A4 if Delta is a square, else S4;
+      - g splits completely: V4;
+      - g has exactly one integer root r: C4 if x^2 - r x + e and
+        x^2 + b x + (c - r) both split over Q(sqrt(Delta)) (Kappe-Warren),
+        else D4. A quadratic with discriminant delta splits there when
+        delta = 0, delta is a square or delta * Delta is a square.
+    """
+    resolvent = quartic_resolvent_cubic(block)
+    delta = cubic_discriminant(resolvent)
+    square = is_square(delta)
+    roots, valid = integer_roots(resolvent)
+    root_count = valid.sum(axis=1)
+
+    labels = np.where(square, "A4", "S4").astype(object)
+    labels[root_count == 3] = "V4"
+
+    one_root = np.flatnonzero(root_count == 1)
+    if len(one_root):
+        r = roots[one_root][valid[one_root]]
+        work = block[one_root].astype(object)
+        b, c, e = work[:, 0], work[:, 1], work[:, 3]
+        delta_one = delta[one_root].astype(object)
+
+        def splits(disc):
+            return (disc == 0) | is_square(disc) | is_square(disc * delta_one)
+
+        cyclic = splits(r * r - 4 * e) & splits(b * b - 4 * (c - r))
+        labels[one_root] = np.where(cyclic, "C4", "D4")
+
+    return [QUARTIC_LABELS[label] for label in labels.tolist()]
+
+
+# -----------------------------------------------------------
+# Degree 5: sextic resolvent, discriminant and cycle types
+# -----------------------------------------------------------
+QUINTIC_LABELS = {
+    "C5": "C(5) = 5",
+    "D5": "D(5) = 5:2",
+    "F20": "F(5) = 5:4",
+    "A5": "A5",
+    "S5": "S5",
+}
+
+def evaluate_terms(terms, block):
+    """
+    Exact value on every row of a stored polynomial in the coefficients,
+    given as (exponents, coefficient) terms (see resolvent_data_quintic.py).
+    """
+    top = max(sum(exps) for exps, _ in terms)
+    scale = sum(abs(coef) for _, coef in terms)
+    work = block.astype(_work_dtype(block, lambda h: scale * h ** top))
+    powers = {}
+    total = np.zeros(len(block), dtype=work.dtype)
+    for exps, coef in terms:
+        value = np.full(len(block), coef, dtype=work.dtype)
+        for k, m in enumerate(exps):
+            if m:
+                if (k, m) not in powers:
+                    powers[(k, m)] = work[:, k] ** m
+                value = value * powers[(k, m)]
+        total = total + value
+    return total
+
+def quintic_discriminant(block):
+    """disc(x^5 + a1 x^4 + ... + a5) from the stored 59-term formula."""
+    return evaluate_terms(QUINTIC_DISCRIMINANT[0], block)
+
+def quintic_sextic_resolvent(block):
+    """
+    Sextic resolvent R(y) = prod (y - theta^2) of every row, in census order
+    (object integers). theta^2 has stabiliser F20 in S5, so a simple rational
+    root of R puts the Galois group inside F20.
+    """
+    return np.stack([evaluate_terms(terms, block).astype(object)
+                     for terms in QUINTIC_SEXTIC_RESOLVENT], axis=1)
+
+def classify_quintics(block, primes=FROBENIUS_PRIMES):
+    """
+    Galois group labels (PARI's names) of a block of irreducible quintics,
+    or None for rows left to PARI.
+
+    The transitive groups of degree 5 are C5 < D5 < F20 and A5 < S5.
+      - A simple integer root r of the sextic resolvent (R'(r) != 0) proves
+        G <= F20; then G = F20 if the discriminant is not a square, and
+        otherwise G is D5 or C5, where a Frobenius cycle type (2, 2, 1)
+        proves D5.
+      - Without one, a Frobenius cycle type with a 3-cycle or a single
+        transposition (impossible in F20) puts G in {A5, S5} and the
+        discriminant decides.
+    Cycle types are the factor degrees modulo unramified primes. Rows
+    without a certificate (C5 always, and any row whose resolvent root was
+    missed) are left to PARI.
+    """
+    labels = np.full(len(block), None, dtype=object)
+    square = is_square(quintic_discriminant(block))
+
+    resolvent = quintic_sextic_resolvent(block)
+    roots, valid = approximate_integer_roots(resolvent)
+    # R'(r) != 0 for a simple root
+    derivative = np.full(roots.shape, 6, dtype=object)
+    for k in range(5):
+        derivative = derivative * roots + (5 - k) * resolvent[:, k:k + 1]
+    inside_f20 = (valid & (derivative != 0)).any(axis=1)
+    decided = inside_f20 & ~square
+    labels[decided] = "F20"
+
+    # Cycle types, only until each remaining row has its certificate
+    dihedral = inside_f20 & square
+    for p in primes:
+        active = np.flatnonzero(~decided)
+        if len(active) == 0:
+            break
+        for row, pattern in zip(active.tolist(), factor_patterns(block[active], p)):
+            if pattern is None:
+                continue
+            if dihedral[row]:
+                if pattern == (1, 2, 2):
+                    labels[row] = "D5"
+                    decided[row] = True
+            elif 3 in pattern or pattern == (1, 1, 1, 2):
+                labels[row] = "A5" if square[row] else "S5"
+                decided[row] = True
+
+    return [None if label is None else QUINTIC_LABELS[label] for label in labels.tolist()]
+
+
+# -----------------------------------------------------------
+# Frobenius cycle types: S_n certificate
+# -----------------------------------------------------------
+def _is_prime(m):
+    return m >= 2 and all(m % q for q in range(2, int(m ** 0.5) + 1))
+
+def symmetric_group_label(deg):
+    """PARI's label for the full symmetric group of degree deg."""
+    return f"S{deg}"
+
+def symmetric_group_certificate(block, primes=FROBENIUS_PRIMES):
+    """
+    True for rows whose Galois group is proved to be S_deg. Every row must
+    be an irreducible polynomial, so its group G is transitive.
+
+    For a prime p not dividing disc(f), the degrees of the factors of f mod p
+    are the cycle type of a Frobenius element of G. The certificate
+    collects:
+      - primitivity: deg is prime, or some cycle type is (deg - 1, 1), which
+        makes G doubly transitive;
+      - a transposition: a cycle type with a single 2-cycle and only odd
+        cycles otherwise (its odd power is a transposition);
+      - a q-cycle for a prime q <= deg - 3 (a cycle type with a q-cycle and
+        all other lengths prime to q) together with an odd permutation.
+    A primitive group with a transposition is S_deg, and a primitive group
+    with a q-cycle, q <= deg - 3, contains A_deg (Jordan). Rows that do not
+    get a certificate from these primes are left to PARI.
+    """
+    deg = block.shape[1]
+    count = len(block)
+    primitive = np.full(count, _is_prime(deg))
+    transposition = np.zeros(count, dtype=bool)
+    jordan_cycle = np.zeros(count, dtype=bool)
+    odd = np.zeros(count, dtype=bool)
+    jordan_primes = [q for q in range(3, deg - 2) if _is_prime(q)]
+
+    certified = np.zeros(count, dtype=bool)
+    for p in primes:
+        active = np.flatnonzero(~certified)
+        if len(active) == 0:
+            break
+        for row, pattern in zip(active.tolist(), factor_patterns(block[active], p)):
+            if pattern is None:
+                continue
+            even_parts = [d for d in pattern if d % 2 == 0]
+            if pattern == (1, deg - 1):
+                primitive[row] = True
+            if even_parts == [2]:
+                transposition[row] = True
+            if len(even_parts) % 2 == 1:
+                odd[row] = True
+            for q in jordan_primes:
+                if pattern.count(q) == 1 and all(d % q for d in pattern if d != q):
+                    jordan_cycle[row] = True
+        certified = primitive & (transposition | (jordan_cycle & odd))
+    return certified
+
+def fast_galois_labels(block):
+    """
+    Galois group labels (as returned by PARI) for a block of irreducible
+    polynomials, or None where no exact fast path applies.
+    """
+    labels = [None] * len(block)
+    if len(block) == 0:
+        return labels
+    if block.shape[1] == 3:
+        return classify_cubics(block)
+    if block.shape[1] == 4:
+        return classify_quartics(block)
+    if block.shape[1] == 5:
+        return classify_quintics(block)
+    for row in np.flatnonzero(symmetric_group_certificate(block)).tolist():
+        labels[row] = symmetric_group_label(block.shape[1])
+    return labels
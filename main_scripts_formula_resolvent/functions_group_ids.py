@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+"""
+Canonical integer ids of Galois groups: the transitive group nTk is
+stored as n * GROUP_ID_BASE + k (e.g. 4T3 = D4 -> 4003).
+
+PARI labels groups with free-form strings such as "C(4) = 4" or
+"D(5) = 5:2", and census files are named either after the full label or
+after the part before "=". normalize_group() maps every such spelling (as
+well as "4T3" codes, display names and the ids themselves) to the id, and
+the tables below give the names back for display.
+
+Nothing in here needs Sage; pari_group_id() only calls the methods of a
+Sage PariGroup it is given.
+"""
+
+import os
+
+GROUP_ID_BASE = 1000
+
+# Transitive groups of degree 2..6 in PARI's numbering (polgalois with the
+# galdata package): (T-number, PARI label, display name, order)
+TRANSITIVE_GROUPS = {
+    2: [
+        (1, "S2", "C2", 2),
+    ],
+    3: [
+        (1, "A3", "C3", 3),
+        (2, "S3", "S3", 6),
+    ],
+    4: [
+        (1, "C(4) = 4", "C4", 4),
+        (2, "E(4) = 2[x]2", "V4", 4),
+        (3, "D(4)", "D4", 8),
+        (4, "A4", "A4", 12),
+        (5, "S4", "S4", 24),
+    ],
+    5: [
+        (1, "C(5) = 5", "C5", 5),
+        (2, "D(5) = 5:2", "D5", 10),
+        (3, "F(5) = 5:4", "F20", 20),
+        (4, "A5", "A5", 60),
+        (5, "S5", "S5", 120),
+    ],
+    6: [
+        (1, "C(6) = 6 = 3[x]2", "C6", 6),
+        (2, "D_6(6) = [3]2", "S3(6)", 6),
+        (3, "D(6) = S(3)[x]2", "D6", 12),
+        (4, "A_4(6) = [2^2]3", "A4(6)", 12),
+        (5, "F_18(6) = [3^2]2 = 3 wr 2", "C3xS3", 18),
+        (6, "2A_4(6) = [2^2]6", "C2xA4", 24),
+        (7, "S_4(6d) = [2^2]S(3)", "S4(6d)", 24),
+        (8, "S_4(6c) = 1/2[2^3]S(3)", "S4(6c)", 24),
+        (9, "F_18(6):2 = [1/2.S(3)^2]2", "S3xS3", 36),
+        (10, "F_36(6) = 1/2[S(3)^2]2", "C3^2:C4", 36),
+        (11, "2S_4(6) = [2^3]S(3) = 2 wr S(3)", "C2xS4", 48),
+        (12, "PSL(2,5) = A_5(6)", "A5(6)", 60),
+        (13, "F_36(6):2 = [S(3)^2]2 = S(3) wr 2", "C3^2:D4", 72),
+        (14, "PGL(2,5) = S_5(6)", "S5(6)", 120),
+        (15, "A6", "A6", 360),
+        (16, "S6", "S6", 720),
+    ],
+}
+
+# Labels learned at run time from PARI groups of degrees outside the table
+_LEARNED_LABELS = {}
+
+
+def group_id(deg, t):
+    """Id of the transitive group deg T t."""
+    return deg * GROUP_ID_BASE + t
+
+def group_degree(gid):
+    return gid // GROUP_ID_BASE
+
+def transitive_number(gid):
+    return gid % GROUP_ID_BASE
+
+def group_code(gid):
+    """Transitive group code, e.g. 4003 -> "4T3"."""
+    return f"{group_degree(gid)}T{transitive_number(gid)}"
+
+def short_label(label):
+    """Part of a PARI label before "=", as used for census file names."""
+    return label.split("=", 1)[0].strip()
+
+def _entry(gid):
+    for t, label, name, order in TRANSITIVE_GROUPS.get(group_degree(gid), []):
+        if t == transitive_number(gid):
+            return label, name, order
+    return None
+
+def group_label(gid):
+    """PARI's full label of a group id (e.g. 4001 -> "C(4) = 4"), else its code."""
+    entry = _entry(gid)
+    if entry is not None:
+        return entry[0]
+    learned = [label for label, g in _LEARNED_LABELS.items() if g == gid]
+    return learned[0] if learned else group_code(gid)
+
+def group_file_label(gid):
+    """Canonical census file stem of a group id: the short PARI label."""
+    return short_label(group_label(gid))
+
+def group_name(gid):
+    """Display name of a group id (e.g. 5003 -> "F20"), else its code."""
+    entry = _entry(gid)
+    return entry[1] if entry is not None else group_code(gid)
+
+def group_order(gid):
+    """Order of the group, or None outside the table."""
+    entry = _entry(gid)
+    return entry[2] if entry is not None else None
+
+def _spellings():
+    """{spelling: [ids]} over the table: full and short labels, names, codes."""
+    table = {}
+    for deg, groups in TRANSITIVE_GROUPS.items():
+        for t, label, name, _ in groups:
+            gid = group_id(deg, t)
+            for spelling in {label, short_label(label), name, group_code(gid)}:
+                table.setdefault(spelling, set()).add(gid)
+    return table
+
+_SPELLINGS = _spellings()
+
+def normalize_group(label, deg=None):
+    """
+    Group id of any spelling of a group: a full or short PARI label
+    ("C(4) = 4", "C(4)"), a census file name ("C(4) = 4.txt"), a code
+    ("4T1"), a display name ("C4") or an id (4001, "4001"). deg resolves
+    names shared by several degrees. Raises ValueError if it is unknown
+    or ambiguous.
+    """
+    if isinstance(label, int):
+        return label
+    text = label.strip()
+    stem, ext = os.path.splitext(text)
+    if ext in (".txt", ".npy", ".csv"):
+        text = stem
+    if text.isdigit():
+        return int(text)
+    for spelling in (text, short_label(text)):
+        if spelling in _LEARNED_LABELS:
+            return _LEARNED_LABELS[spelling]
+        ids = _SPELLINGS.get(spelling, set())
+        if deg is not None:
+            ids = {gid for gid in ids if group_degree(gid) == deg}
+        if len(ids) == 1:
+            return next(iter(ids))
+        if len(ids) > 1:
+            raise ValueError(f"Group '{label}' is ambiguous without its degree")
+    raise ValueError(f"Unknown Galois group label '{label}'")
+
+def try_normalize_group(label, deg=None):
+    """normalize_group, or None for unknown labels."""
+    try:
+        return normalize_group(label, deg)
+    except ValueError:
+        return None
+
+def register_group_label(label, gid):
+    """Remember the id of a PARI label outside the table (degree > 6)."""
+    if try_normalize_group(label, group_degree(gid)) is None:
+        _LEARNED_LABELS[label] = gid
+        _LEARNED_LABELS[short_label(label)] = gid
+
+def pari_group_id(G):
+    """Id of a Sage PariGroup (galois_group(pari_group=True)); registers its label."""
+    gid = group_id(int(G.degree()), int(G.transitive_number()))
+    register_group_label(str(G.label()), gid)
+    return gid
+
+def canonical_file_label(label, deg=None):
+    """
+    Census file stem of a PARI label: the short label of its group id, so
+    "C(4) = 4" and "C(4)" land in the same file; unknown labels keep their
+    short label.
+    """
+    gid = try_normalize_group(label, deg)
+    return short_label(label) if gid is None else group_file_label(gid)
+
+def census_group_of_file(filename, deg=None):
+    """
+    (canonical short label, group id) of a census group file name, for
+    pipelines that label their rows by the file they read; the id is None
+    for groups outside the table.
+    """
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    gid = try_normalize_group(stem, deg)
+    return (short_label(stem) if gid is None else group_file_label(gid)), gid
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+"""
+Persistent Galois label cache shared by the census scripts, the
+verification script and the pipelines.
+
+Labels are PARI's full group labels (e.g. "C(4) = 4"), keyed by the degree
+and the census coefficient tuple (a_{deg-1}, ..., a_0) of a monic integer
+polynomial. The cache is a single SQLite file: lookups and inserts are
+batched, and in the parallel census only the main process writes while
+the workers open it read-only.
+
+Nothing in here needs Sage.
+"""
+
+import os
+import sqlite3
+
+DEFAULT_CACHE_PATH = "galois_label_cache.sqlite"
+LOOKUP_BATCH = 500         # Keys per SELECT ... IN (...) query
+INSERT_BATCH = 10000       # Pending inserts before an automatic flush
+
+
+def coeffs_key(coeffs):
+    """Text key of a coefficient tuple, e.g. (1, -2, 0) -> "1,-2,0"."""
+    return ",".join(str(int(c)) for c in coeffs)
+
+def census_coeffs(coefficients):
+    """
+    Census tuple (a_{deg-1}, ..., a_0) of a monic polynomial given by its
+    coefficient list from the constant term up (Sage's f.list()), or None
+    if the polynomial is not monic with integer coefficients.
+    """
+    coefficients = list(coefficients)
+    if len(coefficients) < 2 or coefficients[-1] != 1:
+        return None
+    if any(c != int(c) for c in coefficients):
+        return None
+    return tuple(int(c) for c in reversed(coefficients[:-1]))
+
+
+class GaloisLabelCache:
+    """
+    SQLite-backed map (deg, coefficient tuple) -> Galois group label.
+
+    Use get_many() for batched lookups and add()/add_many() to queue
+    inserts; queued labels are written by flush() (automatically every
+    INSERT_BATCH inserts, and on close). A read-only cache never writes and
+    requires the file to exist.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, readonly=False):
+        self.path = path
+        self.readonly = readonly
+        self.pending = []
+        if readonly:
+            self.connection = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+        else:
+            self.connection = sqlite3.connect(path)
+            # WAL lets read-only workers query while the main process writes
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS labels ("
+                " deg INTEGER NOT NULL, coeffs TEXT NOT NULL, label TEXT NOT NULL,"
+                " PRIMARY KEY (deg, coeffs)) WITHOUT ROWID"
+            )
+            self.connection.commit()
+
+    def get(self, coeffs):
+        """Label of one coefficient tuple, or None."""
+        return self.get_many([coeffs]).get(tuple(coeffs))
+
+    def get_many(self, coeffs_list):
+        """{coefficient tuple: label} for the tuples found in the cache."""
+        by_key = {}
+        for coeffs in coeffs_list:
+            coeffs = tuple(coeffs)
+            by_key.setdefault((len(coeffs), coeffs_key(coeffs)), coeffs)
+
+        found = {}
+        keys = list(by_key)
+        for deg in {deg for deg, _ in keys}:
+            texts = [text for d, text in keys if d == deg]
+            for lo in range(0, len(texts), LOOKUP_BATCH):
+                batch = texts[lo:lo + LOOKUP_BATCH]
+                rows = self.connection.execute(
+                    "SELECT coeffs, label FROM labels WHERE deg = ? AND coeffs IN "
+                    f"({','.join('?' * len(batch))})",
+                    [deg] + batch,
+                )
+                for text, label in rows:
+                    found[by_key[(deg, text)]] = label
+        return found
+
+    def add(self, coeffs, label):
+        """Queue the label of one coefficient tuple."""
+        self.add_many([(coeffs, label)])
+
+    def add_many(self, items):
+        """Queue (coefficient tuple, label) pairs."""
+        if self.readonly:
+            raise RuntimeError(f"Label cache '{self.path}' is open read-only")
+        self.pending.extend((len(coeffs), coeffs_key(coeffs), label) for coeffs, label in items)
+        if len(self.pending) >= INSERT_BATCH:
+            self.flush()
+
+    def flush(self):
+        """Write the queued labels in one transaction."""
+        if not self.pending:
+            return
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO labels (deg, coeffs, label) VALUES (?, ?, ?)",
+                self.pending,
+            )
+        self.pending = []
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM labels").fetchone()[0]
+
+    def close(self):
+        if not self.readonly:
+            self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class NullLabelCache:
+    """Stand-in for GaloisLabelCache when caching is disabled (--no-cache)."""
+
+    def get(self, coeffs):
+        return None
+
+    def get_many(self, coeffs_list):
+        return {}
+
+    def add(self, coeffs, label):
+        pass
+
+    def add_many(self, items):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_label_cache(path, enabled=True, readonly=False):
+    """GaloisLabelCache at path, or a NullLabelCache when caching is disabled."""
+    if not enabled or path is None:
+        return NullLabelCache()
+    return GaloisLabelCache(path, readonly=readonly)
+
+def cached_label(cache, coefficients, compute):
+    """
+    Label of the polynomial with the given coefficient list (constant term
+    first, as Sage's f.list()) from the cache, or compute() stored in it.
+    Polynomials that are not monic integer polynomials bypass the cache.
+    """
+    key = census_coeffs(coefficients)
+    label = cache.get(key) if key is not None else None
+    if label is None:
+        label = compute()
+        if key is not None:
+            cache.add(key, label)
+    return label
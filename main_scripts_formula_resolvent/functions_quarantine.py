@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+"""
+Per-polynomial time budget of the Galois computations.
+
+A handful of polynomials make is_irreducible() or
+galois_group(pari_group=True) take orders of magnitude longer than the
+rest. time_limit(seconds) interrupts such a computation with cysignals'
+alarm(), which stops PARI and Sage code in the middle, and raises
+ItemTimeout instead; the caller moves the polynomial to a quarantine file
+(one JSON object per line, with the stage that ran out of time and the
+timings) and carries on. A later low-priority pass retries the
+quarantined polynomials with a larger budget.
+
+Only time_limit() needs Sage (cysignals ships with it).
+"""
+
+import os
+import json
+import time
+from contextlib import contextmanager
+
+ITEM_TIMEOUT = 300.0       # Default budget of one polynomial, in seconds
+RETRY_TIMEOUT = 3600.0     # Default budget of the retry pass
+RETRY_NICENESS = 19        # Priority of the retry pass (os.nice increment)
+
+
+class ItemTimeout(Exception):
+    """A computation ran longer than its time budget."""
+
+    def __init__(self, seconds):
+        super().__init__(f"time budget of {seconds:g}s exceeded")
+        self.seconds = seconds
+
+
+@contextmanager
+def time_limit(seconds):
+    """Raise ItemTimeout if the block runs longer than seconds (None or 0: no limit)."""
+    if not seconds:
+        yield
+        return
+    from cysignals.alarm import alarm, cancel_alarm, AlarmInterrupt
+    alarm(seconds)
+    try:
+        yield
+    except AlarmInterrupt:
+        raise ItemTimeout(seconds) from None
+    finally:
+        cancel_alarm()
+
+
+def quarantine_entry(coeffs, polynomial, stage, budget, elapsed, **context):
+    """
+    Quarantine entry of a polynomial that ran out of time: its census tuple (if
+    known) and string, the stage ("irreducibility" or "galois"), the
+    budget and the time it had run, plus context such as its index range
+    or source file.
+    """
+    entry = {
+        "coeffs": None if coeffs is None else [int(c) for c in coeffs],
+        "polynomial": str(polynomial),
+        "stage": stage,
+        "budget": budget,
+        "elapsed": round(elapsed, 3),
+        "time": round(time.time(), 3),
+        "retries": 0,
+    }
+    entry.update(context)
+    return entry
+
+
+def read_quarantine(path):
+    """Entries of a quarantine file (empty if it does not exist)."""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def write_quarantine(path, entries):
+    """Replace a quarantine file with entries; an empty list removes it."""
+    if not entries:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+    os.replace(tmp_path, path)
+
+
+def retried_entry(entry, elapsed, budget):
+    """A quarantine entry after another attempt that ran out of time."""
+    entry = dict(entry)
+    entry["retries"] = entry.get("retries", 0) + 1
+    entry["retry_budget"] = budget
+    entry["retry_elapsed"] = round(elapsed, 3)
+    return entry
+
+
+def lower_priority():
+    """Run the calling process at the lowest CPU priority (retry passes)."""
+    try:
+        os.nice(RETRY_NICENESS)
+    except OSError:
+        pass
@@ -127,6 +127,33 @@ def calc_vieta_sum(j):
     fixed_terms = common_calc(j)
     return [term.subs(vietas_dict(j)) for term in fixed_terms]
 
+def term_weight(term, j):
+    """
+    Weighted degree of a Vieta term under x -> lambda*x, where the
+    coefficient symbols b, c, d, ... (coefficients of x^(j-1), x^(j-2), ...)
+    carry weights 1, 2, 3, ...  Returns None for a zero term and raises
+    ValueError if the term is not weighted-homogeneous.
+    """
+    if term.is_zero():
+        return None
+    coeff_symbols = [a, b, c, d, e_coef, f, g, h, i_coef][: j + 1]
+    P = PolynomialRing(QQ, [str(s) for s in coeff_symbols])
+    poly = term.expand().polynomial(QQ, ring=P)
+    weights = {
+        sum(k * e for k, e in enumerate(exps))
+        for exps in poly.exponents()
+    }
+    if len(weights) != 1:
+        raise ValueError(f"Term {term} is not weighted-homogeneous")
+    return weights.pop()
+
+def calc_vieta_weights(j):
+    """
+    Returns the weight of each term of calc_vieta_sum(j): substituting
+    x -> lambda*x multiplies the i-th term by lambda^weights[i].
+    """
+    return [term_weight(term, j) for term in calc_vieta_sum(j)]
+
 def calc_rootis(j):
     """
     Returns the 'fixed' terms with the elementary‐symmetric expansions
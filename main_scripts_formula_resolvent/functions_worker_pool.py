@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+
+"""
+Process pool that recycles its workers, for census workers whose PARI and
+Sage memory grows over hours of work.
+
+RecyclingPool(processes, initializer, initargs, max_tasks, max_rss) keeps
+`processes` workers running. After every task a worker compares its
+resident memory (/proc/self/statm) and its task count with the limits;
+past either one it finishes the task, sends a retire message and exits,
+and the pool starts a replacement right away, so the pool stays at full
+width. A worker that dies (e.g. killed by the OOM killer) is replaced as
+well and the tasks it held are handed to other workers; a task that
+kills MAX_TASK_DEATHS workers aborts the run.
+
+Each worker holds at most `prefetch` tasks, and tasks are taken from the
+input iterable only as workers have room, so a long lazy iterable of
+index ranges is never materialised.
+
+Nothing in here needs Sage.
+"""
+
+import os
+import time
+import queue
+import traceback
+import multiprocessing
+from collections import deque
+
+PREFETCH = 2               # Tasks queued per worker, including the one it runs
+POLL_SECONDS = 1.0         # How often the pool looks for dead workers while waiting
+MAX_TASK_DEATHS = 3        # Workers a single task may kill before the run is aborted
+
+
+def resident_memory():
+    """Resident set size of this process in bytes, or None if unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+def _worker_loop(wid, inbox, results, initializer, initargs, max_tasks, max_rss):
+    """Run tasks from inbox until a None sentinel or until a limit is reached."""
+    if initializer is not None:
+        initializer(*initargs)
+    done = 0
+    while True:
+        item = inbox.get()
+        if item is None:
+            return
+        seq, func, task = item
+        try:
+            results.put(("result", wid, seq, func(task)))
+        except Exception as error:
+            results.put(("error", wid, seq,
+                         f"{type(error).__name__}: {error}\n{traceback.format_exc()}"))
+        done += 1
+        rss = resident_memory() if max_rss else None
+        if (max_tasks and done >= max_tasks) or (rss is not None and rss > max_rss):
+            results.put(("retire", wid, done, rss))
+            return
+
+
+class _Worker:
+    """A worker process, its inbox and the sequence numbers of the tasks it holds."""
+
+    def __init__(self, wid, process, inbox):
+        self.wid = wid
+        self.process = process
+        self.inbox = inbox
+        self.held = []
+
+
+class RecyclingPool:
+    """
+    Pool of `processes` workers that run initializer(*initargs) once and
+    are replaced after max_tasks tasks or once their resident memory
+    exceeds max_rss bytes (None: no limit). imap() and imap_unordered()
+    work like those of multiprocessing.Pool; a task that raises aborts the
+    iteration with a RuntimeError carrying the worker's traceback.
+    """
+
+    def __init__(self, processes, initializer=None, initargs=(), max_tasks=None,
+                 max_rss=None, prefetch=PREFETCH):
+        self.processes = processes
+        self.initializer = initializer
+        self.initargs = initargs
+        self.max_tasks = max_tasks
+        self.max_rss = max_rss
+        self.prefetch = prefetch
+        self.results = multiprocessing.Queue()
+        self.workers = {}
+        self.next_wid = 0
+        self.retired = 0       # Workers replaced after reaching a limit
+        self.died = 0          # Workers replaced after dying
+        self.requeued = 0      # Tasks handed to another worker after a death
+        for _ in range(processes):
+            self._start_worker()
+
+    def _start_worker(self):
+        wid = self.next_wid
+        self.next_wid += 1
+        inbox = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=_worker_loop, daemon=True,
+            args=(wid, inbox, self.results, self.initializer, self.initargs,
+                  self.max_tasks, self.max_rss),
+        )
+        process.start()
+        self.workers[wid] = _Worker(wid, process, inbox)
+
+    def _replace_worker(self, wid):
+        """Reap a worker that has exited and start its replacement; returns its held tasks."""
+        worker = self.workers.pop(wid)
+        worker.process.join()
+        worker.inbox.cancel_join_thread()
+        worker.inbox.close()
+        self._start_worker()
+        return worker.held
+
+    def imap_unordered(self, func, tasks):
+        """Results of func over tasks, in completion order."""
+        for _, result in self._run(func, tasks):
+            yield result
+
+    def imap(self, func, tasks):
+        """Results of func over tasks, in task order."""
+        waiting = {}
+        next_seq = 0
+        for seq, result in self._run(func, tasks):
+            waiting[seq] = result
+            while next_seq in waiting:
+                yield waiting.pop(next_seq)
+                next_seq += 1
+
+    def _run(self, func, tasks):
+        """(sequence number, result) pairs of func over tasks as they complete."""
+        tasks = iter(tasks)
+        exhausted = False
+        pending = {}           # seq -> task, until its result arrives
+        retry = deque()        # seqs whose worker retired or died before running them
+        deaths = {}            # seq -> workers that died holding it
+        seq = 0
+        last_check = time.monotonic()
+        while True:
+            # Hand out tasks (retried ones first) while workers have room
+            for worker in self.workers.values():
+                while len(worker.held) < self.prefetch:
+                    while retry and retry[0] not in pending:
+                        retry.popleft()
+                    if retry:
+                        task_seq = retry.popleft()
+                    elif not exhausted:
+                        try:
+                            pending[seq] = next(tasks)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        task_seq, seq = seq, seq + 1
+                    else:
+                        break
+                    worker.held.append(task_seq)
+                    worker.inbox.put((task_seq, func, pending[task_seq]))
+            if exhausted and not pending:
+                return
+
+            try:
+                message = self.results.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                message = None
+            if message is None or time.monotonic() - last_check >= POLL_SECONDS:
+                # Replace dead workers and retry the tasks they held
+                last_check = time.monotonic()
+                for wid, worker in list(self.workers.items()):
+                    # A clean exit is a retirement whose message is on its way
+                    if worker.process.is_alive() or worker.process.exitcode == 0:
+                        continue
+                    held = [s for s in self._replace_worker(wid) if s in pending]
+                    self.died += 1
+                    self.requeued += len(held)
+                    for s in held:
+                        deaths[s] = deaths.get(s, 0) + 1
+                        if deaths[s] >= MAX_TASK_DEATHS:
+                            raise RuntimeError(f"Task {pending[s]} killed {deaths[s]} workers")
+                    retry.extendleft(reversed(held))
+            if message is None:
+                continue
+
+            kind, wid = message[0], message[1]
+            worker = self.workers.get(wid)
+            if kind == "retire":
+                self.retired += 1
+                retry.extendleft(reversed(self._replace_worker(wid)))
+            elif kind == "error":
+                raise RuntimeError(f"Task {pending.get(message[2])} failed in a worker:\n"
+                                   f"{message[3]}")
+            else:
+                task_seq, result = message[2], message[3]
+                if worker is not None and task_seq in worker.held:
+                    worker.held.remove(task_seq)
+                # A late result of a task that was already retried is dropped
+                if task_seq in pending:
+                    del pending[task_seq]
+                    yield task_seq, result
+
+    def close(self):
+        """Let every worker finish its queued tasks and exit."""
+        for worker in self.workers.values():
+            worker.inbox.put(None)
+
+    def terminate(self):
+        """Stop every worker immediately, dropping queued tasks."""
+        for worker in self.workers.values():
+            worker.process.terminate()
+
+    def join(self):
+        for worker in self.workers.values():
+            worker.process.join()
+            worker.inbox.cancel_join_thread()
+        self.results.cancel_join_thread()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.terminate()
+        self.join()
@@ -1,26 +1,62 @@
 #!/usr/bin/env sage -python
 
-from sage.all import PolynomialRing, QQ
 import sys
+import time
+import random
+
+from functions_census import box_size, polynomial_string
+from functions_galois_fast import coefficient_block, reducibility_prefilter, classify_cubics
 
 # Get user-defined range n (defaults to 5 if not provided)
 n = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+# "--benchmark [SAMPLE]" compares against PARI on SAMPLE random irreducible cubics
+benchmark = "--benchmark" in sys.argv[2:]
+sample_size = int(sys.argv[3]) if benchmark and len(sys.argv) > 3 else 10000
+
+print(f"Iterating over all cubic polynomials x^3 + b x^2 + c x + d, with b, c, d in [-{n}, {n}]\n")
+
+# Classify the whole box at once: rational root test for irreducibility,
+# then A3 / S3 from the exact square test on the integer discriminant
+start = time.perf_counter()
+block = coefficient_block(0, box_size(n, 3), n, 3)
+_, irreducible = reducibility_prefilter(block)
+cubics = block[irreducible]
+labels = classify_cubics(cubics)
+fast_seconds = time.perf_counter() - start
+
+if not benchmark:
+    # Batch output, one line per irreducible cubic
+    batch = 10000
+    rows = cubics.tolist()
+    for lo in range(0, len(rows), batch):
+        sys.stdout.write("".join(
+            f"f(x) = {polynomial_string(coeffs)}    Galois group: {symbol}\n"
+            for coeffs, symbol in zip(rows[lo:lo + batch], labels[lo:lo + batch])
+        ))
+    sys.exit(0)
+
+# Benchmark: PARI on a random sample of the same irreducible cubics
+from sage.all import PolynomialRing, QQ
 
-# Define a polynomial ring in x over Q
 R = PolynomialRing(QQ, 'x')
 x = R.gen()
 
-print(f"Iterating over all cubic polynomials x^3 + b x^2 + c x + d, with b, c, d in [-{n}, {n}]\n")
+sample = random.Random(0).sample(range(len(cubics)), min(sample_size, len(cubics)))
+mismatches = 0
+start = time.perf_counter()
+for row in sample:
+    b, c, d = cubics[row].tolist()
+    f = x**3 + b*x**2 + c*x + d
+    symbol = f.galois_group(pari_group=True).label()
+    if symbol != labels[row]:
+        mismatches += 1
+        print(f"Mismatch for f(x) = {f}: PARI {symbol}, fast {labels[row]}")
+pari_seconds = time.perf_counter() - start
 
-# Loop over all combinations of b, c, d
-for b in range(-n, n + 1):
-    for c in range(-n, n + 1):
-        for d in range(-n, n + 1):
-            f = x**3 + b*x**2 + c*x + d
-
-            # Check irreducibility
-            if f.is_irreducible():
-                # Compute Galois group and extract PARI group name
-                G = f.galois_group(pari_group=True)
-                symbol = G.label()  # Correct way to get the name like "S3", "A3"
-                print(f"f(x) = {f}    Galois group: {symbol}")
+per_poly_fast = fast_seconds / max(len(block), 1)
+per_poly_pari = pari_seconds / max(len(sample), 1)
+print(f"Fast path: {len(block)} cubics ({len(cubics)} irreducible) in {fast_seconds:.2f}s "
+      f"({per_poly_fast * 1e6:.2f} us per cubic)")
+print(f"PARI path: {len(sample)} irreducible cubics in {pari_seconds:.2f}s "
+      f"({per_poly_pari * 1e6:.2f} us per cubic, ~{per_poly_pari * len(cubics):.0f}s for the box)")
+print(f"Mismatches: {mismatches}")
@@ -5,9 +5,15 @@ import sys
 from itertools import product
 import os
 
+from functions_census import flip_coeffs, is_flip_canonical
+from functions_label_cache import DEFAULT_CACHE_PATH, open_label_cache
+from functions_group_ids import canonical_file_label
+
 # Parse command-line arguments
 n = int(sys.argv[1]) if len(sys.argv) > 1 else 5       # coefficient range: -n to n
 deg = int(sys.argv[2]) if len(sys.argv) > 2 else 3     # polynomial degree
+flip = "--flip" in sys.argv[3:]                         # classify one of f(x), (-1)^deg f(-x)
+use_cache = "--no-cache" not in sys.argv[3:]            # persistent Galois label cache
 
 # Define a polynomial ring in x over Q
 R = PolynomialRing(QQ, 'x')
@@ -19,22 +25,38 @@ print(f"Generating all monic degree-{deg} polynomials with coefficients in [-{n}
 output_dir = f"galois_deg{deg}_range{n}"
 os.makedirs(output_dir, exist_ok=True)
 
+# Labels computed by earlier runs are looked up before calling PARI
+label_cache = open_label_cache(DEFAULT_CACHE_PATH, enabled=use_cache)
+
 # Loop through all coefficient combinations
 for coeffs in product(range(-n, n + 1), repeat=deg):
+    # (-1)^deg f(-x) has the same Galois group: only classify one of the pair
+    if flip and not is_flip_canonical(coeffs):
+        continue
+
     # Create monic polynomial: x^deg + a_{deg-1}x^{deg-1} + ... + a_0
     f = x**deg + sum(c * x**i for i, c in enumerate(reversed(coeffs)))
 
-    # Check if irreducible
-    if f.is_irreducible():
+    # Check if irreducible (cached tuples are)
+    group_name = label_cache.get(coeffs)
+    if group_name is not None or f.is_irreducible():
         try:
-            G = f.galois_group(pari_group=True)
-            group_name = G.label()
+            if group_name is None:
+                G = f.galois_group(pari_group=True)
+                group_name = G.label()
+                label_cache.add(coeffs, group_name)
 
-            # Write polynomial to corresponding file
-            filename = os.path.join(output_dir, f"{group_name}.txt")
+            # Write polynomial (and its flip) to corresponding file
+            filename = os.path.join(output_dir, f"{canonical_file_label(group_name, deg)}.txt")
             with open(filename, 'a') as file:
                 file.write(f"{f}\n")
+                flipped = flip_coeffs(coeffs)
+                if flip and flipped != coeffs:
+                    g = x**deg + sum(c * x**i for i, c in enumerate(reversed(flipped)))
+                    file.write(f"{g}\n")
 
         except Exception as e:
             # Optionally log this
             print(f"Error computing Galois group for f(x) = {f}: {e}")
+
+label_cache.close()
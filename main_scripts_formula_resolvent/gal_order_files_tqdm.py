@@ -1,44 +1,113 @@
 #!/usr/bin/env sage -python
 
-import sys
 import os
-from itertools import product
+import sys
+import time
+import argparse
 from sage.all import PolynomialRing, QQ
 from tqdm import tqdm
 
-# Parse command-line arguments
-n = int(sys.argv[1]) if len(sys.argv) > 1 else 5       # coefficient range: -n to n
-deg = int(sys.argv[2]) if len(sys.argv) > 2 else 3     # polynomial degree
+from functions_census import (
+    box_size, iter_index_range, parse_shard, shard_bounds,
+    flip_coeffs, is_flip_canonical, GroupFileWriter, CensusManifest, census_output_dir,
+)
+from functions_label_cache import DEFAULT_CACHE_PATH, open_label_cache
+from functions_group_ids import canonical_file_label
+from functions_census_metrics import CensusMetrics, WorkerSlot, METRICS_NAME
+
+# Parse command-line arguments:
+#   n   -> coefficient range -n to n
+#   deg -> polynomial degree
+#   --shard i/N -> only enumerate the i-th of N contiguous index ranges
+#   --restart   -> discard previous results instead of resuming
+#   --flip      -> classify one of f(x) and (-1)^deg f(-x), write both
+#   --cache PATH / --no-cache -> persistent Galois label cache consulted first
+# Throughput, time split, group counts and the ETA are appended to
+# census_metrics.jsonl in the output directory every 30 seconds.
+parser = argparse.ArgumentParser(description="Serial Galois census of monic polynomials.")
+parser.add_argument("n", type=int, nargs="?", default=5)
+parser.add_argument("deg", type=int, nargs="?", default=3)
+parser.add_argument("--shard", default=None, metavar="i/N")
+parser.add_argument("--restart", action="store_true")
+parser.add_argument("--flip", action="store_true")
+parser.add_argument("--cache", default=DEFAULT_CACHE_PATH)
+parser.add_argument("--no-cache", action="store_true")
+args = parser.parse_args(sys.argv[1:])
+n, deg = args.n, args.deg
+shard_i, num_shards = parse_shard(args.shard)
 
 # Define a polynomial ring in x over Q
 R = PolynomialRing(QQ, 'x')
 x = R.gen()
 
-print(f"Generating all monic degree-{deg} polynomials with coefficients in [-{n}, {n}]...\n")
+print(f"Generating all monic degree-{deg} polynomials with coefficients in [-{n}, {n}]"
+      f" (shard {shard_i}/{num_shards})...\n")
+
+# Directory to hold output files; its manifest lets an interrupted run resume
+output_dir = census_output_dir(deg, n, shard_i, num_shards)
+manifest = CensusManifest.open(
+    output_dir,
+    {"n": n, "deg": deg, "shard": [shard_i, num_shards], "labels": "full",
+     "symmetries": ["flip"] if args.flip else []},
+    restart=args.restart,
+)
+
+# Index range of this shard; index i is the i-th element of
+# product(range(-n, n + 1), repeat=deg), i.e. (a_{deg-1}, ..., a_0)
+start, stop = shard_bounds(box_size(n, deg), shard_i, num_shards)
+
+# Throughput, reducibility/Galois time split, group counts and ETA go to
+# census_metrics.jsonl (one slot: this process is the only worker)
+metrics = CensusMetrics(os.path.join(output_dir, METRICS_NAME), 1, deg,
+                        stop - start - manifest.completed_count(start, stop), (shard_i, num_shards))
+slot = WorkerSlot.claim(*metrics.worker_args())
 
-# Directory to hold output files
-output_dir = f"galois_deg{deg}_range{n}"
-os.makedirs(output_dir, exist_ok=True)
+with GroupFileWriter(output_dir) as writer, \
+        open_label_cache(args.cache, enabled=not args.no_cache) as label_cache, \
+        tqdm(total=stop - start, initial=manifest.completed_count(start, stop),
+             desc="Processing Polynomials") as progress, metrics:
+    for index_range in manifest.pending_ranges(start, stop, 4096):
+        slot.start_task(*index_range)
+        # (-1)^deg f(-x) has the same Galois group: classify one of the pair
+        tuples = [coeffs for coeffs in iter_index_range(*index_range, n, deg)
+                  if not args.flip or is_flip_canonical(coeffs)]
+        # Cached tuples are irreducible and already labelled
+        cached = label_cache.get_many(tuples)
 
-# Total number of coefficient combinations
-total_combinations = (2*n + 1)**deg
+        for coeffs in tuples:
+            # Create monic polynomial: x^deg + a_{deg-1}x^{deg-1} + ... + a_0
+            slot.heartbeat(coeffs)
+            f = x**deg + sum(c * x**i for i, c in enumerate(reversed(coeffs)))
 
-# Wrap the product in tqdm for a progress bar
-for coeffs in tqdm(product(range(-n, n + 1), repeat=deg), total=total_combinations, desc="Processing Polynomials"):
-    # Create monic polynomial: x^deg + a_{deg-1}x^{deg-1} + ... + a_0
-    f = x**deg + sum(c * x**i for i, c in enumerate(reversed(coeffs)))
+            # Check if irreducible
+            started = time.perf_counter()
+            irreducible = coeffs in cached or f.is_irreducible()
+            slot.add_time("reducibility", time.perf_counter() - started)
+            if irreducible:
+                try:
+                    group_name = cached.get(coeffs)
+                    if group_name is None:
+                        started = time.perf_counter()
+                        G = f.galois_group(pari_group=True)
+                        group_name = G.label()
+                        slot.add_time("galois", time.perf_counter() - started)
+                        label_cache.add(coeffs, group_name)
 
-    # Check if irreducible
-    if f.is_irreducible():
-        try:
-            G = f.galois_group(pari_group=True)
-            group_name = G.label()
+                    # Write polynomial (and its flip) to corresponding file
+                    polys = [str(f)]
+                    flipped = flip_coeffs(coeffs)
+                    if args.flip and flipped != coeffs:
+                        polys.append(str(x**deg + sum(c * x**i for i, c in enumerate(reversed(flipped)))))
+                    writer.write(canonical_file_label(group_name, deg), polys)
+                    metrics.add_group(canonical_file_label(group_name, deg), len(polys))
 
-            # Write polynomial to corresponding file
-            filename = os.path.join(output_dir, f"{group_name}.txt")
-            with open(filename, 'a') as file:
-                file.write(f"{f}\n")
+                except Exception as e:
+                    # Optionally log this
+                    print(f"Error computing Galois group for f(x) = {f}: {e}")
 
-        except Exception as e:
-            # Optionally log this
-            print(f"Error computing Galois group for f(x) = {f}: {e}")
+        slot.finish_task(index_range[1] - index_range[0])
+        manifest.mark_done(index_range)
+        manifest.maybe_checkpoint(writer)
+        progress.update(index_range[1] - index_range[0])
+        progress.set_postfix(galois=f"{100 * metrics.stage_fractions()['galois']:.0f}%")
+    manifest.checkpoint(writer)
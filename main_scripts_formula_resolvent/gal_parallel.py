@@ -3,130 +3,1047 @@
 import sys
 import os
 import gc
-from itertools import product
-from multiprocessing import Pool, Lock, cpu_count
+import json
+import argparse
+import random
+import time
+import numpy as np
+from multiprocessing import cpu_count
 
 # Sage imports
-from sage.all import PolynomialRing, QQ
+from sage.all import PolynomialRing, QQ, pari
+
+from functions_census import (
+    box_size, parse_shard, shard_bounds, height, complete_height, CENSUS_ORDERS,
+    CENSUS_SYMMETRIES, is_class_representative, class_members, GroupFileWriter,
+    CensusManifest, census_output_dir, merge_census_dirs, FIELDS_NAME, MANIFEST_NAME,
+    QUARANTINE_NAME,
+    attach_census_base, census_index_total, census_is_complete, parse_constraints,
+    census_population, IndexPermutation, GroupStatistics, SAMPLE_STATS_NAME, CENSUS_FORMATS,
+    polynomial_string, GenericGroupCounts, GENERIC_COUNTS_NAME, GENERIC_SAMPLE_SUFFIX,
+)
+from functions_galois_fast import (
+    coefficient_block, shell_block, height_block, constrained_block, coefficient_rows,
+    constrained_rows, permuted_indices, reducibility_prefilter, fast_galois_labels,
+    symmetric_group_label,
+)
+from functions_label_cache import DEFAULT_CACHE_PATH, open_label_cache
+from functions_group_ids import canonical_file_label, pari_group_id
+from functions_census_metrics import (
+    CensusMetrics, WorkerSlot, METRICS_NAME, METRICS_INTERVAL, STALL_SECONDS,
+)
+from functions_worker_pool import RecyclingPool
+from functions_quarantine import (
+    ITEM_TIMEOUT, RETRY_TIMEOUT, ItemTimeout, time_limit, quarantine_entry, read_quarantine,
+    write_quarantine, retried_entry, lower_priority,
+)
+
+# -----------------------------------------------------------
+# SETTINGS
+# -----------------------------------------------------------
+TASK_SIZE = 4096       # Consecutive box indices handled by one task
+GC_INTERVAL = 1000     # Galois computations between two gc.collect() calls
+FIELD_CACHE_LIMIT = 1_000_000   # Fields remembered per worker with --fields
+NUM_PROCS = 8          # Worker processes (--processes; 0 uses every core)
+MAX_WORKER_RSS_MB = 2048   # A worker above this resident memory is replaced
+MAX_WORKER_TASKS = 1000    # Ranges a worker handles before it is replaced
 
 # -----------------------------------------------------------
-# GLOBALS (accessible by all worker processes)
+# WORKER GLOBALS (set once per worker process by init_worker)
 # -----------------------------------------------------------
-WRITE_LOCK = None      # A lock for writing to files safely
-OUTPUT_DIR = None      # The output directory path
+X = None               # Generator of PolynomialRing(QQ, 'x')
+DEG = None             # Polynomial degree
+N = None               # Coefficient range [-N..N]
+N_INNER = None         # With --extend-from: only the shell outside [-N_INNER..N_INNER]
+ORDER = "lex"          # Enumeration order of the index space (CENSUS_ORDERS)
+CONSTRAINTS = None     # With --constraints: CoefficientConstraints of the enumeration
+PERMUTATION = None     # With --sample/--stratify: IndexPermutation of sample positions
+FORMAT = "txt"         # Group files: polynomial strings (txt) or coefficient matrices (npy)
+GENERIC = None         # With --count-generic: {"sample_size", "seed"} of the generic counts
+GENERIC_LABEL = None   # Label of the generic group S_deg
+SYMMETRIES = ()        # Symmetry classes classified once (see functions_census)
+FAST = False           # Try exact integer classifiers before PARI
+CROSSCHECK = 0.0       # Fraction of fast labels re-computed with PARI
+FIELDS = False         # Identify fields with polredabs, one Galois group per field
+FIELD_CACHE = {}       # polredabs polynomial -> Galois group label
+LABEL_CACHE = None     # Read-only persistent label cache (functions_label_cache)
+GALOIS_SINCE_GC = 0    # Galois computations since the last gc.collect()
+METRICS = None         # This worker's WorkerSlot of the shared metrics counters
+TIMEOUT = None         # Time budget of one polynomial in seconds (None: no limit)
 
 def parse_arguments():
     """
     Parse command line arguments:
        1) n   -> range [-n..n]
        2) deg -> polynomial degree
+       --scaling -> only classify primitive representatives of each
+                    x -> lambda*x scaling class (see functions_census)
+       --flip -> only classify one of f(x) and (-1)^deg f(-x)
+       --shift -> only classify one in-range translate f(x + k) per class
+       --fast -> label polynomials with exact integer certificates
+                 (functions_galois_fast) and only call PARI for the rest
+       --crosscheck FRACTION -> re-compute that fraction of the fast labels
+                 with PARI and log disagreements to crosscheck.log
+       --fields -> reduce every polynomial with polredabs, compute the Galois
+                 group once per field and write the field of each
+                 polynomial to fields.tsv
+       --cache PATH -> persistent Galois label cache consulted before PARI
+                 (e.g. galois_label_cache.sqlite; default: none)
+       --shard i/N -> only enumerate the i-th of N contiguous index ranges
+       --restart -> discard previous results instead of resuming
+       --merge-shards N -> concatenate the N finished shard directories
+       --order lex|height -> enumerate the box lexicographically or shell by
+                 shell in increasing height (max |a_i|), so that any finished
+                 prefix is the census of a smaller box
+       --time-budget SECONDS -> stop handing out work after SECONDS and
+                 report the largest complete box (resumable later)
+       --extend-from N_OLD -> only enumerate the shell N_OLD < max|a_i| <= n
+                 and add the finished census of range N_OLD to the new
+                 directory, by copy or (--link-base) by reference
+       --constraints SPEC -> only enumerate the tuples meeting SPEC, e.g.
+                 "a0=1" (constant term 1), "a3%2=1" or "a3 odd", "a1+2*a2=3";
+                 a_k is the coefficient of x^k, several constraints are
+                 separated by commas or given as repeated flags
+       --sample COUNT -> classify a uniform random sample of COUNT distinct
+                 tuples of the box (or of the constrained product), drawn
+                 through a seeded index permutation (--seed) so the same
+                 seed gives the same sample and an interrupted sample resumes
+       --stratify TARGET -> keep sampling until every non-generic group (or
+                 every group of --stratify-groups) has TARGET polynomials,
+                 writing at most TARGET per group; group frequencies are
+                 estimated as it goes in sample_stats.json
+       --format txt|npy -> group files of polynomial strings, or binary
+                 int8/int16 coefficient matrices (<label>.npy, one census
+                 tuple per row) described by census.json
+       --count-generic -> do not write the generic group S_deg: count it per
+                 height shell and sign pattern in generic_counts.json
+       --generic-sample K -> with --count-generic, also keep a seeded
+                 uniform sample of K generic polynomials in
+                 "S<deg>.sample.txt", which pipelines only read on request
+       --metrics-interval SECONDS -> append throughput, stage times, group
+                 counts and the shard ETA to census_metrics.jsonl every
+                 SECONDS (default 30)
+       --stall-seconds SECONDS -> report workers that spend longer than
+                 SECONDS on one polynomial (default 600)
+       --processes N -> worker processes (default 8, 0 for every core)
+       --max-rss MB, --max-tasks N -> replace a worker once its resident
+                 memory exceeds MB (default 2048) or after N ranges (default
+                 1000); the pool stays at full width and ranges held by a
+                 worker that dies are handed to another one
+       --pari-stack MB, --pari-stack-max MB -> PARI stack of every worker,
+                 which may grow up to the maximum (default: Sage's)
+       --timeout SECONDS -> time budget of the irreducibility check and of
+                 the Galois computation of one polynomial (default: none);
+                 polynomials over budget are interrupted and written to
+                 quarantine.jsonl with their timings instead of the census
+       --retry-quarantine -> instead of enumerating, retry the quarantined
+                 polynomials of the run at the lowest CPU priority with
+                 --retry-timeout SECONDS each (default 3600, 0 for none),
+                 adding the ones that finish to the census
     Defaults: n=5, deg=3
     """
-    args = sys.argv[1:]
-    if len(args) >= 1:
-        n = int(args[0])
-    else:
-        n = 5
-    if len(args) >= 2:
-        deg = int(args[1])
-    else:
-        deg = 3
-    return n, deg
-
-def process_one_polynomial(coeffs_and_deg):
-    """
-    Worker function for a single polynomial's coefficients.
-    
-    1. Build the monic polynomial f(x) = x^deg + ... from coeffs.
-    2. Check irreducibility.
-    3. If irreducible, compute Galois group, then write the polynomial
-       to a file named after the Galois group label.
-       - If the group label contains "=", we only take the text before "=".
-    4. Force garbage collection to minimize memory growth.
-    
-    Arguments:
-      coeffs_and_deg: tuple (coeffs, deg)
-         - coeffs is a tuple (a_{deg-1}, ..., a_0)
-         - deg is the polynomial degree
-    """
-    coeffs, deg = coeffs_and_deg
-
-    # Create the polynomial ring and variable
-    R = PolynomialRing(QQ, 'x')
-    x = R.gen()
-
-    # 1. Build monic polynomial
-    #    f(x) = x^deg + sum(a_{deg-1 - i} * x^i for i in range(deg))
-    f = x**deg
-    for i in range(deg):
-        f += coeffs[deg - 1 - i] * x**i
-
-    # 2. Check irreducibility
-    if not f.is_irreducible():
+    parser = argparse.ArgumentParser(description="Parallel Galois census of monic polynomials.")
+    parser.add_argument("n", type=int, nargs="?", default=5, help="coefficient range [-n..n]")
+    parser.add_argument("deg", type=int, nargs="?", default=3, help="polynomial degree")
+    parser.add_argument("--scaling", action="store_true",
+                        help="classify one primitive polynomial per scaling class "
+                             "and write all of its in-range scalings")
+    parser.add_argument("--flip", action="store_true",
+                        help="classify one of f(x) and (-1)^deg f(-x) and write both")
+    parser.add_argument("--shift", action="store_true",
+                        help="classify one translate f(x + k) per class (the in-range member "
+                             "of lowest height) and write every in-range translate")
+    parser.add_argument("--fast", action="store_true",
+                        help="use exact integer classifiers (e.g. Frobenius S_n certificates) "
+                             "before falling back to PARI")
+    parser.add_argument("--crosscheck", type=float, default=0.0, metavar="FRACTION",
+                        help="with --fast, verify this fraction of fast labels with PARI")
+    parser.add_argument("--fields", action="store_true",
+                        help=f"identify number fields with polredabs, label each field once "
+                             f"and write 'polynomial<TAB>field' rows to {FIELDS_NAME}")
+    parser.add_argument("--cache", default=None, metavar="PATH",
+                        help=f"persistent Galois label cache consulted before PARI "
+                             f"(e.g. {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--no-cache", dest="cache", action="store_const", const=None,
+                        help="do not read or write a label cache (the default)")
+    parser.add_argument("--shard", default=None, metavar="i/N",
+                        help="enumerate shard i of N (1-based) into its own directory")
+    parser.add_argument("--restart", action="store_true",
+                        help="discard existing results in the output directory instead of resuming")
+    parser.add_argument("--merge-shards", type=int, default=None, metavar="N",
+                        help="merge the N completed shard directories into the census directory")
+    parser.add_argument("--order", choices=CENSUS_ORDERS, default="lex",
+                        help="index order: lexicographic, or increasing height shell by shell")
+    parser.add_argument("--time-budget", type=float, default=None, metavar="SECONDS",
+                        help="stop after SECONDS, keeping every finished range")
+    parser.add_argument("--extend-from", type=int, default=None, metavar="N_OLD",
+                        help="extend the census of range N_OLD: only classify tuples with "
+                             "N_OLD < max|a_i| <= n")
+    parser.add_argument("--link-base", action="store_true",
+                        help="with --extend-from, link to the base census instead of copying it")
+    parser.add_argument("--constraints", action="append", default=[], metavar="SPEC",
+                        help="enumerate only the tuples meeting SPEC, e.g. 'a0=1,a3%%2=1,a1+2*a2=3' "
+                             "(a_k is the coefficient of x^k)")
+    parser.add_argument("--sample", type=int, default=None, metavar="COUNT",
+                        help="classify a seeded uniform sample of COUNT distinct tuples")
+    parser.add_argument("--stratify", type=int, default=None, metavar="TARGET",
+                        help="sample until each non-generic group has TARGET polynomials")
+    parser.add_argument("--stratify-groups", default=None, metavar="LABELS",
+                        help="comma-separated groups (as in the file names) that must reach "
+                             "the --stratify target, instead of every non-generic group seen")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the sample permutation")
+    parser.add_argument("--format", choices=CENSUS_FORMATS, default="txt",
+                        help="group files as polynomial strings (txt) or binary "
+                             "coefficient matrices (npy)")
+    parser.add_argument("--count-generic", action="store_true",
+                        help="count the generic group S_deg per height and sign pattern "
+                             "instead of writing it")
+    parser.add_argument("--generic-sample", type=int, default=0, metavar="K",
+                        help="with --count-generic, keep a uniform sample of K generic "
+                             "polynomials (seeded by --seed)")
+    parser.add_argument("--metrics-interval", type=float, default=METRICS_INTERVAL,
+                        metavar="SECONDS",
+                        help=f"seconds between two lines of {METRICS_NAME}")
+    parser.add_argument("--stall-seconds", type=float, default=STALL_SECONDS, metavar="SECONDS",
+                        help="report workers stuck on one polynomial for longer than this")
+    parser.add_argument("--processes", type=int, default=NUM_PROCS,
+                        help="worker processes (0: one per core)")
+    parser.add_argument("--max-rss", type=float, default=MAX_WORKER_RSS_MB, metavar="MB",
+                        help="replace workers whose resident memory exceeds MB (0: no limit)")
+    parser.add_argument("--max-tasks", type=int, default=MAX_WORKER_TASKS, metavar="N",
+                        help="replace workers after N ranges (0: no limit)")
+    parser.add_argument("--pari-stack", type=float, default=None, metavar="MB",
+                        help="PARI stack size of every worker")
+    parser.add_argument("--pari-stack-max", type=float, default=None, metavar="MB",
+                        help="size the PARI stack of a worker may grow to")
+    parser.add_argument("--timeout", type=float, default=None, metavar="SECONDS",
+                        help=f"quarantine polynomials taking longer than this in "
+                             f"{QUARANTINE_NAME} (default: no limit, e.g. {ITEM_TIMEOUT:g})")
+    parser.add_argument("--retry-quarantine", action="store_true",
+                        help="retry the quarantined polynomials at low priority")
+    parser.add_argument("--retry-timeout", type=float, default=RETRY_TIMEOUT, metavar="SECONDS",
+                        help="time budget of a polynomial in the retry pass (0: no limit)")
+    args = parser.parse_args(sys.argv[1:])
+    if args.generic_sample and not args.count_generic:
+        parser.error("--generic-sample needs --count-generic")
+    if args.sample is not None or args.stratify is not None:
+        if census_symmetries(args) or args.extend_from is not None or args.order != "lex":
+            parser.error("--sample/--stratify draw single tuples of the box; they cannot be "
+                         "combined with symmetries, --extend-from or --order height")
+        if args.stratify is not None and args.shard is not None:
+            parser.error("--stratify stops on the counts of the whole run; it cannot be sharded")
+        if args.retry_quarantine:
+            parser.error("--retry-quarantine does not update sample statistics; the "
+                         "quarantined tuples of a sample stay in its quarantine file")
+    try:
+        args.constraint_set = parse_constraints(args.constraints, args.deg, args.n)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.constraint_set is not None and (args.extend_from is not None
+                                            or args.order != "lex"):
+        parser.error("--constraints enumerates a restricted product in lex order; "
+                     "it cannot be combined with --extend-from or --order height")
+    return args
+
+def census_params(args, i, num_shards):
+    """Parameters recorded in the run manifest; a resumed run must match them."""
+    return {
+        "n": args.n,
+        "deg": args.deg,
+        "shard": [i, num_shards],
+        "symmetries": census_symmetries(args),
+        "fields": args.fields,
+        "order": args.order,
+        "extend_from": args.extend_from,
+        "base": None if args.extend_from is None else ("link" if args.link_base else "copy"),
+        "constraints": census_constraints(args),
+        "sample": census_sample(args),
+        "format": args.format,
+        "generic": census_generic(args),
+    }
+
+def census_generic(args):
+    """Counts-only settings of the generic group, or None when it is written."""
+    if not args.count_generic:
+        return None
+    return {"sample_size": args.generic_sample, "seed": args.seed}
+
+def census_sample(args):
+    """Sampling parameters of the run, or None for a full enumeration."""
+    if args.sample is None and args.stratify is None:
+        return None
+    return {"seed": args.seed, "count": args.sample, "stratify": args.stratify}
+
+def census_constraints(args):
+    """Normalised constraint specifications of the run (empty without --constraints)."""
+    return [] if args.constraint_set is None else args.constraint_set.specs
+
+def output_dir_of(args, i=1, num_shards=1):
+    """census_output_dir of the run, tagged with its constraints."""
+    return census_output_dir(args.deg, args.n, i, num_shards, args.constraint_set,
+                             census_sample(args))
+
+def census_symmetries(args):
+    """Symmetries selected on the command line, as a tuple of names."""
+    return tuple(name for name in CENSUS_SYMMETRIES if getattr(args, name))
+
+def worker_options(args):
+    """Census parameters every worker needs, passed once to init_worker."""
+    return {
+        "deg": args.deg,
+        "n": args.n,
+        "n_inner": args.extend_from,
+        "order": args.order,
+        "constraints": census_constraints(args),
+        "sample": census_sample(args),
+        "format": args.format,
+        "generic": census_generic(args),
+        "symmetries": census_symmetries(args),
+        "fast": args.fast,
+        "crosscheck": args.crosscheck,
+        "fields": args.fields,
+        "cache": args.cache,
+        "pari_stack": megabytes(args.pari_stack),
+        "pari_stack_max": megabytes(args.pari_stack_max),
+        "timeout": args.timeout or None,
+    }
+
+def megabytes(mb):
+    """Bytes of a size in MB given on the command line; None (or 0) stays None."""
+    return int(mb * 2**20) if mb else None
+
+def init_worker(options, counters, lock):
+    """
+    Pool initializer: build the polynomial ring once per worker process,
+    remember the census parameters, open the label cache read-only and
+    claim a slot of the shared metrics counters. With --pari-stack the
+    worker's PARI stack is resized before any computation.
+    """
+    global X, DEG, N, N_INNER, ORDER, CONSTRAINTS, PERMUTATION, SYMMETRIES, FAST, CROSSCHECK
+    global FIELDS, LABEL_CACHE, FORMAT, GENERIC, GENERIC_LABEL, METRICS, TIMEOUT
+    if options["pari_stack"] or options["pari_stack_max"]:
+        pari.allocatemem(options["pari_stack"] or 0, options["pari_stack_max"] or 0,
+                         silent=True)
+    X = PolynomialRing(QQ, 'x').gen()
+    DEG, N, N_INNER = options["deg"], options["n"], options["n_inner"]
+    ORDER = options["order"]
+    CONSTRAINTS = parse_constraints(options["constraints"], DEG, N)
+    FORMAT = options["format"]
+    GENERIC = options["generic"]
+    GENERIC_LABEL = symmetric_group_label(DEG)
+    if options["sample"] is not None:
+        population = box_size(N, DEG) if CONSTRAINTS is None else CONSTRAINTS.size()
+        PERMUTATION = IndexPermutation(population, options["sample"]["seed"])
+    SYMMETRIES = options["symmetries"]
+    FAST = options["fast"]
+    CROSSCHECK = options["crosscheck"]
+    FIELDS = options["fields"]
+    LABEL_CACHE = open_label_cache(options["cache"], readonly=True)
+    TIMEOUT = options["timeout"]
+    METRICS = WorkerSlot.claim(counters, lock, DEG)
+
+def init_retry_worker(options, counters, lock):
+    """init_worker for the retry pass, at the lowest CPU priority."""
+    lower_priority()
+    init_worker(options, counters, lock)
+
+def build_polynomial(coeffs):
+    """
+    Monic polynomial f(x) = x^deg + sum(a_{deg-1 - i} * x^i for i in range(deg))
+    for coeffs = (a_{deg-1}, ..., a_0).
+    """
+    f = X**DEG
+    for i in range(DEG):
+        f += coeffs[DEG - 1 - i] * X**i
+    return f
+
+def collect_garbage_periodically():
+    """Run gc.collect() once every GC_INTERVAL Galois computations."""
+    global GALOIS_SINCE_GC
+    GALOIS_SINCE_GC += 1
+    if GALOIS_SINCE_GC >= GC_INTERVAL:
         gc.collect()
-        return
+        GALOIS_SINCE_GC = 0
 
-    # 3. Compute Galois group
+def pari_galois_label(f):
+    """PARI's label of the Galois group of f, or None if the computation fails."""
     try:
         G = f.galois_group(pari_group=True)
         group_label = G.label()
     except Exception:
-        gc.collect()
+        group_label = None
+    else:
+        # Learn the transitive group id of labels outside the degree <= 6 table
+        try:
+            pari_group_id(G)
+        except Exception:
+            pass
+    collect_garbage_periodically()
+    return group_label
+
+def field_polynomial(f):
+    """
+    Canonical defining polynomial of the number field Q[x]/(f) (PARI's
+    polredabs), as a string; None if PARI fails.
+    """
+    try:
+        return str(pari(f).polredabs())
+    except Exception:
+        return None
+
+def cached_field_label(field, group_label):
+    """Remember the label of a field (bounded per worker) and return it."""
+    if field is not None and group_label is not None:
+        if len(FIELD_CACHE) >= FIELD_CACHE_LIMIT:
+            FIELD_CACHE.clear()
+        FIELD_CACHE[field] = group_label
+    return group_label
+
+def decode_index_range(start, stop):
+    """Block of the tuples with index in [start, stop) in the run's index space."""
+    if PERMUTATION is not None:
+        # Sample positions -> indices of the box or of the constrained product
+        index = permuted_indices(PERMUTATION, start, stop)
+        if CONSTRAINTS is not None:
+            return constrained_rows(index, CONSTRAINTS)
+        return coefficient_rows(index, N, DEG)
+    if CONSTRAINTS is not None:
+        return constrained_block(start, stop, CONSTRAINTS)
+    if ORDER == "height":
+        # Height-order indices of an extension start after the base box
+        offset = 0 if N_INNER is None else box_size(N_INNER, DEG)
+        return height_block(start + offset, stop + offset, DEG)
+    if N_INNER is None:
+        return coefficient_block(start, stop, N, DEG)
+    return shell_block(start, stop, N_INNER, N, DEG)
+
+def class_bounds(coeffs):
+    """
+    (n, n_inner) that symmetry classes of coeffs are taken in. In height
+    order each shell h extends the box of height h - 1, so classes are cut
+    to their members in that shell and every finished prefix of shells is
+    a complete census of its box.
+    """
+    if ORDER == "height":
+        h = height(coeffs)
+        return h, h - 1
+    return N, N_INNER
+
+def is_representative(coeffs):
+    """is_class_representative within class_bounds(coeffs)."""
+    n, n_inner = class_bounds(coeffs)
+    return is_class_representative(coeffs, n, SYMMETRIES, n_inner, class_filter())
+
+def representative_members(coeffs):
+    """class_members within class_bounds(coeffs), representative first."""
+    n, n_inner = class_bounds(coeffs)
+    return class_members(coeffs, n, SYMMETRIES, n_inner, class_filter())
+
+def class_filter():
+    """
+    With --constraints, classes are cut down to the members meeting the
+    constraints: a class is classified once through its lowest enumerated
+    member and only enumerated members are written.
+    """
+    return None if CONSTRAINTS is None else CONSTRAINTS.satisfied
+
+def add_stage_time(stage, since):
+    """Add the time since perf_counter() value since to a stage; returns now."""
+    now = time.perf_counter()
+    METRICS.add_time(stage, now - since)
+    return now
+
+def label_polynomial(coeffs, f, group_label, from_cache, sampler, report, new_labels):
+    """
+    Canonical label and field (None without --fields) of an irreducible
+    polynomial f whose cached or fast label is group_label (None if it has
+    none): the field cache or PARI label it otherwise, and a CROSSCHECK
+    fraction of fast labels is verified with PARI. Labels PARI computed go
+    to new_labels; the label is None if PARI fails.
+    """
+    field = field_polynomial(f) if FIELDS else None
+    if group_label is None and field in FIELD_CACHE:
+        group_label = FIELD_CACHE[field]
+        report["field_hits"] += 1
+    if group_label is None:
+        group_label = cached_field_label(field, pari_galois_label(f))
+        if group_label is None:
+            return None, field
+        new_labels.append((coeffs, group_label))
+    elif CROSSCHECK and not from_cache and sampler.random() < CROSSCHECK:
+        pari_label = pari_galois_label(f)
+        report["crosschecked"] += 1
+        if pari_label is not None and pari_label != group_label:
+            report["mismatches"].append(f"{f}\tfast={group_label}\tpari={pari_label}")
+            group_label = pari_label
+            new_labels.append((coeffs, group_label))
+    if field is not None and field not in FIELD_CACHE:
+        cached_field_label(field, group_label)
+
+    # Canonical file label of the group: the short PARI label of its
+    # transitive group id (the part before '=')
+    return canonical_file_label(group_label, DEG), field
+
+def census_members(coeffs, f, field):
+    """
+    (members, rows, field_rows) of a labelled representative: the class
+    members (just coeffs without symmetries), what is written for them
+    (strings, or tuples with --format npy) and their field rows.
+    """
+    members = representative_members(coeffs) if SYMMETRIES else [coeffs]
+    strings = []
+    if FORMAT == "txt" or field is not None:
+        strings = [str(f)] + [str(build_polynomial(member)) for member in members[1:]]
+    rows = strings if FORMAT == "txt" else members
+    field_rows = [f"{member}\t{field}" for member in strings] if field is not None else []
+    return members, rows, field_rows
+
+def classify_quarantined(entry):
+    """
+    Retry-pass worker function: classify one quarantine entry with a
+    budget of TIMEOUT seconds. Returns (entry, status, group_label,
+    members, rows, field_rows, new_labels, seconds) where status is
+    "labelled", "reducible", "failed" (PARI error) or "timeout".
+    """
+    coeffs = tuple(entry["coeffs"])
+    METRICS.start_task(0, 1)
+    METRICS.heartbeat(coeffs)
+    f = build_polynomial(coeffs)
+    report = {"crosschecked": 0, "mismatches": [], "field_hits": 0}
+    new_labels = []
+    started = time.perf_counter()
+    outcome = (None, [], [], [])
+    try:
+        with time_limit(TIMEOUT):
+            if entry["stage"] == "irreducibility" and not f.is_irreducible():
+                status = "reducible"
+            else:
+                group_label = None
+                if FAST:
+                    group_label = fast_galois_labels(np.array([coeffs], dtype=np.int64))[0]
+                group_label, field = label_polynomial(coeffs, f, group_label, False,
+                                                      random.Random(0), report, new_labels)
+                status = "failed" if group_label is None else "labelled"
+                if group_label is not None:
+                    outcome = (group_label, *census_members(coeffs, f, field))
+    except ItemTimeout:
+        status = "timeout"
+    METRICS.finish_task(1)
+    return (entry, status, *outcome, new_labels, time.perf_counter() - started)
+
+def process_index_range(index_range):
+    """
+    Worker function for a contiguous range of the coefficient box.
+
+    1. Decode the tuples with index in [start, stop) (box indices in lex or
+       height order, shell indices with --extend-from, or indices of the
+       restricted product with --constraints, or sample positions mapped
+       through the seeded permutation) into a NumPy block and drop the rows
+       the vectorised pre-filter proves reducible (integer roots); rows it
+       proves irreducible skip Sage's is_irreducible().
+    2. Look the remaining tuples up in the label cache in one batch; cached
+       tuples are irreducible and already labelled. Build each other monic
+       polynomial and check irreducibility.
+    3. Label the irreducible ones: with --fast, exact integer certificates
+       go first (functions_galois_fast) and PARI only sees the rest. A
+       random CROSSCHECK fraction of the fast labels is verified with PARI;
+       on disagreement the PARI label is used and the row is reported.
+       With --fields, each polynomial is first reduced with polredabs and
+       fields seen before by this worker reuse their label instead of
+       calling PARI again.
+       - Labels are normalised to the short PARI label of their transitive
+         group id (functions_group_ids), the text before "=".
+    4. Collect the polynomials per label (strings, or coefficient tuples
+       with --format npy) and their field rows; the main process is the
+       only writer. With --count-generic the generic group is only counted
+       per height and sign pattern (plus a bottom-k sample candidate list).
+
+    Each irreducibility check and each Galois computation (including
+    polredabs and the cross-check) has a budget of TIMEOUT seconds; a
+    polynomial that runs out of it is interrupted and returned as a
+    quarantine entry instead of being labelled.
+
+    The worker's metrics slot gets a heartbeat (with the tuple) before
+    every irreducibility check and Galois computation, and the time of the
+    decode, reducibility and Galois stages when the range is done.
+
+    With symmetries enabled, only class representatives are classified and
+    every in-range member of the class (scalings lambda^deg * f(x / lambda),
+    the flip (-1)^deg f(-x), translates f(x + k)) is returned with the same
+    label, since irreducibility and the Galois group are invariant under all
+    of them. They also generate the same field. When extending a census,
+    classes are cut down to their members in the shell.
+
+    Returns (index_range, {group_label: [polynomials]}, field_rows,
+    new_labels, report) where field_rows are the "polynomial<TAB>field"
+    lines, new_labels the (coeffs, label) pairs PARI computed for the label
+    cache, and report holds the cross-check and cache counters of the range,
+    its generic group counts and its quarantine entries.
+    """
+    start, stop = index_range
+    results = {}
+    field_rows = []
+    new_labels = []
+    report = {"crosschecked": 0, "mismatches": [], "field_hits": 0, "cache_hits": 0,
+              "positions": stop - start, "generic": None, "quarantined": []}
+    generic = None
+    if GENERIC is not None:
+        generic = GenericGroupCounts(N, GENERIC["sample_size"], GENERIC["seed"])
+    sampler = random.Random(start)
+    METRICS.start_task(start, stop)
+    stage_started = time.perf_counter()
+
+    block = decode_index_range(start, stop)
+    stage_started = add_stage_time("decode", stage_started)
+    reducible, irreducible = reducibility_prefilter(block)
+    survivors = ~reducible
+    certified = irreducible[survivors]
+
+    candidates = [
+        (coeffs, is_certified)
+        for coeffs, is_certified in zip(map(tuple, block[survivors].tolist()), certified.tolist())
+        if not SYMMETRIES or is_representative(coeffs)
+    ]
+    cached = LABEL_CACHE.get_many([coeffs for coeffs, _ in candidates])
+    report["cache_hits"] = len(cached)
+
+    irreducible_rows = []
+    for coeffs, is_certified in candidates:
+        if coeffs in cached or is_certified:
+            irreducible_rows.append(coeffs)
+            continue
+        METRICS.heartbeat(coeffs)
+        f = build_polynomial(coeffs)
+        item_started = time.perf_counter()
+        try:
+            with time_limit(TIMEOUT):
+                is_irreducible = f.is_irreducible()
+        except ItemTimeout:
+            report["quarantined"].append(quarantine_entry(
+                coeffs, f, "irreducibility", TIMEOUT, time.perf_counter() - item_started,
+                range=list(index_range)))
+            continue
+        if is_irreducible:
+            irreducible_rows.append(coeffs)
+    stage_started = add_stage_time("reducibility", stage_started)
+    uncached = [i for i, coeffs in enumerate(irreducible_rows) if coeffs not in cached]
+    labels = [cached.get(coeffs) for coeffs in irreducible_rows]
+    if FAST and uncached:
+        fast_labels = fast_galois_labels(np.array([irreducible_rows[i] for i in uncached],
+                                                  dtype=np.int64))
+        for i, group_label in zip(uncached, fast_labels):
+            labels[i] = group_label
+
+    for coeffs, group_label in zip(irreducible_rows, labels):
+        METRICS.heartbeat(coeffs)
+        f = build_polynomial(coeffs)
+        item_started = time.perf_counter()
+        try:
+            with time_limit(TIMEOUT):
+                group_label, field = label_polynomial(coeffs, f, group_label, coeffs in cached,
+                                                      sampler, report, new_labels)
+        except ItemTimeout:
+            report["quarantined"].append(quarantine_entry(
+                coeffs, f, "galois", TIMEOUT, time.perf_counter() - item_started,
+                range=list(index_range)))
+            continue
+        if group_label is None:
+            continue
+
+        members, rows, member_fields = census_members(coeffs, f, field)
+        if generic is not None and group_label == GENERIC_LABEL:
+            generic.add(members)
+            continue
+        results.setdefault(group_label, []).extend(rows)
+        field_rows.extend(member_fields)
+
+    if generic is not None:
+        report["generic"] = generic.state()
+    add_stage_time("galois", stage_started)
+    METRICS.finish_task(stop - start)
+    return index_range, results, field_rows, new_labels, report
+
+def base_census_dir(args):
+    """
+    Directory of the census extended with --extend-from, which must be
+    complete (directories from before run manifests are trusted).
+    """
+    base_dir = census_output_dir(args.deg, args.extend_from)
+    if not os.path.isdir(base_dir):
+        sys.exit(f"Base census '{base_dir}' does not exist.")
+    complete = census_is_complete(base_dir)
+    if complete is None:
+        print(f"Note: '{base_dir}' has no {MANIFEST_NAME}; assuming it is a complete census.")
+    elif not complete:
+        sys.exit(f"Base census '{base_dir}' is not complete.")
+    return base_dir
+
+def merge_shards(args):
+    """
+    Concatenate the shard directories of a finished sharded run into the
+    census directory and give it a manifest covering the whole box (and,
+    when extending a census, attach the base census).
+    """
+    num_shards = args.merge_shards
+    total = census_index_total(census_params(args, 1, 1))
+
+    shard_dirs = []
+    generic = None if not args.count_generic else \
+        GenericGroupCounts(args.n, args.generic_sample, args.seed)
+    for i in range(1, num_shards + 1):
+        shard_dir = output_dir_of(args, i, num_shards)
+        shard_manifest = CensusManifest.open(shard_dir, census_params(args, i, num_shards))
+        if not shard_manifest.is_complete(*shard_bounds(total, i, num_shards)):
+            sys.exit(f"Shard {i}/{num_shards} in '{shard_dir}' is not complete yet.")
+        shard_dirs.append(shard_dir)
+        if generic is not None:
+            generic.merge(shard_manifest.state["generic"])
+
+    output_dir = output_dir_of(args)
+    manifest = CensusManifest.open(output_dir, census_params(args, 1, 1), restart=args.restart)
+    if manifest.completed:
+        sys.exit(f"'{output_dir}' already holds results; use --restart to replace them.")
+    if args.extend_from is not None:
+        attach_census_base(base_census_dir(args), output_dir, link=args.link_base)
+    merge_census_dirs(shard_dirs, output_dir)
+    if generic is not None:
+        manifest.state["generic"] = generic.state()
+        generic.write(output_dir, symmetric_group_label(args.deg), args.format, args.deg)
+    manifest.mark_done((0, total))
+    manifest.checkpoint()
+    print(f"Merged {num_shards} shards into '{output_dir}'.")
+
+def retry_quarantine(args):
+    """
+    Low-priority pass over the quarantine file of a run: every quarantined
+    polynomial is classified again by a worker running at the lowest CPU
+    priority with a budget of --retry-timeout seconds. Polynomials that
+    finish are added to the group files (or the generic counts) and the
+    label cache; the others stay in the quarantine file with their retry
+    count and timings.
+
+    The tuples that finish are recorded in the manifest state in the same
+    checkpoint as their rows, and only then dropped from the quarantine
+    file; a pass interrupted in between is completed by the next one
+    instead of writing those rows twice.
+    """
+    i, num_shards = parse_shard(args.shard)
+    output_dir = output_dir_of(args, i, num_shards)
+    quarantine_path = os.path.join(output_dir, QUARANTINE_NAME)
+    manifest = CensusManifest.open(output_dir, census_params(args, i, num_shards))
+    resolved = {tuple(coeffs) for coeffs in manifest.state.pop("quarantine_resolved", [])}
+    entries = [entry for entry in read_quarantine(quarantine_path)
+               if tuple(entry["coeffs"]) not in resolved]
+    if resolved:
+        write_quarantine(quarantine_path, entries)
+        manifest.checkpoint()
+    if not entries:
+        print(f"Nothing quarantined in '{output_dir}'.")
         return
+    print(f"Retrying {len(entries)} quarantined polynomials with a budget of "
+          f"{args.retry_timeout:g}s each at low priority...")
+
+    generic = None
+    if args.count_generic:
+        generic = GenericGroupCounts(args.n, args.generic_sample, args.seed,
+                                     manifest.state.get("generic"))
+        generic_label = symmetric_group_label(args.deg)
+    options = dict(worker_options(args), timeout=args.retry_timeout or None)
+    num_procs = min(args.processes or cpu_count(), len(entries))
+    # The cache is created here before the workers open it read-only
+    label_cache = open_label_cache(args.cache)
+    metrics = CensusMetrics(os.path.join(output_dir, METRICS_NAME), num_procs, args.deg)
+    pool = RecyclingPool(num_procs, init_retry_worker, (options, *metrics.worker_args()),
+                         max_tasks=args.max_tasks or None, max_rss=megabytes(args.max_rss))
+
+    remaining = []
+    resolved = []
+    counts = {}
+    with GroupFileWriter(output_dir, format=args.format, deg=args.deg, n=args.n) as writer, \
+            label_cache:
+        for (entry, status, group_label, members, rows, field_rows, new_labels,
+             seconds) in pool.imap_unordered(classify_quarantined, entries):
+            counts[status] = counts.get(status, 0) + 1
+            if status in ("timeout", "failed"):
+                remaining.append(retried_entry(entry, seconds, args.retry_timeout))
+                continue
+            resolved.append(entry["coeffs"])
+            label_cache.add_many(new_labels)
+            if status == "reducible":
+                continue
+            if generic is not None and group_label == generic_label:
+                generic.add(members)
+                continue
+            writer.write(group_label, rows)
+            if field_rows:
+                writer.write_sidecar(FIELDS_NAME, field_rows)
+        if generic is not None:
+            manifest.state["generic"] = generic.state()
+            generic.write(output_dir, generic_label, args.format, args.deg)
+        # The rows and the list of resolved tuples are saved together,
+        # before the quarantine file shrinks
+        manifest.state["quarantine_resolved"] = resolved
+        manifest.checkpoint(writer)
+    pool.close()
+    pool.join()
 
-    # If the group label contains '=', split and take only the part before '='
-    if '=' in group_label:
-        group_label = group_label.split('=', 1)[0].strip()
+    write_quarantine(quarantine_path, remaining)
+    del manifest.state["quarantine_resolved"]
+    manifest.checkpoint()
+    print(", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+          + f"; {len(remaining)} polynomials left in '{QUARANTINE_NAME}'.")
 
-    # 4. Write polynomial to file under lock
-    global WRITE_LOCK, OUTPUT_DIR
-    with WRITE_LOCK:
-        filename = os.path.join(OUTPUT_DIR, f"{group_label}.txt")
-        with open(filename, 'a') as out_f:
-            out_f.write(str(f) + "\n")
+def stratified_groups(args, statistics):
+    """
+    Groups a stratified sample fills up: those of --stratify-groups, or
+    every non-generic group drawn so far (none drawn yet: not done).
+    """
+    if args.stratify_groups:
+        return [g.strip() for g in args.stratify_groups.split(",") if g.strip()]
+    generic = symmetric_group_label(args.deg)
+    return [g for g in statistics.counts if g != generic]
+
+def stratified_targets_met(args, statistics):
+    groups = stratified_groups(args, statistics)
+    return bool(groups) and statistics.targets_met(args.stratify, groups)
+
+def record_sample(args, statistics, results, field_rows, positions):
+    """
+    Add the results of a range of sample positions to the statistics and,
+    when stratifying, cut every group down to what it still needs. Returns
+    the (results, field_rows) to write.
+    """
+    statistics.positions += positions
+    kept = {}
+    for group_label, members in results.items():
+        if args.stratify is not None:
+            kept[group_label] = members[:statistics.remaining(group_label, args.stratify)]
+        else:
+            kept[group_label] = members
+        statistics.add(group_label, len(members), len(kept[group_label]))
+    if args.stratify is not None and field_rows:
+        written = {member if isinstance(member, str) else polynomial_string(member)
+                   for members in kept.values() for member in members}
+        field_rows = [row for row in field_rows if row.split("\t", 1)[0] in written]
+    return {g: members for g, members in kept.items() if members}, field_rows
 
-    # Force garbage collection after each polynomial to reduce memory
-    gc.collect()
+def print_sample_summary(args, statistics, stats_path):
+    """Estimated group frequencies of the sample so far."""
+    print(f"Sampled {statistics.positions} of {statistics.population} tuples "
+          f"(seed {args.seed}); estimated group frequencies:")
+    for group_label, row in statistics.estimates().items():
+        lo, hi = row["fraction_ci95"]
+        print(f"  {group_label}: {row['drawn']} drawn, {row['written']} written, "
+              f"{100 * row['fraction']:.4f}% [{100 * lo:.4f}%, {100 * hi:.4f}%] "
+              f"~{row['estimated_total']} in the box")
+    if args.stratify is not None:
+        groups = stratified_groups(args, statistics)
+        short = [g for g in groups if statistics.remaining(g, args.stratify)]
+        if groups and not short:
+            print(f"Every stratified group has {args.stratify} polynomials.")
+        else:
+            print(f"Groups still below {args.stratify}: {', '.join(short) or 'none drawn yet'}; "
+                  f"run again to continue the sample.")
+    print(f"Statistics in '{stats_path}'.")
 
 def main():
     # 1. Parse arguments
-    n, deg = parse_arguments()
-    print(f"Generating all monic degree-{deg} polynomials with coefficients in [-{n}, {n}]...")
-
-    # 2. Create output directory
-    global OUTPUT_DIR
-    OUTPUT_DIR = f"galois_deg{deg}_range{n}"
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-    # 3. Create a lock for file writes
-    global WRITE_LOCK
-    WRITE_LOCK = Lock()
-
-    # 4. Prepare the generator of coefficient tuples
-    #    Each element is (a_{deg-1}, ..., a_0)
-    coeffs_gen = product(range(-n, n+1), repeat=deg)
-
-    # 5. Wrap each polynomial in a (coeffs, deg) tuple
-    #    so the worker knows the degree as well
-    tasks = ((coeffs, deg) for coeffs in coeffs_gen)
-
-    # 6. Set up multiprocessing pool
-    #    If memory is tight, reduce the number of processes below 8.
-    num_procs = 8
-    # num_procs = cpu_count()  # Use all cores if you prefer (and have enough RAM)
-    pool = Pool(processes=num_procs)
-
-    # 7. Distribute work. We use imap_unordered with a chunksize=1
-    #    so each polynomial is handled independently.
-    for _ in pool.imap_unordered(process_one_polynomial, tasks, chunksize=1):
-        pass
-    # We don’t gather results; they’re written directly to disk.
-
-    # 8. Close and join the pool
-    pool.close()
+    args = parse_arguments()
+    n, deg = args.n, args.deg
+    if args.merge_shards is not None:
+        merge_shards(args)
+        return
+    if args.retry_quarantine:
+        retry_quarantine(args)
+        return
+    i, num_shards = parse_shard(args.shard)
+    print(f"Generating all monic degree-{deg} polynomials with coefficients in [-{n}, {n}]"
+          f" (shard {i}/{num_shards})...")
+    if args.extend_from is not None:
+        print(f"Extending the census of range {args.extend_from}: only tuples with "
+              f"{args.extend_from} < max|a_i| <= {n} are classified.")
+        base_dir = base_census_dir(args)
+    if args.constraint_set is not None:
+        constraints = args.constraint_set
+        print(f"Constraints {', '.join(constraints.specs)}: {constraints.size()} of "
+              f"{box_size(n, deg)} tuples enumerated"
+              + (" (before the linear equalities)." if constraints.equalities else "."))
+    sample = census_sample(args)
+    if sample is not None:
+        print(f"Sampling with seed {args.seed}: "
+              + (f"{args.sample} tuples" if args.sample is not None else "until the targets are met")
+              + (f", at most {args.stratify} polynomials per group." if args.stratify else "."))
+
+    # 2. Open the output directory and its manifest. A previous run with
+    #    the same parameters is resumed: its group files are rolled back to
+    #    the last checkpoint and finished ranges are skipped.
+    #    An extension of an unsharded run gets its base census right away
+    #    (sharded runs attach it when the shards are merged).
+    output_dir = output_dir_of(args, i, num_shards)
+    fresh = args.restart or not os.path.exists(os.path.join(output_dir, MANIFEST_NAME))
+    params = census_params(args, i, num_shards)
+    manifest = CensusManifest.open(output_dir, params, restart=args.restart)
+    if args.extend_from is not None and num_shards == 1 and fresh:
+        attach_census_base(base_dir, output_dir, link=args.link_base)
+        manifest.checkpoint()
+
+    # 3. Split the shard into contiguous index ranges. Index i is the i-th
+    #    element of product(range(-n, n+1), repeat=deg), i.e. (a_{deg-1}, ..., a_0),
+    #    or with --extend-from the i-th tuple of the shell; with --order height
+    #    the i-th tuple in increasing height; with --constraints the i-th
+    #    tuple of the restricted product (see functions_census).
+    #    With --sample/--stratify index i is the i-th sample position,
+    #    mapped to a box index by the seeded permutation.
+    start, stop = shard_bounds(census_index_total(params), i, num_shards)
+    tasks = manifest.pending_ranges(start, stop, TASK_SIZE)
+
+    # A sample keeps running group statistics in the manifest state; a
+    # stratified sample stops once its groups have reached the target
+    statistics = None
+    if sample is not None:
+        statistics = GroupStatistics(census_population(params), manifest.state.get("statistics"),
+                                     deg)
+        stats_path = os.path.join(output_dir, SAMPLE_STATS_NAME)
+    if args.stratify is not None and stratified_targets_met(args, statistics):
+        tasks = iter(())
+
+    # With --count-generic the generic group is counted, not written; its
+    # counts and sample are saved with the manifest like the statistics
+    generic = None
+    if args.count_generic:
+        generic = GenericGroupCounts(n, args.generic_sample, args.seed,
+                                     manifest.state.get("generic"))
+        generic_label = symmetric_group_label(deg)
+
+    # 4. Open (or create) the label cache. Only this process writes to it;
+    #    the workers open it read-only and return the labels PARI computed.
+    label_cache = open_label_cache(args.cache)
+
+    # 5. Set up the worker pool; each worker builds its ring once. Workers
+    #    are replaced once their resident memory passes --max-rss or after
+    #    --max-tasks ranges, so PARI/Sage memory growth cannot build up
+    #    over a long run, and a worker that dies has its ranges redone.
+    #    The workers update their slots of the shared metrics counters,
+    #    which a thread of this process writes to census_metrics.jsonl.
+    num_procs = args.processes or cpu_count()
+    pending = None if args.stratify is not None else \
+        stop - start - manifest.completed_count(start, stop)
+    metrics = CensusMetrics(os.path.join(output_dir, METRICS_NAME), num_procs, deg, pending,
+                            (i, num_shards), args.metrics_interval, args.stall_seconds)
+    pool = RecyclingPool(num_procs, init_worker, (worker_options(args), *metrics.worker_args()),
+                         max_tasks=args.max_tasks or None, max_rss=megabytes(args.max_rss))
+
+    # 6. Distribute the ranges. Results come back once per range and are
+    #    written by this process only, through group files that stay open
+    #    (buffered) for the whole run. Finished ranges are checkpointed in
+    #    the manifest after their results have been flushed. Past the time
+    #    budget the remaining ranges are dropped (and redone on resume).
+    #    Samples are processed in position order, so a stratified sample
+    #    keeps the same polynomials whatever the scheduling.
+    deadline = None if args.time_budget is None else time.monotonic() + args.time_budget
+    out_of_time = targets_met = False
+    crosschecked = mismatches = field_hits = cache_hits = quarantined = 0
+    with GroupFileWriter(output_dir, format=args.format, deg=deg, n=n) as writer, label_cache, \
+            metrics:
+        if sample is None:
+            completed = pool.imap_unordered(process_index_range, tasks)
+        else:
+            completed = pool.imap(process_index_range, tasks)
+        for index_range, results, field_rows, new_labels, report in completed:
+            metrics.add_groups(results)
+            if report["generic"] is not None:
+                metrics.add_group(generic_label, sum(report["generic"]["counts"].values()))
+            if generic is not None:
+                generic.merge(report["generic"])
+                manifest.state["generic"] = generic.state()
+            if statistics is not None:
+                if report["generic"] is not None:
+                    statistics.add(generic_label, sum(report["generic"]["counts"].values()), 0)
+                results, field_rows = record_sample(args, statistics, results, field_rows,
+                                                    report["positions"])
+                manifest.state["statistics"] = statistics.state()
+            for group_label, members in results.items():
+                writer.write(group_label, members)
+            if field_rows:
+                writer.write_sidecar(FIELDS_NAME, field_rows)
+            label_cache.add_many(new_labels)
+            crosschecked += report["crosschecked"]
+            field_hits += report["field_hits"]
+            cache_hits += report["cache_hits"]
+            if report["quarantined"]:
+                quarantined += len(report["quarantined"])
+                writer.write_sidecar(QUARANTINE_NAME, map(json.dumps, report["quarantined"]))
+            if report["mismatches"]:
+                mismatches += len(report["mismatches"])
+                with open(os.path.join(output_dir, "crosscheck.log"), 'a') as log:
+                    log.write("\n".join(report["mismatches"]) + "\n")
+            manifest.mark_done(index_range)
+            if manifest.maybe_checkpoint(writer):
+                if statistics is not None:
+                    statistics.write(stats_path)
+                if generic is not None:
+                    generic.write(output_dir, generic_label, args.format, deg)
+            if args.stratify is not None and stratified_targets_met(args, statistics):
+                targets_met = True
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                out_of_time = True
+                break
+        manifest.checkpoint(writer)
+        if statistics is not None:
+            statistics.write(stats_path)
+        if generic is not None:
+            generic.write(output_dir, generic_label, args.format, deg)
+
+    # 7. Close and join the pool (dropping queued ranges when out of time
+    #    or once a stratified sample is complete)
+    if out_of_time or targets_met:
+        pool.terminate()
+    else:
+        pool.close()
     pool.join()
 
-    print(f"Done. Wrote results to directory '{OUTPUT_DIR}'.")
+    line = metrics.last
+    print(f"{line['tuples']} tuples in {line['elapsed']:.0f}s ({line['tuples_per_second']:.1f}/s); "
+          + ", ".join(f"{stage} {100 * share:.1f}%" for stage, share in line["fractions"].items())
+          + f" of the worker time; metrics in '{METRICS_NAME}'.")
+    if pool.retired or pool.died:
+        print(f"Replaced {pool.retired} workers at their memory or task limit and "
+              f"{pool.died} workers that died ({pool.requeued} ranges redone).")
+    if args.cache is not None:
+        print(f"Label cache '{args.cache}': {cache_hits} polynomials labelled from the cache.")
+    if quarantined:
+        print(f"WARNING: {quarantined} polynomials went over the {args.timeout:g}s budget and "
+              f"are NOT in the group files; they are listed in "
+              f"'{os.path.join(output_dir, QUARANTINE_NAME)}'. Retry them with "
+              f"--retry-quarantine.")
+    if crosschecked:
+        print(f"Cross-checked {crosschecked} fast labels with PARI: {mismatches} mismatches.")
+    if args.fields:
+        print(f"Field cache: {field_hits} Galois computations reused from an earlier "
+              f"polynomial of the same field; fields in '{FIELDS_NAME}'.")
+    if out_of_time:
+        print(f"Time budget of {args.time_budget:.0f}s used up: "
+              f"{manifest.completed_count(start, stop)} of {stop - start} tuples done; "
+              f"run again to resume.")
+    if statistics is not None:
+        print_sample_summary(args, statistics, stats_path)
+    if generic is not None:
+        print(f"Generic group {generic_label}: {generic.total()} polynomials counted "
+              f"(not written) in '{GENERIC_COUNTS_NAME}'"
+              + (f", sample of {len(generic.heap)} in "
+                 f"'{generic_label}{GENERIC_SAMPLE_SUFFIX}.{args.format}'."
+                 if args.generic_sample else "."))
+    if args.order == "height" and start == 0:
+        # Completed ranges are in the run's index space, which starts after
+        # the base box when extending a census
+        offset = 0 if args.extend_from is None else box_size(args.extend_from, deg)
+        h = complete_height(manifest.completed, deg, offset)
+        if h is not None:
+            print(f"Complete census of the box [-{h}, {h}]^{deg} "
+                  f"(every polynomial of height <= {h}).")
+    print(f"Done. Wrote results to directory '{output_dir}'.")
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,15 @@
 #!/usr/bin/env sage -python
 
+import sys
 from sage.all import PolynomialRing, QQ
 
+from functions_label_cache import open_label_cache, cached_label
+
+# --cache PATH: print the group labels from (and add them to) the persistent
+# Galois label cache of the census scripts instead of the PARI groups
+cache_path = sys.argv[sys.argv.index("--cache") + 1] if "--cache" in sys.argv else None
+label_cache = open_label_cache(cache_path)
+
 # 1. Define a polynomial ring in t
 T = PolynomialRing(QQ, 't')
 t = T.gen()
@@ -28,8 +36,14 @@ for val in range(-3, 5):
     # Check irreducibility
     if f_val.is_irreducible():
         print("    Irreducible over Q: Yes")
-        G = f_val.galois_group(pari_group=True)
+        if cache_path is None:
+            G = f_val.galois_group(pari_group=True)
+        else:
+            G = cached_label(label_cache, f_val.list(),
+                             lambda: f_val.galois_group(pari_group=True).label())
         print(f"    Galois group: {G}\n")
     else:
         print("    Irreducible over Q: No")
         print("    Skipping Galois group computation\n")
+
+label_cache.close()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+"""
+Generate the sextic resolvent of the generic monic quintic and store it in
+resolvent_data_quintic.py (run once; the census only reads the stored data).
+
+For roots x0, ..., x4 and a pentagon (5-cycle) P on them, let
+    theta_P = sum_{ij in P} xi*xj - sum_{ij not in P} xi*xj.
+The complement of a pentagon is again a pentagon, so theta_P^2 only
+depends on the pair {P, complement}; there are 6 such pairs, permuted by
+S5 with stabiliser F20. The resolvent is
+    R(y) = prod_P (y - theta_P^2) = y^6 + r1 y^5 + ... + r6,
+and r_k is a weighted-homogeneous polynomial of weight 4k in the quintic
+coefficients (a1, ..., a5), a_k being the coefficient of x^(5-k).
+
+The quintic discriminant (weight 20) is stored alongside. Both are found
+exactly by interpolation: quintics with random integer roots give integer
+values, and the coefficients of the monomials of the right weight are
+solved for. Extra sample points check the result.
+"""
+
+import sys
+import random
+from itertools import permutations, combinations, product
+
+DEG = 5
+OUTPUT = "resolvent_data_quintic.py"
+MODULUS = 2 ** 127 - 1
+
+
+# -----------------------------------------------------------
+# The six theta^2 conjugates
+# -----------------------------------------------------------
+def pentagon_pairs():
+    """The 6 unordered pairs {P, complement of P} of 5-cycles on 0..4, as edge sets."""
+    edges = {frozenset(e) for e in combinations(range(DEG), 2)}
+    pairs = set()
+    for order in permutations(range(1, DEG)):
+        cycle = (0,) + order
+        pentagon = frozenset(frozenset((cycle[i], cycle[(i + 1) % DEG])) for i in range(DEG))
+        pairs.add(frozenset([pentagon, frozenset(edges - pentagon)]))
+    return [tuple(pair) for pair in pairs]
+
+def resolvent_values(roots, pairs):
+    """Coefficients (r1, ..., r6) of prod (y - theta^2) for integer roots."""
+    thetas = []
+    for pentagon, pentagram in pairs:
+        theta = sum(roots[i] * roots[j] for i, j in map(tuple, pentagon)) \
+            - sum(roots[i] * roots[j] for i, j in map(tuple, pentagram))
+        thetas.append(theta * theta)
+    poly = [1]  # highest degree first
+    for t in thetas:
+        poly = [c - t * prev for c, prev in zip(poly + [0], [0] + poly)]
+    return poly[1:]
+
+def quintic_coefficients(roots):
+    """(a1, ..., a5) of prod (x - root)."""
+    poly = [1]
+    for r in roots:
+        poly = [c - r * prev for c, prev in zip(poly + [0], [0] + poly)]
+    return poly[1:]
+
+
+# -----------------------------------------------------------
+# Exact interpolation
+# -----------------------------------------------------------
+def weighted_monomials(weight):
+    """Exponent tuples (m1, ..., m5) with sum k * m_k = weight."""
+    return [m for m in product(*(range(weight // k + 1) for k in range(1, DEG + 1)))
+            if sum(k * e for k, e in zip(range(1, DEG + 1), m)) == weight]
+
+def monomial_value(coeffs, exps):
+    """a1^m1 * ... * a5^m5."""
+    value = 1
+    for c, e in zip(coeffs, exps):
+        value *= c ** e
+    return value
+
+def solve_mod(matrix, rhs, p=MODULUS):
+    """Solve a square linear system mod the prime p by Gauss-Jordan elimination."""
+    size = len(matrix)
+    rows = [[v % p for v in row] + [b % p] for row, b in zip(matrix, rhs)]
+    for col in range(size):
+        pivot = next((r for r in range(col, size) if rows[r][col]), None)
+        if pivot is None:
+            raise ValueError("Singular system; draw more sample points")
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        inv = pow(rows[col][col], -1, p)
+        rows[col] = [v * inv % p for v in rows[col]]
+        for r in range(size):
+            if r != col and rows[r][col]:
+                factor = rows[r][col]
+                rows[r] = [(v - factor * w) % p for v, w in zip(rows[r], rows[col])]
+    # Symmetric residues: the coefficients are integers far below p / 2
+    return [row[-1] - p if row[-1] > p // 2 else row[-1] for row in rows]
+
+def interpolate(weight, samples):
+    """
+    The weighted-homogeneous polynomial of the given weight taking the
+    sampled values, as a dict {exponents: integer coefficient}. The
+    coefficients are integers, so they are solved for modulo a large prime
+    and confirmed over Z on the extra samples.
+    """
+    monomials = weighted_monomials(weight)
+    fit, check = samples[:len(monomials)], samples[len(monomials):]
+    matrix = [[monomial_value(a, m) for m in monomials] for a, _ in fit]
+    solution = solve_mod(matrix, [value for _, value in fit])
+    terms = {m: s for m, s in zip(monomials, solution) if s != 0}
+    for a, value in check:
+        if sum(c * monomial_value(a, m) for m, c in terms.items()) != value:
+            raise ValueError(f"Weight {weight} fit failed the check on {a}")
+    return terms
+
+def discriminant_value(roots):
+    """prod_{i<j} (xi - xj)^2."""
+    value = 1
+    for i, j in combinations(range(DEG), 2):
+        value *= (roots[i] - roots[j]) ** 2
+    return value
+
+def write_terms(out, name, polys):
+    out.write(f"{name} = [\n")
+    for terms in polys:
+        out.write("    [\n")
+        for exps, coef in sorted(terms.items(), reverse=True):
+            out.write(f"        ({exps}, {coef}),\n")
+        out.write("    ],\n")
+    out.write("]\n")
+
+
+def main():
+    rng = random.Random(5)
+    pairs = pentagon_pairs()
+    assert len(pairs) == 6
+
+    needed = len(weighted_monomials(4 * 6)) + 50
+    samples = []
+    while len(samples) < needed:
+        roots = [rng.randint(-40, 40) for _ in range(DEG)]
+        samples.append((quintic_coefficients(roots), resolvent_values(roots, pairs),
+                        discriminant_value(roots)))
+
+    resolvent = []
+    for k in range(1, 7):
+        resolvent.append(interpolate(4 * k, [(a, r[k - 1]) for a, r, _ in samples]))
+        print(f"r{k}: {len(resolvent[-1])} terms", file=sys.stderr)
+    discriminant = interpolate(4 * DEG, [(a, disc) for a, _, disc in samples])
+    print(f"disc: {len(discriminant)} terms", file=sys.stderr)
+
+    with open(OUTPUT, "w") as out:
+        out.write('"""\nGenerated by generate_quintic_resolvent.py; do not edit.\n\n'
+                  "Polynomials in the quintic coefficients a1, ..., a5 (a_k is the\n"
+                  "coefficient of x^(5-k)) are lists of terms (exponents, coefficient),\n"
+                  "exponents (m1, ..., m5) standing for a1^m1 * ... * a5^m5.\n\n"
+                  "QUINTIC_SEXTIC_RESOLVENT[k - 1] is r_k in R(y) = y^6 + r1 y^5 + ... + r6,\n"
+                  "QUINTIC_DISCRIMINANT[0] is disc(x^5 + a1 x^4 + ... + a5).\n"
+                  '"""\n\n')
+        write_terms(out, "QUINTIC_SEXTIC_RESOLVENT", resolvent)
+        out.write("\n")
+        write_terms(out, "QUINTIC_DISCRIMINANT", [discriminant])
+    print(f"Wrote {OUTPUT}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
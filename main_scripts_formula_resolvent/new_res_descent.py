@@ -1,10 +1,12 @@
 #!/usr/bin/env sage -python
 
 from functions_resolvent_calculation import calc_vieta_sum
+from functions_census import census_group_names
+from functions_galois_fast import load_census_group
+from functions_group_ids import census_group_of_file
 from sage.all import *
 import sys
 import csv
-import os
 import pandas as pd
 
 # ------------------------------
@@ -25,6 +27,9 @@ var_list = [f"x{i}" for i in range(max_vars)] + [f"e{i}" for i in range(max_vars
 var(var_list + ["n", "x", "T"])
 var("a b c d e_coef f g h i_coef")
 
+# Integer polynomials built straight from the census coefficient tuples
+ZX = PolynomialRing(ZZ, 'x')
+
 # Track all data across all files
 all_rows = []
 max_terms_global = 0
@@ -32,24 +37,20 @@ max_terms_global = 0
 # ------------------------------
 # Process each file in the folder
 # ------------------------------
-for filename in os.listdir(folder):
-    if not filename.endswith(".txt"):
-        continue
-
-    filepath = os.path.join(folder, filename)
-    galois_group = os.path.splitext(filename)[0]
+for filename in census_group_names(folder):
+    galois_group, group_id = census_group_of_file(filename, degree)
 
-    with open(filepath, 'r') as f:
-        polys = [line.strip() for line in f if line.strip()]
+    # Census tuples (a_{deg-1}, ..., a_0); .npy group files are memory-mapped
+    census = load_census_group(folder, filename)
 
     rows = []
     max_terms = 0
 
-    for poly_str in polys:
+    for census_row in census:
         try:
-            poly = SR(poly_str)
-            coeffs = poly.coefficients(sparse=False)
-            coeffs = [0] * (degree + 1 - len(coeffs)) + coeffs
+            # Built from the integer coefficients, without a symbolic parse
+            poly = ZX(list(reversed(census_row.tolist())) + [1])
+            coeffs = poly.list()
 
             if coeffs[0] != 1:
                 continue  # Skip non-monic
@@ -78,8 +79,7 @@ for filename in os.listdir(folder):
 
             # Discriminant of the polynomial
             R = PolynomialRing(QQ, 'x')
-            xR = R.gen()
-            poly_in_R = R(poly.subs(x=xR))
+            poly_in_R = R(poly)
             discriminant_val = str(poly_in_R.discriminant())
 
             # Optional expressions based on a, b, c, d from repi
@@ -102,6 +102,7 @@ for filename in os.listdir(folder):
                 "gcd": gcd_val,
                 "zero_terms": num_zeros,
                 "galois_group": galois_group,
+                "group_id": group_id,
                 "discriminant": discriminant_val,
                 "b2_minus_3ac": str(b2_3ac),
                 "bc_minus_9ad": str(bc_9ad),
@@ -130,7 +131,7 @@ for filename in os.listdir(folder):
     fieldnames = (
         ["polynomial"]
         + [f"term_{i}" for i in range(max_terms)]
-        + ["gcd", "zero_terms", "galois_group", "discriminant",
+        + ["gcd", "zero_terms", "galois_group", "group_id", "discriminant",
            "b2_minus_3ac", "bc_minus_9ad", "c2_minus_3bd", "expr_zeros"]
     )
 
@@ -153,7 +154,7 @@ if all_rows:
     combined_fieldnames = (
         ["polynomial"]
         + [f"term_{i}" for i in range(max_terms_global)]
-        + ["gcd", "zero_terms", "galois_group", "discriminant",
+        + ["gcd", "zero_terms", "galois_group", "group_id", "discriminant",
            "b2_minus_3ac", "bc_minus_9ad", "c2_minus_3bd", "expr_zeros"]
     )
 
@@ -1,6 +1,11 @@
 #!/usr/bin/env sage -python
 
 from functions_resolvent_calculation import calc_vieta_sum
+from functions_census import (
+    census_group_names, parse_constraints,
+)
+from functions_galois_fast import load_census_group
+from functions_group_ids import census_group_of_file
 from sage.all import *
 import sys
 import csv
@@ -12,11 +17,14 @@ from tqdm import tqdm
 # Parse arguments
 # ------------------------------
 if len(sys.argv) < 3:
-    print("Usage: sage analyze_all_groups_to_csv.sage <folder> <degree>")
+    print("Usage: sage analyze_all_groups_to_csv.sage <folder> <degree> [constraints]")
     sys.exit(1)
 
 folder = sys.argv[1]
 degree = int(sys.argv[2])
+# Coefficient constraints (functions_census.parse_constraints), a0 being the
+# constant term; by default only polynomials ending in 1 are kept
+constraints = parse_constraints([sys.argv[3] if len(sys.argv) > 3 else "a0=1"], degree)
 
 # ------------------------------
 # Get folder info from folder argument and create new output folder
@@ -33,6 +41,9 @@ var_list = [f"x{i}" for i in range(max_vars)] + [f"e{i}" for i in range(max_vars
 var(var_list + ["n", "x", "T"])
 var("a b c d e_coef f g h i_coef")
 
+# Integer polynomials built straight from the census coefficient tuples
+ZX = PolynomialRing(ZZ, 'x')
+
 # ------------------------------
 # Setup CSV Headers
 # ------------------------------
@@ -42,7 +53,7 @@ num_terms = len(vieta_terms)
 fieldnames = (
     ["polynomial", "polynomial_reconstructed"]  # <--- Add the new column here
     + [f"term_{i}" for i in range(num_terms)]
-    + ["gcd", "zero_terms", "galois_group", "discriminant"]
+    + ["gcd", "zero_terms", "galois_group", "group_id", "discriminant"]
 )
 
 # ------------------------------
@@ -57,95 +68,88 @@ combined_writer.writeheader()
 # ------------------------------
 # Process each .txt file in the folder
 # ------------------------------
-txt_files = [f for f in os.listdir(folder) if f.endswith(".txt")]
+txt_files = census_group_names(folder)
 
 for filename in tqdm(txt_files, desc="Processing files"):
-    filepath = os.path.join(folder, filename)
     # Derive the Galois group name from the filename
-    galois_group = os.path.splitext(filename)[0].split("=")[0].strip()
+    galois_group, group_id = census_group_of_file(filename, degree)
 
     group_csv = os.path.join(output_folder, f"output_last1_{galois_group}_{folder_info}.csv")
     group_file = open(group_csv, 'w', newline='')
     group_writer = csv.DictWriter(group_file, fieldnames=fieldnames)
     group_writer.writeheader()
 
-    # Count lines to show a progress bar
-    with open(filepath, 'r') as f:
-        total_lines = sum(1 for _ in f)
+    # Census tuples (a_{deg-1}, ..., a_0); .npy group files are memory-mapped
+    census = load_census_group(folder, filename)
 
-    with open(filepath, 'r') as f:
-        for poly_str in tqdm(f, total=total_lines, desc="Polynomials", leave=False):
-            poly_str = poly_str.strip()
-            if not poly_str:
+    for census_row in tqdm(census, desc="Polynomials", leave=False):
+        census_coeffs = census_row.tolist()
+        try:
+            # Check the constraints on the integer coefficients first
+            if not constraints.satisfied(census_coeffs):
                 continue
 
-            try:
-                poly = SR(poly_str)
-                coeffs = poly.coefficients(sparse=False)
-                # Ensure correct length by padding with zeros if needed:
-                coeffs = [0]*(degree + 1 - len(coeffs)) + coeffs
-
-                if coeffs[0] != 1:
-                    # Skip polynomials not ending in 1 (i.e., the constant term ≠ 1)
-                    continue
-
-                # Prepare substitutions for b, c, d, etc.
-                named_coeffs = ['b','c','d','e_coef','f','g','h','i_coef']
-                substitutions = {}
-                for i in range(1, degree + 1):
-                    varname = named_coeffs[degree - i]
-                    substitutions[SR(varname)] = coeffs[i - 1]
-
-                # Compute Vieta-derived expressions:
-                vieta_sum_exprs = calc_vieta_sum(degree)
-                repi = [expr.subs(substitutions).simplify().factor() for expr in vieta_sum_exprs]
-
-                # Count zero terms, compute gcd
-                repi_nonzero = [term for term in repi if term != 0]
-                num_zeros = len(repi) - len(repi_nonzero)
-                gcd_val = str(gcd(repi_nonzero)) if repi_nonzero else "undefined"
-
-                # Discriminant:
-                R = PolynomialRing(QQ, 'x')
-                xR = R.gen()
-                poly_in_R = R(poly.subs(x=xR))
-                discriminant_val = str(poly_in_R.discriminant())
-
-                # Build a polynomial string from the substituted Vieta terms:
-                # If num_terms = q+1, we treat term_0 as coefficient of x^q, etc.
-                poly_terms_list = []
-                for i in range(num_terms):
-                    exponent = num_terms - 1 - i
-                    # i-th Vieta term is the coefficient for x^(q - i)
-                    coeff_str = str(repi[i])
-                    if exponent == 0:
-                        # x^0 term
-                        poly_terms_list.append(f"({coeff_str})")
-                    else:
-                        poly_terms_list.append(f"({coeff_str})*x^{exponent}")
-
-                polynomial_reconstructed_str = " + ".join(poly_terms_list)
-
-                # Prepare row
-                row = {
-                    "polynomial": str(poly),
-                    "polynomial_reconstructed": polynomial_reconstructed_str,
-                    "gcd": gcd_val,
-                    "zero_terms": num_zeros,
-                    "galois_group": galois_group,
-                    "discriminant": discriminant_val,
-                }
-
-                # Fill in term_i columns
-                for i in range(num_terms):
-                    row[f"term_{i}"] = str(repi[i]) if i < len(repi) else ""
-
-                group_writer.writerow(row)
-                combined_writer.writerow(row)
-
-            except Exception:
-                # Skip rows that generate errors
-                continue
+            # Built from the integer coefficients, without a symbolic parse
+            poly = ZX(list(reversed(census_coeffs)) + [1])
+            coeffs = poly.list()
+
+            # Prepare substitutions for b, c, d, etc.
+            named_coeffs = ['b','c','d','e_coef','f','g','h','i_coef']
+            substitutions = {}
+            for i in range(1, degree + 1):
+                varname = named_coeffs[degree - i]
+                substitutions[SR(varname)] = coeffs[i - 1]
+
+            # Compute Vieta-derived expressions:
+            vieta_sum_exprs = calc_vieta_sum(degree)
+            repi = [expr.subs(substitutions).simplify().factor() for expr in vieta_sum_exprs]
+
+            # Count zero terms, compute gcd
+            repi_nonzero = [term for term in repi if term != 0]
+            num_zeros = len(repi) - len(repi_nonzero)
+            gcd_val = str(gcd(repi_nonzero)) if repi_nonzero else "undefined"
+
+            # Discriminant:
+            R = PolynomialRing(QQ, 'x')
+            poly_in_R = R(poly)
+            discriminant_val = str(poly_in_R.discriminant())
+
+            # Build a polynomial string from the substituted Vieta terms:
+            # If num_terms = q+1, we treat term_0 as coefficient of x^q, etc.
+            poly_terms_list = []
+            for i in range(num_terms):
+                exponent = num_terms - 1 - i
+                # i-th Vieta term is the coefficient for x^(q - i)
+                coeff_str = str(repi[i])
+                if exponent == 0:
+                    # x^0 term
+                    poly_terms_list.append(f"({coeff_str})")
+                else:
+                    poly_terms_list.append(f"({coeff_str})*x^{exponent}")
+
+            polynomial_reconstructed_str = " + ".join(poly_terms_list)
+
+            # Prepare row
+            row = {
+                "polynomial": str(poly),
+                "polynomial_reconstructed": polynomial_reconstructed_str,
+                "gcd": gcd_val,
+                "zero_terms": num_zeros,
+                "galois_group": galois_group,
+                "group_id": group_id,
+                "discriminant": discriminant_val,
+            }
+
+            # Fill in term_i columns
+            for i in range(num_terms):
+                row[f"term_{i}"] = str(repi[i]) if i < len(repi) else ""
+
+            group_writer.writerow(row)
+            combined_writer.writerow(row)
+
+        except Exception:
+            # Skip rows that generate errors
+            continue
 
     group_file.close()
     print(f"✅ Processed {filename} → {group_csv}")
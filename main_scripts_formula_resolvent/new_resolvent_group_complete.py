@@ -1,10 +1,12 @@
 #!/usr/bin/env sage -python
 
 from functions_resolvent_calculation import calc_vieta_sum
+from functions_census import census_group_names
+from functions_galois_fast import load_census_group
+from functions_group_ids import census_group_of_file
 from sage.all import *
 import sys
 import csv
-import os
 import pandas as pd
 
 # ------------------------------
@@ -25,30 +27,29 @@ var_list = [f"x{i}" for i in range(max_vars)] + [f"e{i}" for i in range(max_vars
 var(var_list + ["n", "x", "T"])
 var("a b c d e_coef f g h i_coef")
 
+# Integer polynomials built straight from the census coefficient tuples
+ZX = PolynomialRing(ZZ, 'x')
+
 all_rows = []
 max_terms_global = 0
 
 # ------------------------------
 # Process each file in the folder
 # ------------------------------
-for filename in os.listdir(folder):
-    if not filename.endswith(".txt"):
-        continue
-
-    filepath = os.path.join(folder, filename)
-    galois_group = os.path.splitext(filename)[0]
+for filename in census_group_names(folder):
+    galois_group, group_id = census_group_of_file(filename, degree)
 
-    with open(filepath, 'r') as f:
-        polys = [line.strip() for line in f if line.strip()]
+    # Census tuples (a_{deg-1}, ..., a_0); .npy group files are memory-mapped
+    census = load_census_group(folder, filename)
 
     rows = []
     max_terms = 0
 
-    for poly_str in polys:
+    for census_row in census:
         try:
-            poly = SR(poly_str)
-            coeffs = poly.coefficients(sparse=False)
-            coeffs = [0] * (degree + 1 - len(coeffs)) + coeffs
+            # Built from the integer coefficients, without a symbolic parse
+            poly = ZX(list(reversed(census_row.tolist())) + [1])
+            coeffs = poly.list()
 
             if coeffs[0] != 1:
                 continue  # Skip non-monic
@@ -73,8 +74,7 @@ for filename in os.listdir(folder):
 
             # Discriminant
             R = PolynomialRing(QQ, 'x')
-            xR = R.gen()
-            poly_in_R = R(poly.subs(x=xR))
+            poly_in_R = R(poly)
             discriminant_val = str(poly_in_R.discriminant())
 
             # Row entry
@@ -83,6 +83,7 @@ for filename in os.listdir(folder):
                 "gcd": gcd_val,
                 "zero_terms": num_zeros,
                 "galois_group": galois_group,
+                "group_id": group_id,
                 "discriminant": discriminant_val
             }
 
@@ -102,7 +103,7 @@ for filename in os.listdir(folder):
         continue
 
     # Save per-group CSV
-    fieldnames = ["polynomial"] + [f"term_{i}" for i in range(max_terms)] + ["gcd", "zero_terms", "galois_group", "discriminant"]
+    fieldnames = ["polynomial"] + [f"term_{i}" for i in range(max_terms)] + ["gcd", "zero_terms", "galois_group", "group_id", "discriminant"]
     output_csv = f"output_{galois_group}_deg{degree}.csv"
 
     with open(output_csv, 'w', newline='') as csvfile:
@@ -120,7 +121,7 @@ for filename in os.listdir(folder):
 # Combined CSV and Excel export
 # ------------------------------
 if all_rows:
-    combined_fieldnames = ["polynomial"] + [f"term_{i}" for i in range(max_terms_global)] + ["gcd", "zero_terms", "galois_group", "discriminant"]
+    combined_fieldnames = ["polynomial"] + [f"term_{i}" for i in range(max_terms_global)] + ["gcd", "zero_terms", "galois_group", "group_id", "discriminant"]
     combined_csv = f"output_all_deg{degree}.csv"
     combined_xlsx = f"output_all_deg{degree}.xlsx"
 
@@ -1,10 +1,10 @@
 #!/usr/bin/env sage -python
 
 from functions_resolvent_calculation import calc_vieta_sum
+from functions_group_ids import census_group_of_file
 from sage.all import *
 import sys
 import csv
-import os
 
 # ------------------------------
 # Parse arguments
@@ -25,7 +25,7 @@ var(var_list + ["n", "x", "T"])
 var("a b c d e_coef f g h i_coef")
 
 # Infer Galois group from filename
-galois_group = os.path.splitext(os.path.basename(filename))[0]
+galois_group, group_id = census_group_of_file(filename, degree)
 
 # ------------------------------
 # Load polynomials
@@ -67,7 +67,8 @@ for poly_str in polys:
             "polynomial": str(poly),
             "gcd": gcd_val,
             "zero_terms": num_zeros,
-            "galois_group": galois_group
+            "galois_group": galois_group,
+            "group_id": group_id
         }
 
         for i, term in enumerate(repi):
@@ -82,7 +83,7 @@ for poly_str in polys:
 # ------------------------------
 # Prepare CSV headers
 # ------------------------------
-fieldnames = ["polynomial"] + [f"term_{i}" for i in range(max_terms)] + ["gcd", "zero_terms", "galois_group"]
+fieldnames = ["polynomial"] + [f"term_{i}" for i in range(max_terms)] + ["gcd", "zero_terms", "galois_group", "group_id"]
 
 # ------------------------------
 # Write to CSV
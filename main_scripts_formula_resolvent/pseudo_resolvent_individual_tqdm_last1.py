@@ -1,6 +1,11 @@
 #!/usr/bin/env sage -python
 
 from functions_resolvent_calculation import calc_vieta_sum
+from functions_census import (
+    census_group_names, parse_constraints,
+)
+from functions_galois_fast import load_census_group
+from functions_group_ids import census_group_of_file
 from sage.all import *
 import sys
 import csv
@@ -12,11 +17,14 @@ from tqdm import tqdm
 # Parse arguments
 # ------------------------------
 if len(sys.argv) < 3:
-    print("Usage: sage analyze_all_groups_to_csv.sage <folder> <degree>")
+    print("Usage: sage analyze_all_groups_to_csv.sage <folder> <degree> [constraints]")
     sys.exit(1)
 
 folder = sys.argv[1]
 degree = int(sys.argv[2])
+# Coefficient constraints (functions_census.parse_constraints), a0 being the
+# constant term; by default only polynomials ending in 1 are kept
+constraints = parse_constraints([sys.argv[3] if len(sys.argv) > 3 else "a0=1"], degree)
 
 # ------------------------------
 # Get folder info from folder argument and create new output folder
@@ -33,6 +41,9 @@ var_list = [f"x{i}" for i in range(max_vars)] + [f"e{i}" for i in range(max_vars
 var(var_list + ["n", "x", "T"])
 var("a b c d e_coef f g h i_coef")
 
+# Integer polynomials built straight from the census coefficient tuples
+ZX = PolynomialRing(ZZ, 'x')
+
 # ------------------------------
 # Setup CSV Headers based on the fixed number of Vieta terms.
 # We assume calc_vieta_sum(degree) returns a list with fixed length.
@@ -43,7 +54,7 @@ num_terms = len(vieta_terms)
 fieldnames = (
     ["polynomial"]
     + [f"term_{i}" for i in range(num_terms)]
-    + ["gcd", "zero_terms", "galois_group", "discriminant"]
+    + ["gcd", "zero_terms", "galois_group", "group_id", "discriminant"]
 )
 
 # ------------------------------
@@ -57,12 +68,11 @@ combined_writer.writeheader()
 # ------------------------------
 # Process each file in the folder, streaming lines and writing rows immediately
 # ------------------------------
-txt_files = [f for f in os.listdir(folder) if f.endswith(".txt")]
+txt_files = census_group_names(folder)
 
 for filename in tqdm(txt_files, desc="Processing files"):
-    filepath = os.path.join(folder, filename)
     # Only consider the part of the filename before the first equal sign.
-    galois_group = os.path.splitext(filename)[0].split("=")[0].strip()
+    galois_group, group_id = census_group_of_file(filename, degree)
 
     # Open per-group CSV file inside the output folder
     group_csv = os.path.join(output_folder, f"output_last1_{galois_group}_{folder_info}.csv")
@@ -70,65 +80,59 @@ for filename in tqdm(txt_files, desc="Processing files"):
     group_writer = csv.DictWriter(group_file, fieldnames=fieldnames)
     group_writer.writeheader()
 
-    # Count the number of lines in the file for progress reporting.
-    with open(filepath, 'r') as f:
-        total_lines = sum(1 for _ in f)
+    # Census tuples (a_{deg-1}, ..., a_0); .npy group files are memory-mapped
+    census = load_census_group(folder, filename)
 
-    # Reopen the file for processing with a tqdm progress bar.
-    with open(filepath, 'r') as f:
-        for poly_str in tqdm(f, total=total_lines, desc="Polynomials", leave=False):
-            poly_str = poly_str.strip()
-            if not poly_str:
-                continue
-            try:
-                poly = SR(poly_str)
-                coeffs = poly.coefficients(sparse=False)
-                # Ensure correct number of coefficients by padding with zeros:
-                coeffs = [0] * (degree + 1 - len(coeffs)) + coeffs
-
-                if coeffs[0] != 1:
-                    # Skip polynomials not ending in 1.
-                    continue
-
-                # Prepare substitutions for named coefficients:
-                named_coeffs = ['b', 'c', 'd', 'e_coef', 'f', 'g', 'h', 'i_coef']
-                substitutions = {}
-                for i in range(1, degree + 1):
-                    varname = named_coeffs[degree - i]
-                    substitutions[SR(varname)] = coeffs[i-1]
-                # Compute Vieta-derived terms (assumed constant in number for fixed degree)
-                vieta_sum_exprs = calc_vieta_sum(degree)
-                repi = [expr.subs(substitutions).simplify().factor() for expr in vieta_sum_exprs]
-                repi_nonzero = [term for term in repi if term != 0]
-                num_zeros = len(repi) - len(repi_nonzero)
-
-                # Compute GCD and discriminant:
-                gcd_val = str(gcd(repi_nonzero)) if repi_nonzero else "undefined"
-
-                R = PolynomialRing(QQ, 'x')
-                xR = R.gen()
-                poly_in_R = R(poly.subs(x=xR))
-                discriminant_val = str(poly_in_R.discriminant())
-
-                # Build the row with exactly num_terms columns for terms.
-                row = {
-                    "polynomial": str(poly),
-                    "gcd": gcd_val,
-                    "zero_terms": num_zeros,
-                    "galois_group": galois_group,
-                    "discriminant": discriminant_val
-                }
-                for i in range(num_terms):
-                    row[f"term_{i}"] = str(repi[i]) if i < len(repi) else ""
-
-                # Write the row to both the group and the combined CSV files immediately.
-                group_writer.writerow(row)
-                combined_writer.writerow(row)
-
-            except Exception:
-                # Skip rows that generate errors (optionally log the exception).
+    for census_row in tqdm(census, desc="Polynomials", leave=False):
+        census_coeffs = census_row.tolist()
+        try:
+            # Check the constraints on the integer coefficients first
+            if not constraints.satisfied(census_coeffs):
                 continue
 
+            # Built from the integer coefficients, without a symbolic parse
+            poly = ZX(list(reversed(census_coeffs)) + [1])
+            coeffs = poly.list()
+
+            # Prepare substitutions for named coefficients:
+            named_coeffs = ['b', 'c', 'd', 'e_coef', 'f', 'g', 'h', 'i_coef']
+            substitutions = {}
+            for i in range(1, degree + 1):
+                varname = named_coeffs[degree - i]
+                substitutions[SR(varname)] = coeffs[i-1]
+            # Compute Vieta-derived terms (assumed constant in number for fixed degree)
+            vieta_sum_exprs = calc_vieta_sum(degree)
+            repi = [expr.subs(substitutions).simplify().factor() for expr in vieta_sum_exprs]
+            repi_nonzero = [term for term in repi if term != 0]
+            num_zeros = len(repi) - len(repi_nonzero)
+
+            # Compute GCD and discriminant:
+            gcd_val = str(gcd(repi_nonzero)) if repi_nonzero else "undefined"
+
+            R = PolynomialRing(QQ, 'x')
+            poly_in_R = R(poly)
+            discriminant_val = str(poly_in_R.discriminant())
+
+            # Build the row with exactly num_terms columns for terms.
+            row = {
+                "polynomial": str(poly),
+                "gcd": gcd_val,
+                "zero_terms": num_zeros,
+                "galois_group": galois_group,
+                "group_id": group_id,
+                "discriminant": discriminant_val
+            }
+            for i in range(num_terms):
+                row[f"term_{i}"] = str(repi[i]) if i < len(repi) else ""
+
+            # Write the row to both the group and the combined CSV files immediately.
+            group_writer.writerow(row)
+            combined_writer.writerow(row)
+
+        except Exception:
+            # Skip rows that generate errors (optionally log the exception).
+            continue
+
     group_file.close()
     print(f"✅ Processed {filename} → {group_csv}")
 
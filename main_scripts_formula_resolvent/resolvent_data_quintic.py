@@ -0,0 +1,485 @@
+"""
+Generated by generate_quintic_resolvent.py; do not edit.
+
+Polynomials in the quintic coefficients a1, ..., a5 (a_k is the
+coefficient of x^(5-k)) are lists of terms (exponents, coefficient),
+exponents (m1, ..., m5) standing for a1^m1 * ... * a5^m5.
+
+QUINTIC_SEXTIC_RESOLVENT[k - 1] is r_k in R(y) = y^6 + r1 y^5 + ... + r6,
+QUINTIC_DISCRIMINANT[0] is disc(x^5 + a1 x^4 + ... + a5).
+"""
+
+QUINTIC_SEXTIC_RESOLVENT = [
+    [
+        ((1, 0, 1, 0, 0), 16),
+        ((0, 2, 0, 0, 0), -6),
+        ((0, 0, 0, 1, 0), -40),
+    ],
+    [
+        ((3, 0, 0, 0, 1), -128),
+        ((2, 1, 0, 1, 0), 32),
+        ((2, 0, 2, 0, 0), 96),
+        ((1, 2, 1, 0, 0), -80),
+        ((1, 1, 0, 0, 1), 480),
+        ((1, 0, 1, 1, 0), -544),
+        ((0, 4, 0, 0, 0), 15),
+        ((0, 2, 0, 1, 0), 104),
+        ((0, 1, 2, 0, 0), 32),
+        ((0, 0, 1, 0, 1), -800),
+        ((0, 0, 0, 2, 0), 880),
+    ],
+    [
+        ((4, 0, 1, 0, 1), -1024),
+        ((4, 0, 0, 2, 0), -128),
+        ((3, 2, 0, 0, 1), 384),
+        ((3, 1, 1, 1, 0), 384),
+        ((3, 0, 3, 0, 0), 256),
+        ((3, 0, 0, 1, 1), 3328),
+        ((2, 3, 0, 1, 0), -128),
+        ((2, 2, 2, 0, 0), -384),
+        ((2, 1, 1, 0, 1), 3456),
+        ((2, 1, 0, 2, 0), -192),
+        ((2, 0, 2, 1, 0), -2688),
+        ((2, 0, 0, 0, 2), -3200),
+        ((1, 4, 1, 0, 0), 160),
+        ((1, 3, 0, 0, 1), -1344),
+        ((1, 2, 1, 1, 0), 960),
+        ((1, 1, 3, 0, 0), 384),
+        ((1, 1, 0, 1, 1), -10880),
+        ((1, 0, 2, 0, 1), -5120),
+        ((1, 0, 1, 2, 0), 8192),
+        ((0, 6, 0, 0, 0), -20),
+        ((0, 4, 0, 1, 0), -16),
+        ((0, 3, 2, 0, 0), -128),
+        ((0, 2, 1, 0, 1), 2240),
+        ((0, 2, 0, 2, 0), -1472),
+        ((0, 1, 2, 1, 0), -192),
+        ((0, 1, 0, 0, 2), 8000),
+        ((0, 0, 4, 0, 0), -128),
+        ((0, 0, 1, 1, 1), 12800),
+        ((0, 0, 0, 3, 0), -8960),
+    ],
+    [
+        ((6, 0, 0, 0, 2), 4096),
+        ((5, 1, 0, 1, 1), -2048),
+        ((5, 0, 2, 0, 1), -2048),
+        ((5, 0, 1, 2, 0), -1024),
+        ((4, 2, 1, 0, 1), 2048),
+        ((4, 2, 0, 2, 0), 640),
+        ((4, 1, 2, 1, 0), 1536),
+        ((4, 1, 0, 0, 2), -30720),
+        ((4, 0, 4, 0, 0), 256),
+        ((4, 0, 1, 1, 1), 20480),
+        ((4, 0, 0, 3, 0), 2560),
+        ((3, 4, 0, 0, 1), -384),
+        ((3, 3, 1, 1, 0), -1152),
+        ((3, 2, 3, 0, 0), -768),
+        ((3, 2, 0, 1, 1), 6400),
+        ((3, 1, 2, 0, 1), 2560),
+        ((3, 1, 1, 2, 0), -2560),
+        ((3, 0, 3, 1, 0), -5632),
+        ((3, 0, 1, 0, 2), 25600),
+        ((3, 0, 0, 2, 1), -46080),
+        ((2, 5, 0, 1, 0), 192),
+        ((2, 4, 2, 0, 0), 576),
+        ((2, 3, 1, 0, 1), -5760),
+        ((2, 3, 0, 2, 0), -960),
+        ((2, 2, 2, 1, 0), 3456),
+        ((2, 2, 0, 0, 2), 67200),
+        ((2, 1, 4, 0, 0), 1536),
+        ((2, 1, 1, 1, 1), -69120),
+        ((2, 1, 0, 3, 0), -1280),
+        ((2, 0, 3, 0, 1), -2560),
+        ((2, 0, 2, 2, 0), 24320),
+        ((2, 0, 0, 1, 2), 64000),
+        ((1, 6, 1, 0, 0), -160),
+        ((1, 5, 0, 0, 1), 1152),
+        ((1, 4, 1, 1, 0), 384),
+        ((1, 3, 3, 0, 0), -1152),
+        ((1, 3, 0, 1, 1), -1920),
+        ((1, 2, 2, 0, 1), 15360),
+        ((1, 2, 1, 2, 0), -3840),
+        ((1, 1, 3, 1, 0), -2560),
+        ((1, 1, 1, 0, 2), -128000),
+        ((1, 1, 0, 2, 1), 140800),
+        ((1, 0, 5, 0, 0), -1024),
+        ((1, 0, 2, 1, 1), 38400),
+        ((1, 0, 1, 3, 0), -46080),
+        ((0, 8, 0, 0, 0), 15),
+        ((0, 6, 0, 1, 0), -176),
+        ((0, 5, 2, 0, 0), 192),
+        ((0, 4, 1, 0, 1), -1920),
+        ((0, 4, 0, 2, 0), 1440),
+        ((0, 3, 2, 1, 0), -960),
+        ((0, 3, 0, 0, 2), -24000),
+        ((0, 2, 4, 0, 0), 640),
+        ((0, 2, 1, 1, 1), 19200),
+        ((0, 2, 0, 3, 0), 1280),
+        ((0, 1, 3, 0, 1), -12800),
+        ((0, 1, 2, 2, 0), -1280),
+        ((0, 1, 0, 1, 2), -160000),
+        ((0, 0, 4, 1, 0), 2560),
+        ((0, 0, 2, 0, 2), 160000),
+        ((0, 0, 1, 2, 1), -128000),
+        ((0, 0, 0, 4, 0), 44800),
+    ],
+    [
+        ((7, 0, 0, 2, 1), 8192),
+        ((6, 1, 1, 1, 1), -8192),
+        ((6, 1, 0, 3, 0), -2048),
+        ((6, 0, 2, 2, 0), -2048),
+        ((6, 0, 0, 1, 2), -49152),
+        ((5, 3, 0, 1, 1), 2048),
+        ((5, 2, 2, 0, 1), 2048),
+        ((5, 2, 1, 2, 0), 4096),
+        ((5, 1, 3, 1, 0), 2048),
+        ((5, 1, 1, 0, 2), 24576),
+        ((5, 1, 0, 2, 1), -47104),
+        ((5, 0, 2, 1, 1), 28672),
+        ((5, 0, 1, 3, 0), 14336),
+        ((5, 0, 0, 0, 3), -57344),
+        ((4, 4, 1, 0, 1), -1024),
+        ((4, 4, 0, 2, 0), -896),
+        ((4, 3, 2, 1, 0), -3072),
+        ((4, 3, 0, 0, 2), -6144),
+        ((4, 2, 4, 0, 0), -512),
+        ((4, 2, 1, 1, 1), 26624),
+        ((4, 2, 0, 3, 0), 8192),
+        ((4, 1, 3, 0, 1), -14336),
+        ((4, 1, 2, 2, 0), -13312),
+        ((4, 1, 0, 1, 2), 411648),
+        ((4, 0, 4, 1, 0), -4096),
+        ((4, 0, 2, 0, 2), -2048),
+        ((4, 0, 1, 2, 1), -174080),
+        ((4, 0, 0, 4, 0), -3072),
+        ((3, 6, 0, 0, 1), 128),
+        ((3, 5, 1, 1, 0), 1152),
+        ((3, 4, 3, 0, 0), 768),
+        ((3, 4, 0, 1, 1), -7424),
+        ((3, 3, 2, 0, 1), 2048),
+        ((3, 3, 1, 2, 0), -8192),
+        ((3, 2, 3, 1, 0), 8192),
+        ((3, 2, 1, 0, 2), -178176),
+        ((3, 2, 0, 2, 1), 109568),
+        ((3, 1, 5, 0, 0), 2048),
+        ((3, 1, 2, 1, 1), -4096),
+        ((3, 1, 1, 3, 0), -39936),
+        ((3, 1, 0, 0, 3), 358400),
+        ((3, 0, 4, 0, 1), 12288),
+        ((3, 0, 3, 2, 0), 30720),
+        ((3, 0, 1, 1, 2), 92160),
+        ((3, 0, 0, 3, 1), 180224),
+        ((2, 7, 0, 1, 0), -128),
+        ((2, 6, 2, 0, 0), -384),
+        ((2, 5, 1, 0, 1), 1152),
+        ((2, 5, 0, 2, 0), 2496),
+        ((2, 4, 2, 1, 0), 1152),
+        ((2, 4, 0, 0, 2), 41088),
+        ((2, 3, 4, 0, 0), -3072),
+        ((2, 3, 1, 1, 1), -49152),
+        ((2, 3, 0, 3, 0), -12800),
+        ((2, 2, 3, 0, 1), 18432),
+        ((2, 2, 2, 2, 0), 29184),
+        ((2, 2, 0, 1, 2), -1198080),
+        ((2, 1, 4, 1, 0), -13312),
+        ((2, 1, 2, 0, 2), -35840),
+        ((2, 1, 1, 2, 1), 553984),
+        ((2, 1, 0, 4, 0), -29696),
+        ((2, 0, 6, 0, 0), -2048),
+        ((2, 0, 3, 1, 1), -116736),
+        ((2, 0, 2, 3, 0), -30720),
+        ((2, 0, 1, 0, 3), -768000),
+        ((2, 0, 0, 2, 2), -716800),
+        ((1, 8, 1, 0, 0), 80),
+        ((1, 7, 0, 0, 1), -192),
+        ((1, 6, 1, 1, 0), -1472),
+        ((1, 5, 3, 0, 0), 1152),
+        ((1, 5, 0, 1, 1), 8832),
+        ((1, 4, 2, 0, 1), -6144),
+        ((1, 4, 1, 2, 0), 4608),
+        ((1, 3, 3, 1, 0), -8192),
+        ((1, 3, 1, 0, 2), 440320),
+        ((1, 3, 0, 2, 1), -75776),
+        ((1, 2, 5, 0, 0), 4096),
+        ((1, 2, 2, 1, 1), -129024),
+        ((1, 2, 1, 3, 0), 58368),
+        ((1, 2, 0, 0, 3), -384000),
+        ((1, 1, 4, 0, 1), 12288),
+        ((1, 1, 3, 2, 0), -39936),
+        ((1, 1, 1, 1, 2), 947200),
+        ((1, 1, 0, 3, 1), -317440),
+        ((1, 0, 5, 1, 0), 14336),
+        ((1, 0, 3, 0, 2), 409600),
+        ((1, 0, 2, 2, 1), -327680),
+        ((1, 0, 1, 4, 0), 94208),
+        ((1, 0, 0, 1, 3), 2560000),
+        ((0, 10, 0, 0, 0), -6),
+        ((0, 8, 0, 1, 0), 184),
+        ((0, 7, 2, 0, 0), -128),
+        ((0, 6, 1, 0, 1), 320),
+        ((0, 6, 0, 2, 0), -1984),
+        ((0, 5, 2, 1, 0), 2496),
+        ((0, 5, 0, 0, 2), -86592),
+        ((0, 4, 4, 0, 0), -896),
+        ((0, 4, 1, 1, 1), 43008),
+        ((0, 4, 0, 3, 0), 1792),
+        ((0, 3, 3, 0, 1), -6144),
+        ((0, 3, 2, 2, 0), -12800),
+        ((0, 3, 0, 1, 2), 857600),
+        ((0, 2, 4, 1, 0), 8192),
+        ((0, 2, 2, 0, 2), -652800),
+        ((0, 2, 1, 2, 1), -445440),
+        ((0, 2, 0, 4, 0), 41472),
+        ((0, 1, 6, 0, 0), -2048),
+        ((0, 1, 3, 1, 1), 414720),
+        ((0, 1, 2, 3, 0), -29696),
+        ((0, 1, 1, 0, 3), 640000),
+        ((0, 1, 0, 2, 2), -128000),
+        ((0, 0, 5, 0, 1), -59392),
+        ((0, 0, 4, 2, 0), -3072),
+        ((0, 0, 2, 1, 2), -1024000),
+        ((0, 0, 1, 3, 1), 614400),
+        ((0, 0, 0, 5, 0), -108544),
+        ((0, 0, 0, 0, 4), -3200000),
+    ],
+    [
+        ((8, 0, 0, 4, 0), 4096),
+        ((7, 1, 1, 3, 0), -8192),
+        ((7, 0, 0, 3, 1), -49152),
+        ((6, 3, 0, 3, 0), 2048),
+        ((6, 2, 2, 2, 0), 6144),
+        ((6, 1, 1, 2, 1), 73728),
+        ((6, 1, 0, 4, 0), -28672),
+        ((6, 0, 2, 3, 0), 16384),
+        ((6, 0, 0, 2, 2), 352256),
+        ((5, 4, 1, 2, 0), -3072),
+        ((5, 3, 3, 1, 0), -2048),
+        ((5, 3, 0, 2, 1), -18432),
+        ((5, 2, 2, 1, 1), -36864),
+        ((5, 2, 1, 3, 0), 43008),
+        ((5, 1, 3, 2, 0), -24576),
+        ((5, 1, 1, 1, 2), -352256),
+        ((5, 1, 0, 3, 1), 253952),
+        ((5, 0, 2, 2, 1), -180224),
+        ((5, 0, 1, 4, 0), 8192),
+        ((5, 0, 0, 1, 3), -1228800),
+        ((4, 6, 0, 2, 0), 384),
+        ((4, 5, 2, 1, 0), 1536),
+        ((4, 4, 4, 0, 0), 256),
+        ((4, 4, 1, 1, 1), 18432),
+        ((4, 4, 0, 3, 0), -10752),
+        ((4, 3, 3, 0, 1), 6144),
+        ((4, 3, 2, 2, 0), -15360),
+        ((4, 3, 0, 1, 2), 88064),
+        ((4, 2, 4, 1, 0), 12288),
+        ((4, 2, 2, 0, 2), 88064),
+        ((4, 2, 1, 2, 1), -243712),
+        ((4, 2, 0, 4, 0), 72704),
+        ((4, 1, 3, 1, 1), 180224),
+        ((4, 1, 2, 3, 0), -94208),
+        ((4, 1, 1, 0, 3), 614400),
+        ((4, 1, 0, 2, 2), -1720320),
+        ((4, 0, 4, 2, 0), 24576),
+        ((4, 0, 2, 1, 2), 901120),
+        ((4, 0, 1, 3, 1), 155648),
+        ((4, 0, 0, 5, 0), -40960),
+        ((4, 0, 0, 0, 4), 2560000),
+        ((3, 7, 1, 1, 0), -384),
+        ((3, 6, 3, 0, 0), -256),
+        ((3, 6, 0, 1, 1), -2304),
+        ((3, 5, 2, 0, 1), -4608),
+        ((3, 5, 1, 2, 0), 10752),
+        ((3, 4, 3, 1, 0), -2560),
+        ((3, 4, 1, 0, 2), -44032),
+        ((3, 4, 0, 2, 1), 63488),
+        ((3, 3, 5, 0, 0), -2048),
+        ((3, 3, 2, 1, 1), 8192),
+        ((3, 3, 1, 3, 0), -70656),
+        ((3, 3, 0, 0, 3), -153600),
+        ((3, 2, 4, 0, 1), -45056),
+        ((3, 2, 3, 2, 0), 88064),
+        ((3, 2, 1, 1, 2), 1054720),
+        ((3, 2, 0, 3, 1), -421888),
+        ((3, 1, 5, 1, 0), -24576),
+        ((3, 1, 3, 0, 2), -450560),
+        ((3, 1, 2, 2, 1), 442368),
+        ((3, 1, 1, 4, 0), 12288),
+        ((3, 1, 0, 1, 3), 5120000),
+        ((3, 0, 4, 1, 1), -212992),
+        ((3, 0, 3, 3, 0), 16384),
+        ((3, 0, 2, 0, 3), -2048000),
+        ((3, 0, 1, 2, 2), -1024000),
+        ((3, 0, 0, 4, 1), 245760),
+        ((2, 9, 0, 1, 0), 32),
+        ((2, 8, 2, 0, 0), 96),
+        ((2, 7, 1, 0, 1), 1152),
+        ((2, 7, 0, 2, 0), -1344),
+        ((2, 6, 2, 1, 0), -1920),
+        ((2, 6, 0, 0, 2), 5504),
+        ((2, 5, 4, 0, 0), 1536),
+        ((2, 5, 1, 1, 1), -29184),
+        ((2, 5, 0, 3, 0), 18176),
+        ((2, 4, 3, 0, 1), 25088),
+        ((2, 4, 2, 2, 0), -4352),
+        ((2, 4, 0, 1, 2), -279040),
+        ((2, 3, 4, 1, 0), -15360),
+        ((2, 3, 2, 0, 2), 15360),
+        ((2, 3, 1, 2, 1), 220160),
+        ((2, 3, 0, 4, 0), -89088),
+        ((2, 2, 6, 0, 0), 6144),
+        ((2, 2, 3, 1, 1), -239616),
+        ((2, 2, 2, 3, 0), 149504),
+        ((2, 2, 1, 0, 3), -1280000),
+        ((2, 2, 0, 2, 2), 2764800),
+        ((2, 1, 5, 0, 1), 106496),
+        ((2, 1, 4, 2, 0), -94208),
+        ((2, 1, 2, 1, 2), -1945600),
+        ((2, 1, 1, 3, 1), -757760),
+        ((2, 1, 0, 5, 0), 143360),
+        ((2, 1, 0, 0, 4), -12800000),
+        ((2, 0, 6, 1, 0), 16384),
+        ((2, 0, 4, 0, 2), 614400),
+        ((2, 0, 3, 2, 1), 327680),
+        ((2, 0, 2, 4, 0), -77824),
+        ((2, 0, 1, 1, 3), 5120000),
+        ((2, 0, 0, 3, 2), -1024000),
+        ((1, 10, 1, 0, 0), -16),
+        ((1, 9, 0, 0, 1), -96),
+        ((1, 8, 1, 1, 0), 672),
+        ((1, 7, 3, 0, 0), -384),
+        ((1, 7, 0, 1, 1), 3968),
+        ((1, 6, 2, 0, 1), -4096),
+        ((1, 6, 1, 2, 0), -8960),
+        ((1, 5, 3, 1, 0), 10752),
+        ((1, 5, 1, 0, 2), 56320),
+        ((1, 5, 0, 2, 1), -52736),
+        ((1, 4, 5, 0, 0), -3072),
+        ((1, 4, 2, 1, 1), 70144),
+        ((1, 4, 1, 3, 0), 40960),
+        ((1, 4, 0, 0, 3), 384000),
+        ((1, 3, 4, 0, 1), -36864),
+        ((1, 3, 3, 2, 0), -70656),
+        ((1, 3, 1, 1, 2), -947200),
+        ((1, 3, 0, 3, 1), 256000),
+        ((1, 2, 5, 1, 0), 43008),
+        ((1, 2, 3, 0, 2), 409600),
+        ((1, 2, 2, 2, 1), -143360),
+        ((1, 2, 1, 4, 0), -49152),
+        ((1, 2, 0, 1, 3), -5120000),
+        ((1, 1, 7, 0, 0), -8192),
+        ((1, 1, 4, 1, 1), 163840),
+        ((1, 1, 3, 3, 0), 12288),
+        ((1, 1, 2, 0, 3), 5120000),
+        ((1, 1, 1, 2, 2), 1536000),
+        ((1, 1, 0, 4, 1), -409600),
+        ((1, 0, 6, 0, 1), -81920),
+        ((1, 0, 5, 2, 0), 8192),
+        ((1, 0, 3, 1, 2), -2048000),
+        ((1, 0, 2, 3, 1), 614400),
+        ((1, 0, 1, 5, 0), -40960),
+        ((0, 12, 0, 0, 0), 1),
+        ((0, 10, 0, 1, 0), -56),
+        ((0, 9, 2, 0, 0), 32),
+        ((0, 8, 1, 0, 1), 160),
+        ((0, 8, 0, 2, 0), 1136),
+        ((0, 7, 2, 1, 0), -1344),
+        ((0, 7, 0, 0, 2), -8000),
+        ((0, 6, 4, 0, 0), 384),
+        ((0, 6, 1, 1, 1), -1280),
+        ((0, 6, 0, 3, 0), -10496),
+        ((0, 5, 3, 0, 1), 2560),
+        ((0, 5, 2, 2, 0), 18176),
+        ((0, 5, 0, 1, 2), 224000),
+        ((0, 4, 4, 1, 0), -10752),
+        ((0, 4, 2, 0, 2), -121600),
+        ((0, 4, 1, 2, 1), -61440),
+        ((0, 4, 0, 4, 0), 48896),
+        ((0, 3, 6, 0, 0), 2048),
+        ((0, 3, 3, 1, 1), 15360),
+        ((0, 3, 2, 3, 0), -89088),
+        ((0, 3, 1, 0, 3), -640000),
+        ((0, 3, 0, 2, 2), -1408000),
+        ((0, 2, 5, 0, 1), 10240),
+        ((0, 2, 4, 2, 0), 72704),
+        ((0, 2, 2, 1, 2), 2048000),
+        ((0, 2, 1, 3, 1), 512000),
+        ((0, 2, 0, 5, 0), -112640),
+        ((0, 2, 0, 0, 4), 16000000),
+        ((0, 1, 6, 1, 0), -28672),
+        ((0, 1, 4, 0, 2), -512000),
+        ((0, 1, 3, 2, 1), -716800),
+        ((0, 1, 2, 4, 0), 143360),
+        ((0, 1, 1, 1, 3), -12800000),
+        ((0, 1, 0, 3, 2), 2560000),
+        ((0, 0, 8, 0, 0), 4096),
+        ((0, 0, 5, 1, 1), 204800),
+        ((0, 0, 4, 3, 0), -40960),
+        ((0, 0, 2, 2, 2), 2560000),
+        ((0, 0, 1, 4, 1), -1024000),
+        ((0, 0, 0, 6, 0), 102400),
+    ],
+]
+
+QUINTIC_DISCRIMINANT = [
+    [
+        ((5, 0, 0, 0, 3), 256),
+        ((4, 1, 0, 1, 2), -192),
+        ((4, 0, 2, 0, 2), -128),
+        ((4, 0, 1, 2, 1), 144),
+        ((4, 0, 0, 4, 0), -27),
+        ((3, 2, 1, 0, 2), 144),
+        ((3, 2, 0, 2, 1), -6),
+        ((3, 1, 2, 1, 1), -80),
+        ((3, 1, 1, 3, 0), 18),
+        ((3, 1, 0, 0, 3), -1600),
+        ((3, 0, 4, 0, 1), 16),
+        ((3, 0, 3, 2, 0), -4),
+        ((3, 0, 1, 1, 2), 160),
+        ((3, 0, 0, 3, 1), -36),
+        ((2, 4, 0, 0, 2), -27),
+        ((2, 3, 1, 1, 1), 18),
+        ((2, 3, 0, 3, 0), -4),
+        ((2, 2, 3, 0, 1), -4),
+        ((2, 2, 2, 2, 0), 1),
+        ((2, 2, 0, 1, 2), 1020),
+        ((2, 1, 2, 0, 2), 560),
+        ((2, 1, 1, 2, 1), -746),
+        ((2, 1, 0, 4, 0), 144),
+        ((2, 0, 3, 1, 1), 24),
+        ((2, 0, 2, 3, 0), -6),
+        ((2, 0, 1, 0, 3), 2000),
+        ((2, 0, 0, 2, 2), -50),
+        ((1, 3, 1, 0, 2), -630),
+        ((1, 3, 0, 2, 1), 24),
+        ((1, 2, 2, 1, 1), 356),
+        ((1, 2, 1, 3, 0), -80),
+        ((1, 2, 0, 0, 3), 2250),
+        ((1, 1, 4, 0, 1), -72),
+        ((1, 1, 3, 2, 0), 18),
+        ((1, 1, 1, 1, 2), -2050),
+        ((1, 1, 0, 3, 1), 160),
+        ((1, 0, 3, 0, 2), -900),
+        ((1, 0, 2, 2, 1), 1020),
+        ((1, 0, 1, 4, 0), -192),
+        ((1, 0, 0, 1, 3), -2500),
+        ((0, 5, 0, 0, 2), 108),
+        ((0, 4, 1, 1, 1), -72),
+        ((0, 4, 0, 3, 0), 16),
+        ((0, 3, 3, 0, 1), 16),
+        ((0, 3, 2, 2, 0), -4),
+        ((0, 3, 0, 1, 2), -900),
+        ((0, 2, 2, 0, 2), 825),
+        ((0, 2, 1, 2, 1), 560),
+        ((0, 2, 0, 4, 0), -128),
+        ((0, 1, 3, 1, 1), -630),
+        ((0, 1, 2, 3, 0), 144),
+        ((0, 1, 1, 0, 3), -3750),
+        ((0, 1, 0, 2, 2), 2000),
+        ((0, 0, 5, 0, 1), 108),
+        ((0, 0, 4, 2, 0), -27),
+        ((0, 0, 2, 1, 2), 2250),
+        ((0, 0, 1, 3, 1), -1600),
+        ((0, 0, 0, 5, 0), 256),
+        ((0, 0, 0, 0, 4), 3125),
+    ],
+]
@@ -1,39 +1,286 @@
 #!/usr/bin/env sage -python
 
+"""
+Verify the Galois groups of census group files in parallel.
+
+    sage -python verification.py galois_deg5_range25
+    sage -python verification.py galois_deg5_range25 --sample 0.01 --seed 7
+    sage -python verification.py "galois_deg4_range15/C(4) = 4.txt"
+
+Every group file of the given census directories (including linked base
+censuses and binary .npy files) and every file given directly is split
+into chunks of lines that a pool of workers labels with PARI (or, with
+--cache, the persistent label cache). The expected group of a file comes
+from its name through the census normalisation (functions_group_ids), so
+"C(4).txt" and PARI's "C(4) = 4" are the same group 4T1.
+
+--sample FRACTION only checks a seeded random fraction of the lines of
+each file. Polynomials over the --timeout budget are quarantined and
+retried at low priority at the end (functions_quarantine). Mismatches,
+errors and polynomials still over budget are written one JSON object per
+line to the report, and the counts per file to the summary.
+"""
+
 import sys
 import os
+import json
+import time
+import random
+import argparse
+from multiprocessing import cpu_count
 from sage.all import PolynomialRing, QQ
 
-# Check filename
-if len(sys.argv) < 2:
-    print("Usage: sage verify_galois.py <filename>")
-    sys.exit(1)
+from functions_census import census_group_names, open_census_group
+from functions_label_cache import DEFAULT_CACHE_PATH, open_label_cache, census_coeffs
+from functions_group_ids import census_group_of_file, try_normalize_group, group_code, short_label
+from functions_quarantine import (
+    ITEM_TIMEOUT, RETRY_TIMEOUT, ItemTimeout, time_limit, quarantine_entry, write_quarantine,
+    retried_entry, lower_priority,
+)
+from functions_worker_pool import RecyclingPool
 
-filename = sys.argv[1]
-expected_group = os.path.splitext(os.path.basename(filename))[0]
+CHUNK_SIZE = 256       # Lines verified by one task
+STATUSES = ("matched", "mismatched", "errors", "timeouts")
 
-# Set up polynomial ring
-R = PolynomialRing(QQ, 'x')
-x = R.gen()
+# Worker globals (set once per worker process by init_worker)
+R = None               # PolynomialRing(QQ, 'x')
+LABEL_CACHE = None     # Read-only persistent label cache
+TIMEOUT = None         # Budget of one Galois computation in seconds (None: no limit)
 
-print(f"Verifying Galois groups in file: {filename} (Expected: {expected_group})\n")
 
-with open(filename, 'r') as file:
-    for line_num, line in enumerate(file, start=1):
-        poly_str = line.strip()
-        if not poly_str:
-            continue
+def parse_arguments():
+    """
+    Parse command line arguments:
+       paths -> census directories and/or group files to verify
+       --sample FRACTION -> verify a random FRACTION of the lines of every
+                 file, chosen by --seed (default: every line)
+       --processes N -> worker processes (default: one per core)
+       --cache PATH -> take labels found in this persistent label cache
+                 instead of recomputing them (default: recompute every line,
+                 so a wrong cached label is caught)
+       --timeout SECONDS -> budget of one Galois computation (default 300,
+                 0 for none); polynomials over budget are quarantined
+       --retry-timeout SECONDS -> budget of the low-priority retry pass over
+                 the quarantined polynomials (default 3600, 0 for none)
+       --quarantine PATH -> polynomials still over budget after the retry
+       --report PATH -> JSON lines of the mismatches, errors and timeouts
+       --summary PATH -> JSON counts per file and in total
+       --verbose -> print every problem as it is found
+    """
+    parser = argparse.ArgumentParser(description="Verify the Galois groups of census files.")
+    parser.add_argument("paths", nargs="+", help="census directories or group files")
+    parser.add_argument("--sample", type=float, default=None, metavar="FRACTION",
+                        help="verify a random fraction of the lines of each file")
+    parser.add_argument("--seed", type=int, default=0, help="seed of --sample")
+    parser.add_argument("--processes", type=int, default=0,
+                        help="worker processes (0: one per core)")
+    parser.add_argument("--cache", default=None, metavar="PATH",
+                        help=f"trust the labels of a label cache (e.g. {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--no-cache", dest="cache", action="store_const", const=None,
+                        help="recompute every label (the default)")
+    parser.add_argument("--timeout", type=float, default=ITEM_TIMEOUT, metavar="SECONDS")
+    parser.add_argument("--retry-timeout", type=float, default=RETRY_TIMEOUT, metavar="SECONDS")
+    parser.add_argument("--quarantine", default="verification_quarantine.jsonl", metavar="PATH")
+    parser.add_argument("--report", default="verification_report.jsonl", metavar="PATH")
+    parser.add_argument("--summary", default="verification_summary.json", metavar="PATH")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(sys.argv[1:])
+    if args.sample is not None and not 0 < args.sample <= 1:
+        parser.error("--sample takes a fraction in (0, 1]")
+    return args
 
-        try:
-            # Convert string to polynomial
-            f = R(poly_str)
+def group_sources(paths):
+    """(census directory, group file name) of every file to verify."""
+    for path in paths:
+        if os.path.isdir(path):
+            for name in census_group_names(path):
+                yield path, name
+        else:
+            yield os.path.dirname(path) or ".", os.path.basename(path)
+
+def sampled_lines(directory, name, fraction, seed):
+    """(line number, polynomial string) of a group file, or of a seeded sample of it."""
+    sampler = random.Random(f"{seed}:{name}")
+    with open_census_group(directory, name) as reader:
+        for line_num, line in enumerate(reader, start=1):
+            poly_str = line.strip()
+            if poly_str and (fraction is None or sampler.random() < fraction):
+                yield line_num, poly_str
 
-            # Compute Galois group
-            G = f.galois_group(pari_group=True)
-            actual_group = G.label()
+def verification_chunks(args):
+    """Tasks of the main pass: (file, [(line number, polynomial string)]) chunks."""
+    for directory, name in group_sources(args.paths):
+        source = os.path.join(directory, name)
+        lines = []
+        for item in sampled_lines(directory, name, args.sample, args.seed):
+            lines.append(item)
+            if len(lines) >= CHUNK_SIZE:
+                yield source, lines
+                lines = []
+        if lines:
+            yield source, lines
 
-            status = "✓" if actual_group == expected_group else f"✗ (Got: {actual_group})"
-            print(f"[Line {line_num}] {f}    →    {actual_group} {status}")
+def init_worker(options):
+    """Build the polynomial ring once per worker and open the label cache read-only."""
+    global R, LABEL_CACHE, TIMEOUT
+    R = PolynomialRing(QQ, 'x')
+    LABEL_CACHE = open_label_cache(options["cache"], readonly=True)
+    TIMEOUT = options["timeout"]
+
+def init_retry_worker(options):
+    """init_worker for the retry pass, at the lowest CPU priority."""
+    lower_priority()
+    init_worker(options)
+
+def group_matches(actual_group, deg, expected_group, expected_id):
+    """(matches, actual id): compare transitive group ids, else short labels."""
+    actual_id = try_normalize_group(actual_group, deg)
+    if expected_id is not None and actual_id is not None:
+        return actual_id == expected_id, actual_id
+    return short_label(actual_group) == expected_group, actual_id
+
+def verify_chunk(chunk):
+    """
+    Worker function: label the polynomials of a chunk (cache first, then
+    PARI within TIMEOUT seconds each) and compare them with the group of
+    the file. Returns (source, counts, problems, quarantined, new_labels)
+    with the counts per status, the report rows of the mismatches and
+    errors, the quarantine entries of the polynomials over budget and the
+    (coeffs, label) pairs PARI computed for the label cache.
+    """
+    source, lines = chunk
+    counts = dict.fromkeys(STATUSES, 0)
+    problems, quarantined, new_labels = [], [], []
+
+    polynomials = []
+    for line_num, poly_str in lines:
+        try:
+            polynomials.append((line_num, poly_str, R(poly_str)))
+        except Exception as e:
+            counts["errors"] += 1
+            problems.append({"file": source, "line": line_num, "polynomial": poly_str,
+                             "status": "error", "error": str(e)})
+    keys = {line_num: census_coeffs(f.list()) for line_num, _, f in polynomials}
+    cached = LABEL_CACHE.get_many([key for key in keys.values() if key is not None])
 
+    for line_num, poly_str, f in polynomials:
+        expected_group, expected_id = census_group_of_file(source, f.degree())
+        row = {"file": source, "line": line_num, "polynomial": poly_str,
+               "expected": expected_group, "expected_id": expected_id}
+        started = time.perf_counter()
+        try:
+            actual_group = cached.get(keys[line_num])
+            if actual_group is None:
+                with time_limit(TIMEOUT):
+                    actual_group = str(f.galois_group(pari_group=True).label())
+                if keys[line_num] is not None:
+                    new_labels.append((keys[line_num], actual_group))
+        except ItemTimeout:
+            counts["timeouts"] += 1
+            quarantined.append(quarantine_entry(
+                keys[line_num], poly_str, "galois", TIMEOUT, time.perf_counter() - started,
+                file=source, line=line_num))
+            continue
         except Exception as e:
-            print(f"[Line {line_num}] Error with '{poly_str}': {e}")
+            counts["errors"] += 1
+            problems.append(dict(row, status="error", error=str(e)))
+            continue
+
+        matches, actual_id = group_matches(actual_group, f.degree(), expected_group, expected_id)
+        if matches:
+            counts["matched"] += 1
+        else:
+            counts["mismatched"] += 1
+            problems.append(dict(row, status="mismatch", actual=actual_group, actual_id=actual_id,
+                                 seconds=round(time.perf_counter() - started, 3)))
+    return source, counts, problems, quarantined, new_labels
+
+def print_problem(row):
+    if row["status"] == "mismatch":
+        code = f" [{group_code(row['actual_id'])}]" if row["actual_id"] is not None else ""
+        print(f"[{row['file']}:{row['line']}] {row['polynomial']}    →    "
+              f"{row['actual']}{code} ✗ (expected {row['expected']})")
+    elif row["status"] == "error":
+        print(f"[{row['file']}:{row['line']}] Error with '{row['polynomial']}': {row['error']}")
+    else:
+        print(f"[{row['file']}:{row['line']}] {row['polynomial']}    →    over the time budget")
+
+def run_pass(pool, chunks, label_cache, summary, report, verbose):
+    """Verify chunks with the pool; returns the quarantine entries."""
+    quarantined = []
+    for source, counts, problems, entries, new_labels in pool.imap_unordered(verify_chunk, chunks):
+        totals = summary.setdefault(source, dict.fromkeys(STATUSES, 0))
+        for status, count in counts.items():
+            totals[status] += count
+        for row in problems:
+            report.write(json.dumps(row) + "\n")
+            if verbose:
+                print_problem(row)
+        quarantined.extend(entries)
+        label_cache.add_many(new_labels)
+    return quarantined
+
+def main():
+    args = parse_arguments()
+    started = time.monotonic()
+    num_procs = args.processes or cpu_count()
+    print(f"Verifying {', '.join(args.paths)} with {num_procs} processes"
+          + (f" (sample of {100 * args.sample:g}% of the lines, seed {args.seed})"
+             if args.sample is not None else "") + "...")
+
+    # The label cache exists before the workers open it read-only; only
+    # this process writes the labels they compute
+    label_cache = open_label_cache(args.cache)
+    options = {"cache": args.cache, "timeout": args.timeout or None}
+    summary = {}
+    with label_cache, open(args.report, 'w') as report:
+        with RecyclingPool(num_procs, init_worker, (options,)) as pool:
+            quarantined = run_pass(pool, verification_chunks(args), label_cache, summary,
+                                   report, args.verbose)
+
+        # Low-priority retry pass over the polynomials that ran out of time
+        remaining = []
+        if quarantined:
+            print(f"Retrying {len(quarantined)} quarantined polynomials with a budget of "
+                  f"{args.retry_timeout:g}s each at low priority...")
+            for entry in quarantined:
+                summary[entry["file"]]["timeouts"] -= 1
+            retry_options = dict(options, timeout=args.retry_timeout or None)
+            chunks = [(entry["file"], [(entry["line"], entry["polynomial"])])
+                      for entry in quarantined]
+            with RecyclingPool(min(num_procs, len(chunks)), init_retry_worker,
+                               (retry_options,)) as pool:
+                still = run_pass(pool, chunks, label_cache, summary, report, args.verbose)
+            budgets = {(entry["file"], entry["line"]): entry for entry in quarantined}
+            for entry in still:
+                remaining.append(retried_entry(budgets[(entry["file"], entry["line"])],
+                                               entry["elapsed"], args.retry_timeout))
+                report.write(json.dumps(dict(entry, status="timeout")) + "\n")
+                if args.verbose:
+                    print_problem(dict(entry, status="timeout"))
+        write_quarantine(args.quarantine, remaining)
+
+    totals = dict.fromkeys(STATUSES, 0)
+    for counts in summary.values():
+        for status in STATUSES:
+            totals[status] += counts[status]
+    with open(args.summary, 'w') as f:
+        json.dump({"paths": args.paths, "sample": args.sample, "seed": args.seed,
+                   "seconds": round(time.monotonic() - started, 3), "total": totals,
+                   "files": dict(sorted(summary.items()))}, f, indent=1)
+
+    for source, counts in sorted(summary.items()):
+        checked = sum(counts.values())
+        flag = "✓" if checked == counts["matched"] else "✗"
+        print(f"{flag} {source}: {counts['matched']}/{checked} matched, "
+              f"{counts['mismatched']} mismatched, {counts['errors']} errors, "
+              f"{counts['timeouts']} over budget")
+    print(f"Total: {totals['matched']} matched, {totals['mismatched']} mismatched, "
+          f"{totals['errors']} errors, {totals['timeouts']} over budget in "
+          f"{time.monotonic() - started:.0f}s; report in '{args.report}', "
+          f"summary in '{args.summary}'"
+          + (f", quarantine in '{args.quarantine}'." if remaining else "."))
+
+
+if __name__ == "__main__":
+    main()